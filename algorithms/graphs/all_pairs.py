@@ -0,0 +1,121 @@
+import os
+from array import array
+from concurrent.futures.process import BrokenProcessPool
+from math import inf
+from multiprocessing import shared_memory
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from algorithms.graphs.csr import CSRGraph
+from algorithms.graphs.dijkstra import dijkstra_csr
+from algorithms.process_pools import drop_pool, get_pool
+
+# Floyd-Warshall is O(n^3) time and O(n^2) memory: only small graphs qualify
+DENSE_MAX_NODES = 256
+# below this many (sources * edges) a process pool costs more than it saves
+PARALLEL_MIN_WORK = 1_000_000
+
+
+def floyd_warshall_csr(g: CSRGraph) -> List[array]:
+    """
+    All-pairs shortest paths over a CSRGraph as a list of distance rows.
+    Each step relaxes a whole row against row k in one comprehension over
+    zip(), with no per-cell indexing.
+    """
+    n = g.num_nodes
+    offsets, targets, weights = g.offsets, g.targets, g.weights
+    rows = []
+    for u in range(n):
+        row = [inf] * n
+        row[u] = 0.0
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            if weights[i] < row[v]:
+                row[v] = weights[i]
+        rows.append(row)
+    for k in range(n):
+        row_k = rows[k]
+        for u in range(n):
+            row_u = rows[u]
+            d = row_u[k]
+            if d != inf and u != k:
+                rows[u] = [a if a <= d + b else d + b for a, b in zip(row_u, row_k)]
+    return [array("d", row) for row in rows]
+
+
+def _rows(shm_name: str, n: int, m: int, sources: Sequence[int]) -> List[bytes]:
+    """Worker: distance rows from `sources`, on a view of the shared CSR arrays (no copy)."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    offsets = buf[:8 * (n + 1)].cast("q")
+    targets = buf[8 * (n + 1):8 * (n + 1 + m)].cast("q")
+    weights = buf[8 * (n + 1 + m):8 * (n + 1 + 2 * m)].cast("d")
+    try:
+        g = CSRGraph(range(n), offsets, targets, weights, index={})
+        return [dijkstra_csr(g, s).tobytes() for s in sources]
+    finally:
+        # the block can only be closed once no view of it is left
+        for view in (offsets, targets, weights, buf):
+            view.release()
+        shm.close()
+
+
+def _use_floyd_warshall(g: CSRGraph, num_sources: int) -> bool:
+    # measured break-even: n^3 / 2 cell updates cost about as much as one
+    # heap-based Dijkstra per source over all m edges
+    n = g.num_nodes
+    return n <= DENSE_MAX_NODES and 2 * num_sources * g.num_edges >= n ** 3
+
+
+def many_to_many(g: CSRGraph, sources: Sequence[int], workers: Optional[int] = None,
+                 min_parallel_work: int = PARALLEL_MIN_WORK) -> Iterator[Tuple[int, array]]:
+    """
+    Shortest-path distance rows from each source id, yielded in order as
+    (source, row) where row[v] is the distance to node id v (inf if
+    unreachable).
+    Small dense graphs queried from many sources use Floyd-Warshall. Otherwise
+    one Dijkstra runs per source; when the work is large enough, batches of
+    sources are spread over the shared long-lived worker pool, whose workers
+    read the graph from one shared_memory block, so it is copied in once
+    rather than per task.
+    """
+    if _use_floyd_warshall(g, len(sources)):
+        rows = floyd_warshall_csr(g)
+        for s in sources:
+            yield s, rows[s]
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sources) < 2 or len(sources) * g.num_edges < min_parallel_work:
+        for s in sources:
+            yield s, dijkstra_csr(g, s)
+        return
+
+    n, m = g.num_nodes, g.num_edges
+    shm = shared_memory.SharedMemory(create=True, size=8 * (n + 1 + 2 * m))
+    jobs = []
+    try:
+        buf = shm.buf
+        buf[:8 * (n + 1)] = memoryview(g.offsets).cast("B")
+        buf[8 * (n + 1):8 * (n + 1 + m)] = memoryview(g.targets).cast("B")
+        buf[8 * (n + 1 + m):8 * (n + 1 + 2 * m)] = memoryview(g.weights).cast("B")
+        del buf
+        pool = get_pool(workers)
+        size = max(1, len(sources) // (4 * workers))
+        batches = [sources[i:i + size] for i in range(0, len(sources), size)]
+        jobs = [pool.submit(_rows, shm.name, n, m, batch) for batch in batches]
+        try:
+            for batch, job in zip(batches, jobs):
+                for s, raw in zip(batch, job.result()):
+                    row = array("d")
+                    row.frombytes(raw)
+                    yield s, row
+        except BrokenProcessPool:
+            # a worker died; the next call starts a fresh pool
+            drop_pool(workers)
+            raise
+    finally:
+        # also reached when the consumer stops early: drop the queued batches
+        for job in jobs:
+            job.cancel()
+        shm.close()
+        shm.unlink()
@@ -1,22 +1,28 @@
 import heapq
-from typing import Dict, Tuple, Callable, Any, List
+from typing import Dict, Tuple, Callable, Any, List, Optional
+
+from algorithms.graphs.dijkstra import record_stats
 
 def a_star(start: Any, goal: Any,
            neighbors_fn: Callable[[Any], List[Tuple[Any, float]]],
-           heuristic_fn: Callable[[Any, Any], float]) -> List[Any]:
+           heuristic_fn: Callable[[Any, Any], float],
+           stats: Optional[Dict[str, int]] = None) -> List[Any]:
     """
     A* search that returns path from start to goal (list of nodes) or empty list if none.
     neighbors_fn(node) -> list of (neighbor, cost)
     heuristic_fn(a, b) -> estimated cost from a to b
+    stats: optional dict that receives heap_pushes, heap_pops and expansions counts
     """
     open_set = []
     heapq.heappush(open_set, (0 + heuristic_fn(start, goal), 0, start, None))
     came_from = {}
     g_score = {start: 0}
     closed = set()
+    pushes, pops, expansions = 1, 0, 0
 
     while open_set:
         _, current_g, current, parent = heapq.heappop(open_set)
+        pops += 1
 
         if current in closed:
             continue
@@ -24,6 +30,7 @@ def a_star(start: Any, goal: Any,
         came_from[current] = parent
 
         if current == goal:
+            record_stats(stats, pushes, pops, expansions)
             # reconstruct path
             path = []
             node = current
@@ -33,6 +40,7 @@ def a_star(start: Any, goal: Any,
             return list(reversed(path))
 
         closed.add(current)
+        expansions += 1
 
         for neighbor, cost in neighbors_fn(current):
             tentative_g = current_g + cost
@@ -42,5 +50,7 @@ def a_star(start: Any, goal: Any,
                 g_score[neighbor] = tentative_g
                 f = tentative_g + heuristic_fn(neighbor, goal)
                 heapq.heappush(open_set, (f, tentative_g, neighbor, current))
+                pushes += 1
 
+    record_stats(stats, pushes, pops, expansions)
     return []
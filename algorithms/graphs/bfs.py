@@ -1,11 +1,13 @@
 from collections import deque
-from typing import Dict, List, Any
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-def bfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
+def bfs(graph: Dict[Any, List[Any]], start: Any, check: Optional[Callable[[], None]] = None) -> List[Any]:
     """
     Breadth-first search on adjacency-list graph.
     graph: dict[node] = list_of_neighbors
     Returns list of visited nodes in BFS order.
+    check: optional callable run every 1024 nodes (e.g. a deadline check that raises).
     """
     visited = []
     queue = deque([start])
@@ -14,8 +16,65 @@ def bfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
     while queue:
         v = queue.popleft()
         visited.append(v)
+        if check is not None and not len(visited) & 1023:
+            check()
         for neighbor in graph.get(v, []):
             if neighbor not in seen:
                 seen.add(neighbor)
                 queue.append(neighbor)
     return visited
+
+def bfs_csr(g, start: int, check: Optional[Callable[[], None]] = None) -> List[int]:
+    """
+    BFS over a CSRGraph (see algorithms.graphs.csr) from node id `start`.
+    Uses a flat visited bitmap and returns node ids in BFS order.
+    `check` works as in bfs.
+    """
+    offsets, targets = g.offsets, g.targets
+    seen = bytearray(g.num_nodes)
+    seen[start] = 1
+    order = [start]
+    # the order list doubles as the queue: order[head:] is the frontier
+    head = 0
+    while head < len(order):
+        v = order[head]
+        head += 1
+        if check is not None and not head & 1023:
+            check()
+        for i in range(offsets[v], offsets[v + 1]):
+            u = targets[i]
+            if not seen[u]:
+                seen[u] = 1
+                order.append(u)
+    return order
+
+def bfs_iter(neighbors: Callable[[Any], Iterable[Any]], start: Any,
+             max_depth: Optional[int] = None,
+             check: Optional[Callable[[], None]] = None) -> Iterator[Tuple[Any, int]]:
+    """
+    Lazy BFS yielding (node, depth) in the same order as bfs.
+    neighbors(node) returns the node's neighbors, so this works on adjacency
+    dicts and CSR graphs alike. Nodes at max_depth are yielded but not
+    expanded. Nothing is built up front: stop iterating to stop the search.
+    `check` works as in bfs.
+    """
+    seen = {start}
+    queue = deque([(start, 0)])
+    count = 0
+    while queue:
+        v, depth = queue.popleft()
+        count += 1
+        if check is not None and not count & 1023:
+            check()
+        yield v, depth
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for u in neighbors(v):
+            if u not in seen:
+                seen.add(u)
+                queue.append((u, depth + 1))
+
+def bfs_levels(walk: Iterable[Tuple[Any, int]]) -> Iterator[Tuple[int, List[Any]]]:
+    """Group a bfs_iter walk into (depth, frontier) pairs, one level at a time."""
+    for depth, group in groupby(walk, key=lambda item: item[1]):
+        yield depth, [v for v, _ in group]
@@ -0,0 +1,113 @@
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+AdjacencyList = Dict[Any, List[Any]]
+WeightedAdjacency = Dict[Any, Dict[Any, float]]
+
+
+class CSRGraph:
+    """
+    Graph in compressed sparse row form.
+    Node labels are mapped to dense ids 0..n-1; the out-edges of node u are
+    targets[offsets[u]:offsets[u + 1]] with matching weights.
+    """
+
+    __slots__ = ("labels", "index", "offsets", "targets", "weights", "_reverse")
+
+    def __init__(self, labels: List[Any], offsets: array, targets: array, weights: array,
+                 index: Optional[Dict[Any, int]] = None):
+        self.labels = labels
+        self.index = index if index is not None else {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse: Optional["CSRGraph"] = None
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = self.offsets.itemsize * len(self.offsets) + \
+            self.targets.itemsize * len(self.targets) + \
+            self.weights.itemsize * len(self.weights)
+        # labels list plus the label -> id dict, roughly 100 bytes per node
+        return arrays + 100 * len(self.labels)
+
+    def edges(self, u: int) -> Iterator[Tuple[int, float]]:
+        """(target, weight) pairs for the out-edges of node id u."""
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[a:b], self.weights[a:b])
+
+    def reversed(self) -> "CSRGraph":
+        """The graph with every edge flipped, built once and cached."""
+        if self._reverse is None:
+            n = self.num_nodes
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+            counts = [0] * (n + 1)
+            for v in targets:
+                counts[v + 1] += 1
+            for i in range(n):
+                counts[i + 1] += counts[i]
+            rev_offsets = array("q", counts)
+            fill = counts[:n]
+            rev_targets = array("q", bytes(8 * len(targets)))
+            rev_weights = array("d", bytes(8 * len(targets)))
+            for u in range(n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    j = fill[v]
+                    rev_targets[j] = u
+                    rev_weights[j] = weights[i]
+                    fill[v] = j + 1
+            self._reverse = CSRGraph(self.labels, rev_offsets, rev_targets, rev_weights, self.index)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def id_of(self, label: Any) -> int:
+        """Dense id of label, or -1 if the node is unknown."""
+        try:
+            return self.index.get(label, -1)
+        except TypeError:  # unhashable labels (e.g. JSON lists) are never nodes
+            return -1
+
+
+def compile_graph(graph: Union[AdjacencyList, WeightedAdjacency],
+                  check: Optional[Callable[[], None]] = None) -> CSRGraph:
+    """
+    Compile an adjacency dict into CSR form.
+    Accepts the bfs/dfs shape (node -> [neighbors]) with unit weights, or the
+    dijkstra shape (node -> {neighbor: weight}). Nodes that only appear as
+    neighbors get ids too. Neighbor order is preserved.
+    `check` (optional) is called every 1024 nodes, e.g. a deadline check that raises.
+    """
+    labels: List[Any] = list(graph)
+    index = {label: i for i, label in enumerate(labels)}
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("d")
+
+    for label, edges in graph.items():
+        if check is not None and not len(offsets) & 1023:
+            check()
+        if isinstance(edges, Mapping):
+            items: Iterable = edges.items()
+        else:
+            items = ((v, 1.0) for v in edges)
+        for v, w in items:
+            vid = index.get(v)
+            if vid is None:
+                vid = index[v] = len(labels)
+                labels.append(v)
+            targets.append(vid)
+            weights.append(w)
+        offsets.append(len(targets))
+
+    # nodes discovered only as neighbors have no out-edges
+    offsets.extend([len(targets)] * (len(labels) + 1 - len(offsets)))
+    return CSRGraph(labels, offsets, targets, weights, index)
@@ -1,8 +1,9 @@
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-def dfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
+def dfs(graph: Dict[Any, List[Any]], start: Any, check: Optional[Callable[[], None]] = None) -> List[Any]:
     """
     Depth-first search (iterative) returning visitation order.
+    check: optional callable run every 1024 nodes (e.g. a deadline check that raises).
     """
     visited = []
     stack = [start]
@@ -14,8 +15,59 @@ def dfs(graph: Dict[Any, List[Any]], start: Any) -> List[Any]:
             continue
         seen.add(v)
         visited.append(v)
+        if check is not None and not len(visited) & 1023:
+            check()
         # push neighbors in reverse to have natural order
         for neighbor in reversed(graph.get(v, [])):
             if neighbor not in seen:
                 stack.append(neighbor)
     return visited
+
+def dfs_csr(g, start: int, check: Optional[Callable[[], None]] = None) -> List[int]:
+    """
+    Iterative DFS over a CSRGraph (see algorithms.graphs.csr) from node id
+    `start`, visiting neighbors in the same order as dfs. Returns node ids.
+    `check` works as in dfs.
+    """
+    offsets, targets = g.offsets, g.targets
+    seen = bytearray(g.num_nodes)
+    visited = []
+    stack = [start]
+
+    while stack:
+        v = stack.pop()
+        if seen[v]:
+            continue
+        seen[v] = 1
+        visited.append(v)
+        if check is not None and not len(visited) & 1023:
+            check()
+        for i in range(offsets[v + 1] - 1, offsets[v] - 1, -1):
+            u = targets[i]
+            if not seen[u]:
+                stack.append(u)
+    return visited
+
+def dfs_iter(neighbors: Callable[[Any], Iterable[Any]], start: Any,
+             max_depth: Optional[int] = None,
+             check: Optional[Callable[[], None]] = None) -> Iterator[Tuple[Any, int]]:
+    """
+    Lazy DFS yielding (node, depth) in the same order as dfs, where depth is
+    the length of the DFS tree path. Nodes at max_depth are not expanded.
+    `check` works as in dfs.
+    """
+    seen = set()
+    stack = [(start, 0)]
+    while stack:
+        v, depth = stack.pop()
+        if v in seen:
+            continue
+        seen.add(v)
+        if check is not None and not len(seen) & 1023:
+            check()
+        yield v, depth
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbor in reversed(list(neighbors(v))):
+            if neighbor not in seen:
+                stack.append((neighbor, depth + 1))
@@ -1,23 +1,198 @@
 import heapq
-from typing import Dict, Any
+from array import array
+from math import inf
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 
-def dijkstra(graph: Dict[Any, Dict[Any, float]], start: Any) -> Dict[Any, float]:
+_NO_EDGES: Dict[Any, float] = {}
+
+def record_stats(stats: Optional[Dict[str, int]], pushes: int, pops: int, expansions: int) -> None:
+    """Add a search's operation counts to `stats` (if given)."""
+    if stats is not None:
+        stats["heap_pushes"] = stats.get("heap_pushes", 0) + pushes
+        stats["heap_pops"] = stats.get("heap_pops", 0) + pops
+        stats["expansions"] = stats.get("expansions", 0) + expansions
+
+def dijkstra(graph: Dict[Any, Dict[Any, float]], start: Any,
+             stats: Optional[Dict[str, int]] = None,
+             check: Optional[Callable[[], None]] = None) -> Dict[Any, float]:
     """
     Dijkstra's shortest paths from start.
     graph: node -> {neighbor: weight, ...}
-    Returns dict of distances.
+    Returns dict of distances. Pass a dict as `stats` to have the number of
+    heap pushes, pops and node expansions added to it.
+    check: optional callable run every 1024 heap pops (e.g. a deadline check that raises).
     """
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     pq = [(0, start)]
+    pushes, pops, expansions = 1, 0, 0
 
     while pq:
         dist_u, u = heapq.heappop(pq)
+        pops += 1
+        if check is not None and not pops & 1023:
+            check()
         if dist_u > distances[u]:
             continue
+        expansions += 1
         for v, w in graph[u].items():
             alt = dist_u + w
             if alt < distances.get(v, float('inf')):
                 distances[v] = alt
                 heapq.heappush(pq, (alt, v))
+                pushes += 1
+    record_stats(stats, pushes, pops, expansions)
     return distances
+
+def _dijkstra_to(start: Any, targets: Iterable[Any],
+                 edges: Callable[[Any], Iterable[Tuple[Any, float]]],
+                 check: Optional[Callable[[], None]] = None
+                 ) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+    remaining = set(targets)
+    distances = {start: 0}
+    predecessors = {start: None}
+    settled = set()
+    pq = [(0, start)]
+
+    while pq and remaining:
+        dist_u, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        settled.add(u)
+        if check is not None and not len(settled) & 1023:
+            check()
+        remaining.discard(u)
+        for v, w in edges(u):
+            alt = dist_u + w
+            if alt < distances.get(v, inf):
+                distances[v] = alt
+                predecessors[v] = u
+                heapq.heappush(pq, (alt, v))
+    return distances, predecessors
+
+def dijkstra_to(graph: Dict[Any, Dict[Any, float]], start: Any, targets: Iterable[Any],
+                check: Optional[Callable[[], None]] = None) -> Tuple[Dict[Any, float], Dict[Any, Any]]:
+    """
+    Point-to-point / multi-target Dijkstra.
+    Distances are created lazily as nodes are reached, and the search stops
+    as soon as every target has been settled.
+    Returns (distances, predecessors); pass the predecessors to
+    reconstruct_path to get a route. `check` works as in dijkstra.
+    """
+    return _dijkstra_to(start, targets, lambda u: graph.get(u, _NO_EDGES).items(), check)
+
+def dijkstra_csr_to(g, start: int, targets: Iterable[int],
+                    check: Optional[Callable[[], None]] = None) -> Tuple[Dict[int, float], Dict[int, Any]]:
+    """dijkstra_to over a CSRGraph, with node ids in and out."""
+    return _dijkstra_to(start, targets, g.edges, check)
+
+def reconstruct_path(predecessors: Dict[Any, Any], target: Any) -> List[Any]:
+    """Walk predecessor links back from target. Returns [] if target was never reached."""
+    if target not in predecessors:
+        return []
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    return path[::-1]
+
+def reverse_graph(graph: Dict[Any, Dict[Any, float]]) -> Dict[Any, Dict[Any, float]]:
+    """Same graph with every edge flipped (used by the backward search)."""
+    rev: Dict[Any, Dict[Any, float]] = {}
+    for u, edges in graph.items():
+        for v, w in edges.items():
+            rev.setdefault(v, {})[u] = w
+    return rev
+
+def _bidirectional(start: Any, target: Any,
+                   forward: Callable[[Any], Iterable[Tuple[Any, float]]],
+                   backward: Callable[[Any], Iterable[Tuple[Any, float]]],
+                   check: Optional[Callable[[], None]] = None
+                   ) -> Tuple[float, List[Any]]:
+    if start == target:
+        return 0, [start]
+    dist = ({start: 0}, {target: 0})
+    pred = ({start: None}, {target: None})
+    settled = (set(), set())
+    heaps = ([(0, start)], [(0, target)])
+    edges = (forward, backward)
+    best, meet = inf, None
+
+    while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+        # expand whichever side has the closer frontier
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist_u, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        if check is not None and not len(settled[side]) & 1023:
+            check()
+        d, p, other = dist[side], pred[side], dist[1 - side]
+        for v, w in edges[side](u):
+            alt = dist_u + w
+            if alt < d.get(v, inf):
+                d[v] = alt
+                p[v] = u
+                heapq.heappush(heaps[side], (alt, v))
+            if v in other and d[v] + other[v] < best:
+                best, meet = d[v] + other[v], v
+
+    if meet is None:
+        return inf, []
+    forward_path = reconstruct_path(pred[0], meet)
+    backward_path = reconstruct_path(pred[1], meet)
+    return best, forward_path + backward_path[-2::-1]
+
+def bidirectional_dijkstra(graph: Dict[Any, Dict[Any, float]], start: Any, target: Any,
+                           reverse: Optional[Dict[Any, Dict[Any, float]]] = None,
+                           check: Optional[Callable[[], None]] = None
+                           ) -> Tuple[float, List[Any]]:
+    """
+    Bidirectional Dijkstra: grows one search forward from start and one
+    backward from target, and stops once the two frontiers cannot improve
+    the best meeting point found. Pass `reverse` (see reverse_graph) to
+    reuse a reversed graph across queries. `check` works as in dijkstra.
+    Returns (distance, path), or (inf, []) if target is unreachable.
+    """
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    return _bidirectional(start, target,
+                          lambda u: graph.get(u, _NO_EDGES).items(),
+                          lambda u: reverse.get(u, _NO_EDGES).items(), check)
+
+def bidirectional_dijkstra_csr(g, start: int, target: int,
+                               check: Optional[Callable[[], None]] = None) -> Tuple[float, List[int]]:
+    """bidirectional_dijkstra over a CSRGraph (node ids); the reversed graph is cached on g."""
+    return _bidirectional(start, target, g.edges, g.reversed().edges, check)
+
+def dijkstra_csr(g, start: int, stats: Optional[Dict[str, int]] = None,
+                 check: Optional[Callable[[], None]] = None) -> array:
+    """
+    Dijkstra over a CSRGraph (see algorithms.graphs.csr) from node id `start`.
+    Returns a flat array of distances indexed by node id (inf if unreachable).
+    `stats` and `check` work as in dijkstra.
+    """
+    offsets, targets, weights = g.offsets, g.targets, g.weights
+    dist = array("d", [inf]) * g.num_nodes
+    dist[start] = 0.0
+    pq = [(0.0, start)]
+    pushes, pops, expansions = 1, 0, 0
+
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+        pops += 1
+        if check is not None and not pops & 1023:
+            check()
+        if dist_u > dist[u]:
+            continue
+        expansions += 1
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            alt = dist_u + weights[i]
+            if alt < dist[v]:
+                dist[v] = alt
+                heapq.heappush(pq, (alt, v))
+                pushes += 1
+    record_stats(stats, pushes, pops, expansions)
+    return dist
@@ -0,0 +1,110 @@
+import heapq
+from math import inf
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Graph = Dict[Any, Dict[Any, float]]
+# (u, v, old weight, new weight); None means the edge is absent
+EdgeChange = Tuple[Any, Any, Optional[float], Optional[float]]
+
+
+class DynamicSSSP:
+    """
+    Single-source shortest paths that are repaired after edge updates
+    instead of recomputed (Ramalingam-Reps style).
+
+    `out` and `inn` are the forward and reverse adjacency of the same graph
+    (node -> {neighbor: weight}). The caller edits them and then passes the
+    list of changes to `apply`; only nodes whose distance can change are
+    touched.
+    `check` (optional) is called every 1024 heap pops, e.g. a deadline check
+    that raises; a computation or repair it interrupts leaves the object in
+    an inconsistent state, so it must be discarded.
+    """
+
+    def __init__(self, out: Graph, inn: Graph, source: Any, check: Optional[Callable[[], None]] = None):
+        self.out = out
+        self.inn = inn
+        self.source = source
+        self.dist: Dict[Any, float] = {source: 0}
+        self.pred: Dict[Any, Any] = {source: None}
+        self._propagate([(0, source)], check)
+
+    def _propagate(self, pq: List[Tuple[float, Any]], check: Optional[Callable[[], None]] = None) -> None:
+        """Dijkstra from the given seeds, lowering any distance that improves."""
+        dist, pred, out = self.dist, self.pred, self.out
+        heapq.heapify(pq)
+        pops = 0
+        while pq:
+            dist_u, u = heapq.heappop(pq)
+            pops += 1
+            if check is not None and not pops & 1023:
+                check()
+            if dist_u > dist.get(u, inf):
+                continue
+            for v, w in out.get(u, {}).items():
+                alt = dist_u + w
+                if alt < dist.get(v, inf):
+                    dist[v] = alt
+                    pred[v] = u
+                    heapq.heappush(pq, (alt, v))
+
+    def _affected(self, roots: Iterable[Any]) -> set:
+        """Roots plus every node whose shortest-path-tree path runs through one of them."""
+        pred, out = self.pred, self.out
+        affected = set(roots)
+        stack = list(affected)
+        while stack:
+            x = stack.pop()
+            for y in out.get(x, {}):
+                if y not in affected and pred.get(y) == x:
+                    affected.add(y)
+                    stack.append(y)
+        return affected
+
+    def apply(self, changes: Iterable[EdgeChange], check: Optional[Callable[[], None]] = None) -> int:
+        """
+        Repair distances after a batch of edge changes (already applied to
+        the graph). Returns the number of nodes whose distance was recomputed.
+        """
+        # collapse repeated edits of one edge into its net change
+        net: Dict[Tuple[Any, Any], List] = {}
+        for u, v, old, new in changes:
+            if (u, v) in net:
+                net[(u, v)][1] = new
+            else:
+                net[(u, v)] = [old, new]
+        changes = [(u, v, old, new) for (u, v), (old, new) in net.items() if old != new]
+        dist, pred, inn = self.dist, self.pred, self.inn
+
+        # 1. deletions / weight increases of tree edges: the subtree below
+        #    them loses its distances and is rebuilt from unaffected parents
+        roots = [v for u, v, old, new in changes
+                 if old is not None and (new is None or new > old) and pred.get(v) == u
+                 and v != self.source]
+        affected = self._affected(roots) if roots else set()
+        for x in affected:
+            dist.pop(x, None)
+            pred.pop(x, None)
+        seeds = []
+        for x in affected:
+            best, parent = inf, None
+            for p, w in inn.get(x, {}).items():
+                if p not in affected and dist.get(p, inf) + w < best:
+                    best, parent = dist[p] + w, p
+            if parent is not None:
+                dist[x] = best
+                pred[x] = parent
+                seeds.append((best, x))
+        self._propagate(seeds, check)
+
+        # 2. insertions / weight decreases: push improvements outward
+        seeds = []
+        for u, v, old, new in changes:
+            if new is not None and (old is None or new < old):
+                alt = dist.get(u, inf) + new
+                if alt < dist.get(v, inf):
+                    dist[v] = alt
+                    pred[v] = u
+                    seeds.append((alt, v))
+        self._propagate(seeds, check)
+        return len(affected) + len(seeds)
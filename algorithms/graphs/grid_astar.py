@@ -0,0 +1,260 @@
+import heapq
+from array import array
+from math import inf, sqrt
+from typing import List, Optional, Sequence, Tuple
+
+SQRT2 = sqrt(2)
+
+Cell = Tuple[int, int]
+
+
+class Grid:
+    """
+    Occupancy grid stored as one flat bytearray with a one-cell blocked
+    border, so neighbor lookups are plain index arithmetic with no bounds
+    checks. Cell (x, y) has id (y + 1) * stride + (x + 1).
+    """
+
+    __slots__ = ("width", "height", "stride", "free", "costs", "min_cost")
+
+    def __init__(self, width: int, height: int, obstacles: Sequence,
+                 costs: Optional[Sequence[float]] = None):
+        if width <= 0 or height <= 0:
+            raise ValueError("Grid width and height must be positive")
+        if len(obstacles) != width * height:
+            raise ValueError("Obstacle bitmap must have width * height cells")
+        if costs is not None and len(costs) != width * height:
+            raise ValueError("Cell costs must have width * height entries")
+        self.width = width
+        self.height = height
+        self.stride = stride = width + 2
+        self.free = bytearray(stride * (height + 2))
+        self.costs = array("d", [1.0]) * len(self.free) if costs is not None else None
+        for y in range(height):
+            row = y * width
+            base = (y + 1) * stride + 1
+            for x in range(width):
+                if obstacles[row + x] in (0, "0", False):
+                    self.free[base + x] = 1
+                    if costs is not None:
+                        self.costs[base + x] = costs[row + x]
+        if costs is not None and any(c <= 0 for c in costs):
+            raise ValueError("Cell costs must be positive")
+        self.min_cost = min(costs) if costs else 1.0
+
+    def cell_id(self, cell: Cell) -> int:
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        return (y + 1) * self.stride + x + 1
+
+    def cell_of(self, i: int) -> Cell:
+        y, x = divmod(i, self.stride)
+        return x - 1, y - 1
+
+
+def _trace(parent: array, goal: int) -> List[int]:
+    path = []
+    i = goal
+    while i != -1:
+        path.append(i)
+        i = parent[i]
+    return path[::-1]
+
+
+def _astar(grid: Grid, start: int, goal: int, diagonal: bool) -> Tuple[float, List[int]]:
+    """Plain A* over cell ids with flat g-score / parent / closed arrays."""
+    stride, free, costs = grid.stride, grid.free, grid.costs
+    n = len(free)
+    g = array("d", [inf]) * n
+    parent = array("q", [-1]) * n
+    closed = bytearray(n)
+    gy, gx = divmod(goal, stride)
+    hscale = grid.min_cost
+    steps = [(1, 1.0), (-1, 1.0), (stride, 1.0), (-stride, 1.0)]
+    if diagonal:
+        steps += [(stride + 1, SQRT2), (stride - 1, SQRT2), (-stride + 1, SQRT2), (-stride - 1, SQRT2)]
+
+    g[start] = 0.0
+    open_set = [(0.0, 0.0, start)]
+    while open_set:
+        _, _, i = heapq.heappop(open_set)
+        if closed[i]:
+            continue
+        if i == goal:
+            return g[i], _trace(parent, i)
+        closed[i] = 1
+        gi = g[i]
+        for d, step_cost in steps:
+            j = i + d
+            if not free[j] or closed[j]:
+                continue
+            if step_cost != 1.0:
+                # no corner cutting: both orthogonal cells must be open
+                dy = stride if d > 1 else -stride
+                if not (free[i + (d - dy)] and free[i + dy]):
+                    continue
+            ng = gi + (step_cost * costs[j] if costs is not None else step_cost)
+            if ng < g[j]:
+                g[j] = ng
+                parent[j] = i
+                jy, jx = divmod(j, stride)
+                dx = abs(jx - gx)
+                dyy = abs(jy - gy)
+                if diagonal:
+                    h = max(dx, dyy) + (SQRT2 - 1) * min(dx, dyy)
+                else:
+                    h = dx + dyy
+                # on equal f prefer the deeper node, so ties are not all expanded;
+                # rounding makes octile f-values that differ only by float noise tie
+                heapq.heappush(open_set, (round(ng + h * hscale, 9), -ng, j))
+    return inf, []
+
+
+def _jump(free: bytearray, stride: int, i: int, dx: int, dy: int, goal: int) -> int:
+    """
+    Walk from cell i in direction (dx, dy) until a jump point, the goal, or a
+    wall. Returns the jump point id or -1. Iterative, so long corridors do
+    not hit the recursion limit.
+    """
+    d = dx + dy * stride
+    while True:
+        if not free[i]:
+            return -1
+        if i == goal:
+            return i
+        if dx and dy:
+            if _jump(free, stride, i + dx, dx, 0, goal) != -1 or \
+                    _jump(free, stride, i + dy * stride, 0, dy, goal) != -1:
+                return i
+            if not (free[i + dx] and free[i + dy * stride]):
+                return -1
+        elif dx:
+            if (free[i - stride] and not free[i - dx - stride]) or \
+                    (free[i + stride] and not free[i - dx + stride]):
+                return i
+        else:
+            s = dy * stride
+            if (free[i - 1] and not free[i - 1 - s]) or \
+                    (free[i + 1] and not free[i + 1 - s]):
+                return i
+        i += d
+
+
+def _pruned_directions(free: bytearray, stride: int, i: int, parent: int) -> List[Tuple[int, int]]:
+    """Directions worth jumping in from i, given the jump point we came from."""
+    if parent == -1:
+        dirs = []
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if free[i + dx + dy * stride]:
+                dirs.append((dx, dy))
+        for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+            if free[i + dx] and free[i + dy * stride] and free[i + dx + dy * stride]:
+                dirs.append((dx, dy))
+        return dirs
+
+    py, px = divmod(parent, stride)
+    y, x = divmod(i, stride)
+    dx = (x > px) - (x < px)
+    dy = (y > py) - (y < py)
+    dirs = []
+    if dx and dy:
+        if free[i + dy * stride]:
+            dirs.append((0, dy))
+        if free[i + dx]:
+            dirs.append((dx, 0))
+        if free[i + dy * stride] and free[i + dx]:
+            dirs.append((dx, dy))
+    elif dx:
+        up, down = free[i - stride], free[i + stride]
+        if free[i + dx]:
+            dirs.append((dx, 0))
+            if down:
+                dirs.append((dx, 1))
+            if up:
+                dirs.append((dx, -1))
+        if down:
+            dirs.append((0, 1))
+        if up:
+            dirs.append((0, -1))
+    else:
+        left, right = free[i - 1], free[i + 1]
+        if free[i + dy * stride]:
+            dirs.append((0, dy))
+            if right:
+                dirs.append((1, dy))
+            if left:
+                dirs.append((-1, dy))
+        if right:
+            dirs.append((1, 0))
+        if left:
+            dirs.append((-1, 0))
+    return dirs
+
+
+def _jps(grid: Grid, start: int, goal: int) -> Tuple[float, List[int]]:
+    """Jump point search (8-connected, uniform cost, no corner cutting)."""
+    stride, free = grid.stride, grid.free
+    n = len(free)
+    g = array("d", [inf]) * n
+    parent = array("q", [-1]) * n
+    closed = bytearray(n)
+    gy, gx = divmod(goal, stride)
+
+    g[start] = 0.0
+    open_set = [(0.0, 0.0, start)]
+    while open_set:
+        _, _, i = heapq.heappop(open_set)
+        if closed[i]:
+            continue
+        if i == goal:
+            # fill in the straight segments between consecutive jump points
+            points = _trace(parent, i)
+            path = [points[0]]
+            for a, b in zip(points, points[1:]):
+                ay, ax = divmod(a, stride)
+                by, bx = divmod(b, stride)
+                step = ((bx > ax) - (bx < ax)) + ((by > ay) - (by < ay)) * stride
+                while a != b:
+                    a += step
+                    path.append(a)
+            return g[i], path
+        closed[i] = 1
+        iy, ix = divmod(i, stride)
+        for dx, dy in _pruned_directions(free, stride, i, parent[i]):
+            j = _jump(free, stride, i + dx + dy * stride, dx, dy, goal)
+            if j == -1 or closed[j]:
+                continue
+            jy, jx = divmod(j, stride)
+            ddx, ddy = abs(jx - ix), abs(jy - iy)
+            ng = g[i] + max(ddx, ddy) + (SQRT2 - 1) * min(ddx, ddy)
+            if ng < g[j]:
+                g[j] = ng
+                parent[j] = i
+                hx, hy = abs(jx - gx), abs(jy - gy)
+                f = ng + max(hx, hy) + (SQRT2 - 1) * min(hx, hy)
+                heapq.heappush(open_set, (round(f, 9), -ng, j))
+    return inf, []
+
+
+def grid_a_star(grid: Grid, start: Cell, goal: Cell, diagonal: bool = False,
+                jump_points: bool = False) -> Tuple[float, List[Cell]]:
+    """
+    A* on an occupancy grid.
+    Moves are 4-connected with a Manhattan heuristic, or 8-connected
+    (diagonal=True, no corner cutting) with an octile heuristic. Entering a
+    cell costs its cell cost (1 by default), times sqrt(2) for diagonal moves.
+    jump_points=True runs jump point search instead, which needs diagonal
+    moves and uniform costs.
+    Returns (cost, path of (x, y) cells), or (inf, []) if there is no path.
+    """
+    s, t = grid.cell_id(start), grid.cell_id(goal)
+    if s == -1 or t == -1 or not grid.free[s] or not grid.free[t]:
+        return inf, []
+    if jump_points:
+        if not diagonal or grid.costs is not None:
+            raise ValueError("Jump point search needs diagonal moves and uniform cell costs")
+        cost, ids = _jps(grid, s, t)
+    else:
+        cost, ids = _astar(grid, s, t, diagonal)
+    return cost, [grid.cell_of(i) for i in ids]
@@ -0,0 +1,37 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+# long-lived pools by worker count, started on first use and shared by the
+# parallel algorithms (parallel_sort, many_to_many)
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # the server runs request threads, which fork() does not copy safely
+            context = (multiprocessing.get_context("forkserver")
+                       if "forkserver" in multiprocessing.get_all_start_methods() else None)
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return pool
+
+
+def drop_pool(workers: int) -> None:
+    """Discard a pool whose worker died; the next get_pool starts a fresh one."""
+    with _pools_lock:
+        pool = _pools.pop(workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown() -> None:
+    """Stop the worker pools (they are restarted on the next call)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
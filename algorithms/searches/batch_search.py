@@ -0,0 +1,71 @@
+from bisect import bisect_left
+from itertools import islice
+from typing import Any, List, Optional, Sequence
+
+
+def is_sorted(seq: Sequence[Any]) -> bool:
+    """True if seq is in non-decreasing order."""
+    return all(a <= b for a, b in zip(seq, islice(seq, 1, None)))
+
+
+def bisect_many(arr: Sequence[Any], targets: Sequence[Any],
+                lo: int = 0, hi: Optional[int] = None) -> List[int]:
+    """
+    searchsorted-style lookup: one C-level bisect per target within [lo, hi).
+    Returns the leftmost index of each target, or -1.
+    """
+    n = len(arr) if hi is None else hi
+    out = []
+    append = out.append
+    for t in targets:
+        i = bisect_left(arr, t, lo, n)
+        append(i if i < n and arr[i] == t else -1)
+    return out
+
+
+def merge_walk(arr: Sequence[Any], targets: Sequence[Any],
+               lo: int = 0, hi: Optional[int] = None) -> List[int]:
+    """
+    Lookup for sorted targets: one forward pass over arr[lo:hi], O(n + m).
+    Only worth it when there are at least as many targets as elements.
+    """
+    n = len(arr) if hi is None else hi
+    out = []
+    append = out.append
+    i = lo
+    for t in targets:
+        while i < n and arr[i] < t:
+            i += 1
+        append(i if i < n and arr[i] == t else -1)
+    return out
+
+
+def gallop_many(arr: Sequence[Any], targets: Sequence[Any],
+                lo: int = 0, hi: Optional[int] = None) -> List[int]:
+    """
+    Lookup for sorted targets: each search starts where the previous one
+    ended, doubling the step until the target is bracketed, then bisects.
+    Costs O(m log(n / m)) comparisons.
+    """
+    n = len(arr) if hi is None else hi
+    out = []
+    append = out.append
+    for t in targets:
+        step = 1
+        probe = lo
+        while probe < n and arr[probe] < t:
+            lo = probe + 1
+            probe += step
+            step *= 2
+        lo = bisect_left(arr, t, lo, min(probe + 1, n))
+        append(lo if lo < n and arr[lo] == t else -1)
+    return out
+
+
+def sorted_many(arr: Sequence[Any], targets: Sequence[Any],
+                lo: int = 0, hi: Optional[int] = None) -> List[int]:
+    """Pick the cheaper strategy for already-sorted targets."""
+    n = len(arr) if hi is None else hi
+    if len(targets) >= n - lo:
+        return merge_walk(arr, targets, lo, n)
+    return gallop_many(arr, targets, lo, n)
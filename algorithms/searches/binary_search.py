@@ -1,6 +1,10 @@
-def binary_search(arr, target):
-    """Binary search on a sorted list."""
-    low, high = 0, len(arr) - 1
+from algorithms.searches.batch_search import bisect_many, is_sorted, sorted_many
+
+def binary_search(arr, target, lo=0, hi=None):
+    """Binary search on a sorted sequence, restricted to indices [lo, hi)."""
+    if hi is None:
+        hi = len(arr)
+    low, high = lo, hi - 1
     while low <= high:
         mid = (low + high) // 2
         if arr[mid] == target:
@@ -10,3 +14,12 @@ def binary_search(arr, target):
         else:
             high = mid - 1
     return -1
+
+def binary_search_many(arr, targets, lo=0, hi=None):
+    """
+    Batched binary search on a sorted list.
+    Returns the leftmost index of each target (or -1), in target order.
+    """
+    if is_sorted(targets):
+        return sorted_many(arr, targets, lo, hi)
+    return bisect_many(arr, targets, lo, hi)
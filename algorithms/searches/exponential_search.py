@@ -1,14 +1,28 @@
 from algorithms.searches.binary_search import binary_search
+from algorithms.searches.batch_search import bisect_many, gallop_many, is_sorted
 
-def exponential_search(arr, target):
+def exponential_search(arr, target, lo=0, hi=None):
     """Exponential Search - finds the range, then uses binary search."""
-    if len(arr) == 0:
+    if hi is None:
+        hi = len(arr)
+    if lo >= hi:
         return -1
-    if arr[0] == target:
-        return 0
+    if arr[lo] == target:
+        return lo
 
     i = 1
-    while i < len(arr) and arr[i] <= target:
+    while lo + i < hi and arr[lo + i] <= target:
         i *= 2
 
-    return binary_search(arr[:min(i, len(arr))], target)
+    # search the bracketed window in place instead of copying a prefix
+    return binary_search(arr, target, lo + i // 2, min(lo + i, hi))
+
+def exponential_search_many(arr, targets, lo=0, hi=None):
+    """
+    Batched exponential search. With sorted targets each search gallops
+    forward from the previous hit instead of restarting at index 0.
+    Returns the leftmost index of each target (or -1).
+    """
+    if is_sorted(targets):
+        return gallop_many(arr, targets, lo, hi)
+    return bisect_many(arr, targets, lo, hi)
@@ -1,6 +1,8 @@
-def fibonacci_search(arr, target):
-    """Fibonacci Search for sorted arrays."""
-    n = len(arr)
+def fibonacci_search(arr, target, lo=0, hi=None):
+    """Fibonacci Search for sorted arrays, restricted to indices [lo, hi)."""
+    if hi is None:
+        hi = len(arr)
+    n = hi - lo
     fibMMm2 = 0  # (m-2)'th Fibonacci number
     fibMMm1 = 1  # (m-1)'th Fibonacci number
     fibM = fibMMm2 + fibMMm1  # m'th Fibonacci number
@@ -10,10 +12,10 @@ def fibonacci_search(arr, target):
         fibMMm1 = fibM
         fibM = fibMMm2 + fibMMm1
 
-    offset = -1
+    offset = lo - 1
 
     while fibM > 1:
-        i = min(offset + fibMMm2, n - 1)
+        i = min(offset + fibMMm2, hi - 1)
         if arr[i] < target:
             fibM = fibMMm1
             fibMMm1 = fibMMm2
@@ -25,6 +27,6 @@ def fibonacci_search(arr, target):
             fibMMm2 = fibM - fibMMm1
         else:
             return i
-    if fibMMm1 and offset + 1 < n and arr[offset + 1] == target:
+    if fibMMm1 and offset + 1 < hi and arr[offset + 1] == target:
         return offset + 1
     return -1
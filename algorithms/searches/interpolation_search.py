@@ -1,10 +1,15 @@
-def interpolation_search(arr, target):
+from algorithms.searches.batch_search import bisect_many, is_sorted, sorted_many
+
+def interpolation_search(arr, target, lo=0, hi=None):
     """Interpolation Search (works best with uniformly distributed sorted data)."""
-    low = 0
-    high = len(arr) - 1
+    if hi is None:
+        hi = len(arr)
+    low = lo
+    high = hi - 1
 
     while low <= high and arr[low] <= target <= arr[high]:
-        if low == high:
+        if arr[low] == arr[high]:
+            # also covers low == high, and avoids dividing by zero on runs of equal values
             return low if arr[low] == target else -1
 
         pos = low + int(
@@ -19,3 +24,14 @@ def interpolation_search(arr, target):
             high = pos - 1
 
     return -1
+
+def interpolation_search_many(arr, targets, lo=0, hi=None):
+    """
+    Batched interpolation search on sorted numeric data.
+    Probing in pure Python loses to a C-level bisect, so numeric lookups go
+    through the searchsorted-style path; sorted targets use a merge-walk.
+    Returns the leftmost index of each target (or -1).
+    """
+    if is_sorted(targets):
+        return sorted_many(arr, targets, lo, hi)
+    return bisect_many(arr, targets, lo, hi)
@@ -1,18 +1,21 @@
 import math
 
-def jump_search(arr, target):
-    """Jump Search algorithm for sorted arrays."""
-    n = len(arr)
-    step = int(math.sqrt(n))
+def jump_search(arr, target, lo=0, hi=None):
+    """Jump Search algorithm for sorted arrays, restricted to indices [lo, hi)."""
+    if hi is None:
+        hi = len(arr)
+    n = hi - lo
+    jump = int(math.sqrt(max(n, 0)))
+    step = jump
     prev = 0
 
-    while prev < n and arr[min(step, n) - 1] < target:
+    while prev < n and arr[lo + min(step, n) - 1] < target:
         prev = step
-        step += int(math.sqrt(n))
+        step += jump
         if prev >= n:
             return -1
 
-    for i in range(prev, min(step, n)):
+    for i in range(lo + prev, lo + min(step, n)):
         if arr[i] == target:
             return i
     return -1
@@ -1,6 +1,30 @@
-def linear_search(arr, target):
-    """Simple linear search algorithm."""
-    for i, value in enumerate(arr):
-        if value == target:
+def linear_search(arr, target, lo=0, hi=None):
+    """Simple linear search algorithm over arr[lo:hi] (without slicing)."""
+    if hi is None:
+        hi = len(arr)
+    for i in range(lo, hi):
+        if arr[i] == target:
             return i
     return -1
+
+def linear_search_many(arr, targets, lo=0, hi=None):
+    """
+    First index of every target in arr[lo:hi] (-1 if absent), in one pass
+    over that range: O(n + k) instead of O(n * k) for k separate linear
+    searches. Unhashable targets fall back to a plain linear search.
+    """
+    if hi is None:
+        hi = len(arr)
+    first = {}
+    for i in range(lo, hi):
+        try:
+            first.setdefault(arr[i], i)
+        except TypeError:
+            pass
+    result = []
+    for t in targets:
+        try:
+            result.append(first.get(t, -1))
+        except TypeError:
+            result.append(linear_search(arr, t, lo, hi))
+    return result
@@ -1,13 +1,16 @@
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
-def bubble_sort(arr: List[Any]) -> List[Any]:
+def bubble_sort(arr: List[Any], check: Optional[Callable[[], None]] = None) -> List[Any]:
     """
     Bubble sort: in-place kind-of, returns new list sorted ascending.
     Not efficient for large arrays.
+    check: optional callable run before every pass (e.g. a deadline check that raises).
     """
     a = list(arr)
     n = len(a)
     for i in range(n):
+        if check is not None:
+            check()
         swapped = False
         for j in range(0, n - i - 1):
             if a[j] > a[j + 1]:
@@ -0,0 +1,111 @@
+import heapq
+import tempfile
+from array import array
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from algorithms.sorts.numeric_sort import as_typed_array, sort_typed_array
+
+ITEM_SIZE = 8  # bytes per element in a spilled run (array 'q' or 'd')
+# smallest memory budget accepted: 1024-element chunks
+MIN_MEMORY = 64 * 1024
+# most runs merged in one pass (and so open at once while merging)
+MAX_FAN_IN = 64
+
+
+def _spill(chunk: List[Any], tmpdir: Optional[str]) -> Tuple[BinaryIO, str]:
+    """Sort one in-memory chunk and write it to a temporary file as raw 8-byte values."""
+    typed = as_typed_array(chunk)
+    if typed is None:
+        raise ValueError("External sort only supports int and float values")
+    f = tempfile.TemporaryFile(dir=tmpdir)
+    sort_typed_array(typed, chunk).tofile(f)
+    return f, typed.typecode
+
+
+def _read_run(f: BinaryIO, typecode: str, block: int) -> Iterator[Any]:
+    """Stream a spilled run back `block` elements at a time."""
+    f.seek(0)
+    while True:
+        data = f.read(block * ITEM_SIZE)
+        if not data:
+            return
+        buf = array(typecode)
+        buf.frombytes(data)
+        yield from buf
+
+
+def _merge_runs(runs: List[Tuple[BinaryIO, str]], block: int,
+                tmpdir: Optional[str]) -> Tuple[BinaryIO, str]:
+    """Merge spilled runs into one new run and close the inputs."""
+    typecode = runs[0][1] if all(tc == runs[0][1] for _, tc in runs) else "d"
+    f = tempfile.TemporaryFile(dir=tmpdir)
+    try:
+        buf = array(typecode)
+        for v in heapq.merge(*(_read_run(r, tc, block) for r, tc in runs)):
+            buf.append(v)
+            if len(buf) >= block:
+                buf.tofile(f)
+                buf = array(typecode)
+        buf.tofile(f)
+    except BaseException:
+        f.close()
+        raise
+    for r, _ in runs:
+        r.close()
+    return f, typecode
+
+
+def external_sort(values: Iterable[Any], max_memory: int = 64 * 1024 * 1024,
+                  tmpdir: Optional[str] = None, max_fan_in: int = MAX_FAN_IN) -> Iterator[Any]:
+    """
+    Out-of-core sort for numeric streams.
+    Reads `values` in chunks that fit in `max_memory` bytes, sorts each chunk
+    in memory and spills it to a temporary file, then k-way merges the runs
+    with heapq.merge. At most `max_fan_in` runs are merged at once: whenever
+    that many runs of the same level exist they are merged into one run of
+    the next level, so open files stay bounded by about
+    max_fan_in * log_fan_in(runs). Yields the sorted values lazily; the
+    temporary files are removed when the generator finishes or is closed.
+    Runs mixing ints and floats are stored (and returned) as floats.
+    """
+    if max_memory < MIN_MEMORY:
+        raise ValueError(f"max_memory must be at least {MIN_MEMORY} bytes")
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+    # a boxed number in a list costs ~32 bytes + 8 for the pointer; sorting
+    # a chunk adds the packed buffer, the sorted pointer list and the output
+    chunk_size = max_memory // 64
+    # share the memory budget between the read buffers of the runs being merged
+    block = max(1, max_memory // (ITEM_SIZE * 2 * max_fan_in))
+    # levels[i]: runs produced by i merge passes
+    levels: List[List[Tuple[BinaryIO, str]]] = [[]]
+    try:
+        chunk = []
+        for v in values:
+            chunk.append(v)
+            if len(chunk) >= chunk_size:
+                levels[0].append(_spill(chunk, tmpdir))
+                chunk = []
+                level = 0
+                while len(levels[level]) >= max_fan_in:
+                    if level + 1 == len(levels):
+                        levels.append([])
+                    levels[level + 1].append(_merge_runs(levels[level], block, tmpdir))
+                    levels[level] = []
+                    level += 1
+        if chunk:
+            levels[0].append(_spill(chunk, tmpdir))
+            chunk = []
+
+        # smallest runs first, so the extra passes rewrite as little as possible
+        runs = [run for level in levels for run in level]
+        levels = [runs]
+        while len(runs) > max_fan_in:
+            merged = _merge_runs(runs[:max_fan_in], block, tmpdir)
+            del runs[:max_fan_in]
+            runs.append(merged)
+        yield from heapq.merge(*(_read_run(f, tc, block) for f, tc in runs))
+    finally:
+        for level in levels:
+            for f, _ in level:
+                f.close()
@@ -0,0 +1,154 @@
+from typing import List, Any, Optional
+
+# partitions at or below this size are finished with insertion sort
+INSERTION_CUTOFF = 16
+
+
+def _insertion(a: List[Any], lo: int, hi: int) -> None:
+    """Stable insertion sort of a[lo:hi] in place."""
+    for i in range(lo + 1, hi):
+        key = a[i]
+        j = i - 1
+        while j >= lo and a[j] > key:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = key
+
+
+def _sift_down(a: List[Any], lo: int, root: int, end: int) -> None:
+    """Restore the max-heap below root; heap indices are relative to lo."""
+    item = a[lo + root]
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not item < a[lo + child]:
+            break
+        a[lo + root] = a[lo + child]
+        root = child
+        child = 2 * root + 1
+    a[lo + root] = item
+
+
+def _heapsort(a: List[Any], lo: int, hi: int) -> None:
+    """In-place heapsort of a[lo:hi] (introsort's worst-case fallback)."""
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+
+def _partition(a: List[Any], lo: int, hi: int) -> int:
+    """
+    Hoare partition of a[lo:hi] around a median-of-three pivot.
+    Returns p with lo < p < hi such that a[lo:p] <= pivot <= a[p:hi].
+    """
+    mid = (lo + hi - 1) // 2
+    last = hi - 1
+    if a[mid] < a[lo]:
+        a[lo], a[mid] = a[mid], a[lo]
+    if a[last] < a[lo]:
+        a[lo], a[last] = a[last], a[lo]
+    if a[last] < a[mid]:
+        a[mid], a[last] = a[last], a[mid]
+    pivot = a[mid]
+
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        a[i], a[j] = a[j], a[i]
+
+
+def _introsort(a: List[Any], lo: int, hi: int, depth: int) -> None:
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(a, lo, hi)
+            return
+        depth -= 1
+        p = _partition(a, lo, hi)
+        # recurse into the smaller side, loop on the larger: stack depth stays O(log n)
+        if p - lo < hi - p:
+            _introsort(a, lo, p, depth)
+            lo = p
+        else:
+            _introsort(a, p, hi, depth)
+            hi = p
+    _insertion(a, lo, hi)
+
+
+def intro_sort(arr: List[Any]) -> List[Any]:
+    """
+    Introsort: in-place quicksort with median-of-three pivots, a heapsort
+    fallback once recursion gets too deep, and insertion sort for small
+    partitions. Not stable. Returns a new sorted list (the only allocation).
+    """
+    a = list(arr)
+    n = len(a)
+    if n > 1:
+        _introsort(a, 0, n, 2 * n.bit_length())
+    return a
+
+
+def hybrid_merge_sort(arr: List[Any], buf: Optional[List[Any]] = None) -> List[Any]:
+    """
+    Stable bottom-up merge sort: insertion-sorted runs of INSERTION_CUTOFF
+    elements, then merge passes that ping-pong between the list and one
+    scratch buffer instead of slicing at every level.
+    `buf` may be passed in to reuse a scratch list across calls.
+    Returns a new sorted list.
+    """
+    a = list(arr)
+    n = len(a)
+    if n <= 1:
+        return a
+    for lo in range(0, n, INSERTION_CUTOFF):
+        _insertion(a, lo, min(lo + INSERTION_CUTOFF, n))
+    if n <= INSERTION_CUTOFF:
+        return a
+
+    own_buf = buf is None or len(buf) < n
+    if own_buf:
+        buf = [None] * n
+    src, dst = a, buf
+    width = INSERTION_CUTOFF
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+
+    if src is a:
+        return a
+    if own_buf:
+        # the result already lives in our private scratch list
+        return src
+    a[:] = src[:n]
+    return a
@@ -1,12 +1,15 @@
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
-def insertion_sort(arr: List[Any]) -> List[Any]:
+def insertion_sort(arr: List[Any], check: Optional[Callable[[], None]] = None) -> List[Any]:
     """
     Insertion sort: good for small or nearly-sorted data.
     Returns a new sorted list.
+    check: optional callable run before every insertion (e.g. a deadline check that raises).
     """
     a = list(arr)
     for i in range(1, len(a)):
+        if check is not None:
+            check()
         key = a[i]
         j = i - 1
         while j >= 0 and a[j] > key:
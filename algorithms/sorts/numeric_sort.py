@@ -0,0 +1,79 @@
+from array import array
+from collections import Counter
+from typing import List, Any, Optional
+
+from algorithms.sorts.hybrid_sort import intro_sort
+
+_FLOAT_EXACT = 2 ** 53  # ints beyond this lose precision as doubles
+
+
+def as_typed_array(values: List[Any]) -> Optional[array]:
+    """
+    Pack homogeneous numeric input into an 8-byte-per-element buffer:
+    array('q') for ints that fit in 64 bits, array('d') for floats (or ints
+    mixed with floats that a double represents exactly).
+    Returns None for anything else (strings, bools, mixed types, huge ints).
+    """
+    types = set(map(type, values))
+    if types <= {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return None
+    if types <= {int, float}:
+        if int in types and any(type(v) is int and not -_FLOAT_EXACT <= v <= _FLOAT_EXACT
+                                for v in values):
+            return None
+        return array("d", values)
+    return None
+
+
+def counting_sort(a: array) -> array:
+    """
+    Counting sort for integer buffers. Counts with a C-level Counter and
+    only orders the distinct values, so cost is O(n + k log k).
+    """
+    counts = Counter(a)
+    out = array(a.typecode)
+    for v in sorted(counts):
+        out.extend(array(a.typecode, (v,)) * counts[v])
+    return out
+
+
+def _small_range(a: array) -> bool:
+    return a.typecode == "q" and len(a) > 1 and max(a) - min(a) < len(a)
+
+
+def sort_typed_array(a: array, values: Optional[List[Any]] = None) -> array:
+    """
+    Sort a typed buffer. Integer data whose value range is no wider than the
+    input goes through counting_sort; everything else uses the built-in C
+    sort, which beats a pure-Python radix sort by a wide margin.
+    Pass the original list as `values` if the caller still holds it, so the
+    C sort runs on the existing objects instead of re-boxing the buffer.
+    """
+    if _small_range(a):
+        return counting_sort(a)
+    return array(a.typecode, sorted(a if values is None else values))
+
+
+def numeric_sort(arr: List[Any]) -> List[Any]:
+    """
+    Sort with a numeric fast path. The input is already a list of boxed
+    numbers, so it is sorted as it is rather than packed into a typed buffer
+    first (which would add 8 bytes per element and save nothing):
+    small-range ints are counting-sorted, other int/float input goes to the
+    built-in C sort, and anything else falls back to intro_sort.
+    Returns a new sorted list.
+    """
+    types = set(map(type, arr))
+    if not types <= {int, float}:
+        return intro_sort(arr)
+    if types == {int} and len(arr) > 1 and max(arr) - min(arr) < len(arr):
+        # one object per distinct value; the output only repeats references
+        counts = Counter(arr)
+        out: List[Any] = []
+        for v in sorted(counts):
+            out += [v] * counts[v]
+        return out
+    return sorted(arr)
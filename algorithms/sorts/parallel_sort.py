@@ -0,0 +1,122 @@
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import List, Any, Optional, Sequence, Tuple
+
+from algorithms.process_pools import drop_pool, get_pool
+from algorithms.sorts.numeric_sort import as_typed_array, numeric_sort
+
+DEFAULT_THRESHOLD = 100_000  # below this many elements a pool costs more than it saves
+
+
+def _sort_shard(shm_name: str, typecode: str, lo: int, hi: int) -> None:
+    """Worker: sort buf[lo:hi] of the shared buffer in place."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            view[lo:hi] = array(typecode, sorted(view[lo:hi]))
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _merge_part(src_name: str, dst_name: str, typecode: str,
+                ranges: Sequence[Tuple[int, int]], out: int) -> None:
+    """
+    Worker: merge the sorted runs src[lo:hi] for each (lo, hi) in `ranges`
+    and write the result to dst starting at `out`. The built-in sort finds
+    the runs already in order and only merges them.
+    """
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        src_view, dst_view = src.buf.cast(typecode), dst.buf.cast(typecode)
+        try:
+            merged = array(typecode)
+            for lo, hi in ranges:
+                merged.extend(src_view[lo:hi])
+            dst_view[out:out + len(merged)] = array(typecode, sorted(merged))
+        finally:
+            src_view.release()
+            dst_view.release()
+    finally:
+        src.close()
+        dst.close()
+
+
+def _splitters(view: memoryview, shards: List[Tuple[int, int]], parts: int) -> List[Any]:
+    """parts - 1 values that cut the union of the sorted shards into parts of about equal size."""
+    samples = sorted(view[lo + (hi - lo) * k // parts]
+                     for lo, hi in shards if hi > lo for k in range(parts))
+    return [samples[len(samples) * k // parts] for k in range(1, parts)]
+
+
+def parallel_sort(arr: List[Any], workers: Optional[int] = None,
+                  threshold: int = DEFAULT_THRESHOLD) -> List[Any]:
+    """
+    Parallel sample-merge sort for numeric input.
+    The values are packed into a multiprocessing.shared_memory buffer, so
+    workers read and write them in place without pickling. Each worker sorts
+    one shard; then splitter values sampled from the sorted shards cut every
+    shard (by bisection) into one range per worker, and each worker merges
+    its ranges into its own slice of a second buffer.
+    The pool is started once per worker count and reused across calls.
+    Inputs smaller than `threshold`, single-worker setups and anything but
+    all-int or all-float values (so that element types are preserved) use
+    numeric_sort in the calling process.
+    Returns a new sorted list.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    typed = as_typed_array(arr) if n >= threshold and workers > 1 else None
+    if typed is None or (typed.typecode == "d" and any(type(v) is int for v in arr)):
+        return numeric_sort(arr)
+
+    tc, size = typed.typecode, n * typed.itemsize
+    src = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        dst = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            src.buf[:size] = memoryview(typed).cast("B")
+            del typed
+            pool = get_pool(workers)
+            width = -(-n // workers)
+            shards = [(lo, min(lo + width, n)) for lo in range(0, n, width)]
+            try:
+                for job in [pool.submit(_sort_shard, src.name, tc, lo, hi) for lo, hi in shards]:
+                    job.result()
+
+                view = src.buf.cast(tc)
+                try:
+                    # cuts[i][k]: where part k starts in shard i
+                    splitters = _splitters(view, shards, workers)
+                    cuts = [[lo] + [bisect_left(view, s, lo, hi) for s in splitters] + [hi]
+                            for lo, hi in shards]
+                finally:
+                    view.release()
+                jobs, out = [], 0
+                for k in range(workers):
+                    ranges = [(c[k], c[k + 1]) for c in cuts if c[k + 1] > c[k]]
+                    if ranges:
+                        jobs.append(pool.submit(_merge_part, src.name, dst.name, tc, ranges, out))
+                        out += sum(hi - lo for lo, hi in ranges)
+                for job in jobs:
+                    job.result()
+            except BrokenProcessPool:
+                # a worker died; the next call starts a fresh pool
+                drop_pool(workers)
+                raise
+
+            result = array(tc)
+            result.frombytes(dst.buf[:size])
+            return result.tolist()
+        finally:
+            dst.close()
+            dst.unlink()
+    finally:
+        src.close()
+        src.unlink()
@@ -0,0 +1,87 @@
+from itertools import chain
+from typing import List, Any, Iterable
+import heapq
+
+from algorithms.sorts.hybrid_sort import INSERTION_CUTOFF, _heapsort, _insertion, _partition
+
+
+def top_k(arr: Iterable[Any], k: int, largest: bool = False) -> List[Any]:
+    """
+    The k smallest (or largest) elements in sorted order, using a heap that
+    never holds more than k items: O(n log k) instead of a full heap sort.
+    """
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, arr) if largest else heapq.nsmallest(k, arr)
+
+
+def _select(a: List[Any], k: int) -> None:
+    """
+    Introselect: rearrange `a` in place so a[k] is the k-th smallest element,
+    a[:k] <= a[k] <= a[k+1:]. Quickselect with median-of-three pivots, falling
+    back to heapsort on the remaining range if partitioning keeps going badly.
+    """
+    lo, hi = 0, len(a)
+    depth = 2 * len(a).bit_length()
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(a, lo, hi)
+            return
+        depth -= 1
+        p = _partition(a, lo, hi)
+        if k < p:
+            hi = p
+        else:
+            lo = p
+    _insertion(a, lo, hi)
+
+
+def nth_element(arr: List[Any], n: int) -> Any:
+    """
+    The n-th smallest element (0-based) in expected O(len(arr)) time.
+    Raises IndexError if n is out of range.
+    """
+    if not 0 <= n < len(arr):
+        raise IndexError("nth_element index out of range")
+    a = list(arr)
+    _select(a, n)
+    return a[n]
+
+
+def median(arr: List[Any]) -> Any:
+    """
+    Median via introselect. For an even count of numbers this is the mean of
+    the two middle values; for other values (strings, ...) it is the lower
+    of the two.
+    """
+    n = len(arr)
+    if n == 0:
+        raise ValueError("median of an empty list")
+    a = list(arr)
+    mid = n // 2
+    _select(a, mid)
+    if n % 2:
+        return a[mid]
+    # introselect leaves everything below the upper middle in a[:mid]
+    lower, upper = max(a[:mid]), a[mid]
+    if isinstance(lower, (int, float)) and isinstance(upper, (int, float)):
+        return (lower + upper) / 2
+    return lower
+
+
+class StreamingTopK:
+    """
+    Top-k over input that arrives in chunks: only k items are ever kept
+    between chunks, so memory is O(k + chunk size).
+    """
+
+    def __init__(self, k: int, largest: bool = False):
+        self.k = k
+        self.largest = largest
+        self._items: List[Any] = []
+
+    def push(self, chunk: Iterable[Any]) -> None:
+        self._items = top_k(chain(self._items, chunk), self.k, self.largest)
+
+    def result(self) -> List[Any]:
+        return list(self._items)
@@ -1,13 +1,16 @@
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
-def selection_sort(arr: List[Any]) -> List[Any]:
+def selection_sort(arr: List[Any], check: Optional[Callable[[], None]] = None) -> List[Any]:
     """
     Selection sort: repeatedly select min and place at front.
     Returns a new sorted list.
+    check: optional callable run before every pass (e.g. a deadline check that raises).
     """
     a = list(arr)
     n = len(a)
     for i in range(n):
+        if check is not None:
+            check()
         min_idx = i
         for j in range(i+1, n):
             if a[j] < a[min_idx]:
@@ -0,0 +1,98 @@
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton: a trie of all patterns plus failure links, so one
+    left-to-right pass over the text finds every occurrence of every pattern
+    in O(len(text) + matches), however many patterns there are.
+    Build it once and reuse it for many texts. Duplicate patterns are kept once.
+    `check` (optional, here and in find_all / search) is called every 1024
+    patterns and states while building and every 65536 characters while
+    scanning, e.g. a deadline check that raises.
+    """
+
+    __slots__ = ("patterns", "lengths", "goto", "fail", "out", "link")
+
+    def __init__(self, patterns: Sequence[str], check: Optional[Callable[[], None]] = None):
+        if any(not isinstance(p, str) or not p for p in patterns):
+            raise ValueError("Patterns must be non-empty strings")
+        self.patterns = list(dict.fromkeys(patterns))
+        self.lengths = [len(p) for p in self.patterns]
+        # trie: goto[state] maps a character to the next state; out[state]
+        # lists the patterns (by index) that end exactly at that state
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            if check is not None and not idx & 1023:
+                check()
+            s = 0
+            for ch in pattern:
+                nxt = goto[s].get(ch)
+                if nxt is None:
+                    nxt = goto[s][ch] = len(goto)
+                    goto.append({})
+                    out.append([])
+                s = nxt
+            out[s].append(idx)
+
+        # fail[state]: longest proper suffix that is also a trie state;
+        # link[state]: nearest state along the fail chain that ends a pattern
+        fail = [0] * len(goto)
+        link = [-1] * len(goto)
+        queue = deque(goto[0].values())
+        visited = 0
+        while queue:
+            s = queue.popleft()
+            visited += 1
+            if check is not None and not visited & 1023:
+                check()
+            for ch, t in goto[s].items():
+                f = fail[s]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[t] = goto[f].get(ch, 0)
+                link[t] = fail[t] if out[fail[t]] else link[fail[t]]
+                queue.append(t)
+        self.goto, self.fail, self.out, self.link = goto, fail, out, link
+
+    @property
+    def num_states(self) -> int:
+        return len(self.goto)
+
+    @property
+    def nbytes(self) -> int:
+        # a small dict and three list slots per state, plus the pattern strings
+        return 250 * len(self.goto) + sum(self.lengths)
+
+    def find_all(self, text: str, check: Optional[Callable[[], None]] = None) -> Iterator[Tuple[int, int]]:
+        """Yield (start index, pattern index) for every match, overlapping ones included, by end position."""
+        goto, fail, out, link, lengths = self.goto, self.fail, self.out, self.link, self.lengths
+        s = 0
+        for i, ch in enumerate(text):
+            if check is not None and not i & 65535:
+                check()
+            while True:
+                nxt = goto[s].get(ch)
+                if nxt is not None:
+                    s = nxt
+                    break
+                if s == 0:
+                    break
+                s = fail[s]
+            t = s if out[s] else link[s]
+            while t != -1:
+                for idx in out[t]:
+                    yield i - lengths[idx] + 1, idx
+                t = link[t]
+
+    def search(self, text: str, check: Optional[Callable[[], None]] = None) -> Dict[str, List[int]]:
+        """Start indices of every occurrence, per pattern (patterns with no match map to [])."""
+        found: Dict[str, List[int]] = {p: [] for p in self.patterns}
+        patterns = self.patterns
+        for start, idx in self.find_all(text, check):
+            found[patterns[idx]].append(start)
+        for positions in found.values():
+            positions.sort()
+        return found
@@ -0,0 +1,133 @@
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+Text = Union[str, bytes, bytearray, memoryview]
+
+# memoryviews are searched in copied blocks of this many bytes
+NATIVE_BLOCK = 1 << 20
+
+
+def compile_bmh(pattern: Sequence) -> Dict[Any, int]:
+    """
+    Horspool bad-character table: for each character of pattern[:-1], how
+    far the window may slide when that character is under its last cell.
+    Characters not in the table allow a full len(pattern) shift.
+    """
+    m = len(pattern)
+    return {c: m - 1 - i for i, c in enumerate(pattern[:m - 1])}
+
+def bmh_search(text: Union[str, bytes], pattern: Union[str, bytes],
+               shift: Optional[Dict[Any, int]] = None) -> int:
+    """
+    Boyer-Moore-Horspool search. Returns index of first match or -1.
+    Only the last character of each window is examined in Python; a full
+    comparison (text.startswith, no slice) runs only when it matches, and the
+    window then jumps by the bad-character shift, often len(pattern) at once.
+    Pass shift=compile_bmh(pattern) to skip rebuilding the table.
+    """
+    n = len(text); m = len(pattern)
+    if m == 0:
+        return 0
+    if shift is None:
+        shift = compile_bmh(pattern)
+    get = shift.get
+    last = pattern[m - 1]
+    i = m - 1  # index of the window's last character
+    while i < n:
+        c = text[i]
+        if c == last and text.startswith(pattern, i - m + 1):
+            return i - m + 1
+        i += get(c, m)
+    return -1
+
+def _maximal_suffix(x: Sequence, reverse: bool) -> Tuple[int, int]:
+    """Start (minus one) and period of the maximal suffix of x under < (or > if reverse)."""
+    m = len(x)
+    ms, j, k, p = -1, 0, 1, 1
+    while j + k < m:
+        a, b = x[j + k], x[ms + k]
+        if (a > b) if reverse else (a < b):
+            j += k
+            k = 1
+            p = j - ms
+        elif a == b:
+            if k != p:
+                k += 1
+            else:
+                j += p
+                k = 1
+        else:
+            ms = j
+            j = ms + 1
+            k = p = 1
+    return ms, p
+
+def two_way_search(text: Union[str, bytes], pattern: Union[str, bytes]) -> int:
+    """
+    Crochemore-Perrin two-way search. Returns index of first match or -1.
+    The pattern is split at a critical factorization; the right part is
+    matched left to right and the left part right to left. Worst case
+    O(n + m) time with O(1) extra space (no table), unlike Horspool's O(n*m).
+    """
+    n = len(text); m = len(pattern)
+    if m == 0:
+        return 0
+    x, y = pattern, text
+    i, p = _maximal_suffix(x, False)
+    j, q = _maximal_suffix(x, True)
+    ell, per = (i, p) if i > j else (j, q)
+
+    if x[:ell + 1] == x[per:per + ell + 1]:
+        # periodic pattern: remember how much of the left part already matched
+        pos, memory = 0, -1
+        while pos <= n - m:
+            i = max(ell, memory) + 1
+            while i < m and x[i] == y[i + pos]:
+                i += 1
+            if i >= m:
+                i = ell
+                while i > memory and x[i] == y[i + pos]:
+                    i -= 1
+                if i <= memory:
+                    return pos
+                pos += per
+                memory = m - per - 1
+            else:
+                pos += i - ell
+                memory = -1
+    else:
+        per = max(ell + 1, m - ell - 1) + 1
+        pos = 0
+        while pos <= n - m:
+            i = ell + 1
+            while i < m and x[i] == y[i + pos]:
+                i += 1
+            if i >= m:
+                i = ell
+                while i >= 0 and x[i] == y[i + pos]:
+                    i -= 1
+                if i < 0:
+                    return pos
+                pos += per
+            else:
+                pos += i - ell
+    return -1
+
+def native_search(text: Text, pattern: Union[str, bytes], start: int = 0) -> int:
+    """
+    First match at or after start, found by the C-level str/bytes find (a
+    two-way / Horspool hybrid in CPython). memoryviews are scanned in
+    overlapping blocks, so a large buffer is never copied whole.
+    """
+    if not isinstance(text, memoryview):
+        return text.find(pattern, start)
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return start if start <= n else -1
+    block = max(NATIVE_BLOCK, 2 * m)
+    pos = start
+    while pos + m <= n:
+        i = text[pos:pos + block].tobytes().find(pattern)
+        if i != -1:
+            return pos + i
+        pos += block - m + 1
+    return -1
@@ -1,6 +1,6 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Sequence
 
-def _compute_lps(pattern: str) -> List[int]:
+def _compute_lps(pattern: Sequence) -> List[int]:
     m = len(pattern)
     lps = [0] * m
     length = 0
@@ -18,14 +18,20 @@ def _compute_lps(pattern: str) -> List[int]:
                 i += 1
     return lps
 
-def kmp_search(text: str, pattern: str) -> int:
+def compile_kmp(pattern: Sequence) -> List[int]:
+    """Failure (LPS) table for pattern, reusable across kmp_search calls."""
+    return _compute_lps(pattern)
+
+def kmp_search(text: str, pattern: str, lps: Optional[List[int]] = None) -> int:
     """
     Knuth-Morris-Pratt pattern search. Returns index of first match or -1.
+    Pass lps=compile_kmp(pattern) to skip rebuilding the table.
     """
     n = len(text); m = len(pattern)
     if m == 0:
         return 0
-    lps = _compute_lps(pattern)
+    if lps is None:
+        lps = _compute_lps(pattern)
     i = j = 0
     while i < n:
         if text[i] == pattern[j]:
@@ -38,3 +44,29 @@ def kmp_search(text: str, pattern: str) -> int:
             else:
                 i += 1
     return -1
+
+def kmp_search_all(chunks: Iterable[Sequence], pattern: Sequence,
+                   lps: Optional[List[int]] = None) -> Iterator[int]:
+    """
+    Every match (overlaps included) of pattern in a text given as consecutive
+    chunks, all str or all bytes like the pattern. Yields absolute start
+    indices lazily. Only the match length carries over between chunks, so a
+    match spanning a boundary is found and memory does not grow with the text.
+    """
+    m = len(pattern)
+    if m == 0:
+        return
+    if lps is None:
+        lps = _compute_lps(pattern)
+    j = 0
+    offset = 0
+    for chunk in chunks:
+        for i, c in enumerate(chunk):
+            while j and c != pattern[j]:
+                j = lps[j-1]
+            if c == pattern[j]:
+                j += 1
+                if j == m:
+                    yield offset + i - m + 1
+                    j = lps[j-1]
+        offset += len(chunk)
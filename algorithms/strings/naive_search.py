@@ -1,11 +1,16 @@
-def naive_search(text: str, pattern: str) -> int:
+from typing import Callable, Optional
+
+def naive_search(text: str, pattern: str, check: Optional[Callable[[], None]] = None) -> int:
     """
     Naive substring search: returns starting index of first occurrence or -1.
+    check: optional callable run every 4096 positions (e.g. a deadline check that raises).
     """
     n = len(text); m = len(pattern)
     if m == 0:
         return 0
     for i in range(n - m + 1):
+        if check is not None and not i & 4095:
+            check()
         if text[i:i+m] == pattern:
             return i
     return -1
@@ -1,8 +1,33 @@
-def rabin_karp(text: str, pattern: str, base=256, mod=101) -> int:
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Mersenne prime modulus: a spurious hash match between two different
+# windows has probability about 1 / 2^61
+MOD = (1 << 61) - 1
+# one digit per Unicode code point, so distinct strings have distinct
+# hashes before the modulus is applied
+BASE = 0x110000
+
+def _codes(s: Union[str, bytes]) -> Sequence[int]:
+    """Character codes of a str, or the bytes themselves (which index as ints)."""
+    return list(map(ord, s)) if isinstance(s, str) else s
+
+def compile_rabin_karp(pattern: Union[str, bytes], base: int = BASE, mod: int = MOD) -> Tuple[int, int]:
+    """
+    Rolling-hash state for pattern: (pattern hash, base^(m-1) % mod).
+    Reusable across rabin_karp calls with the same base and mod.
+    """
+    hpattern = 0
+    for c in _codes(pattern):
+        hpattern = (base * hpattern + c) % mod
+    return hpattern, pow(base, max(len(pattern) - 1, 0), mod)
+
+def rabin_karp(text: str, pattern: str, base: int = BASE, mod: int = MOD,
+               compiled: Optional[Tuple[int, int]] = None) -> int:
     """
     Rabin-Karp string search using rolling hash.
     Returns index of first occurrence or -1.
-    Default mod is a small prime for demonstration; in production pick a large prime.
+    Pass compiled=compile_rabin_karp(pattern, base, mod) to skip hashing the
+    pattern. Every hash match is still verified, so results are exact.
     """
     n = len(text); m = len(pattern)
     if m == 0:
@@ -10,15 +35,9 @@ def rabin_karp(text: str, pattern: str, base=256, mod=101) -> int:
     if m > n:
         return -1
 
-    hpattern = 0
+    hpattern, h = compiled if compiled is not None else compile_rabin_karp(pattern, base, mod)
     htext = 0
-    h = 1  # base^(m-1) % mod
-
-    for i in range(m - 1):
-        h = (h * base) % mod
-
     for i in range(m):
-        hpattern = (base * hpattern + ord(pattern[i])) % mod
         htext = (base * htext + ord(text[i])) % mod
 
     for i in range(n - m + 1):
@@ -28,6 +47,35 @@ def rabin_karp(text: str, pattern: str, base=256, mod=101) -> int:
                 return i
         if i < n - m:
             htext = (base * (htext - ord(text[i]) * h) + ord(text[i+m])) % mod
-            if htext < 0:
-                htext += mod
     return -1
+
+def rabin_karp_all(chunks: Iterable[Union[str, bytes]], pattern: Union[str, bytes],
+                   base: int = BASE, mod: int = MOD,
+                   compiled: Optional[Tuple[int, int]] = None) -> Iterator[int]:
+    """
+    Every match (overlaps included) of pattern in a text given as consecutive
+    chunks, all str or all bytes like the pattern. Yields absolute start
+    indices lazily. The rolling hash and the last len(pattern) characters
+    carry over between chunks, so memory does not grow with the text.
+    """
+    m = len(pattern)
+    if m == 0:
+        return
+    hpattern, h = compiled if compiled is not None else compile_rabin_karp(pattern, base, mod)
+    tail = pattern[:0]
+    htext = 0
+    seen = 0  # characters hashed so far
+    for chunk in chunks:
+        # buf = end of the previous chunk + this one, so a window can span both
+        buf = tail + chunk
+        codes = _codes(buf)
+        start = seen - len(tail)  # absolute index of buf[0]
+        for k in range(len(tail), len(buf)):
+            if seen >= m:
+                htext = (base * (htext - codes[k-m] * h) + codes[k]) % mod
+            else:
+                htext = (base * htext + codes[k]) % mod
+            seen += 1
+            if htext == hpattern and seen >= m and buf[k-m+1:k+1] == pattern:
+                yield start + k - m + 1
+        tail = buf[-m:]
@@ -0,0 +1,238 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# index file: header, then the text padded to 8 bytes, then the suffix
+# array and the LCP array as native int64s
+_MAGIC = b"SUFXARR1"
+_HEADER = struct.Struct("<8sqq")  # magic, version, text length
+# suffix sorting starts from prefixes of this many bytes (one 64-bit key each)
+_PREFIX = 8
+
+
+def _prefix_keys(text: bytes) -> array:
+    """
+    The first 8 bytes of every suffix as a big-endian unsigned 64-bit key,
+    zero-padded past the end of the text. Built with 8 strided copies of
+    the text, so no object is created per suffix.
+    """
+    n = len(text)
+    padded = bytes(text) + bytes(_PREFIX)
+    keys = array("Q", bytes(8 * n))
+    for r in range(min(_PREFIX, n)):
+        # the 8-byte words starting at r, r + 8, r + 16, ...
+        words = array("Q", padded[r:r + 8 * len(range(r, n, _PREFIX))])
+        if sys.byteorder == "little":
+            words.byteswap()
+        keys[r::_PREFIX] = words
+    return keys
+
+
+def _dense_ranks(sa: List[int], key: Sequence[int]) -> Tuple[array, int]:
+    """Rank of each suffix in sorted order, equal keys sharing a rank; also returns the top rank."""
+    rank = array("q", bytes(8 * len(sa)))
+    r = 0
+    prev = key[sa[0]]
+    for i in sa:
+        k = key[i]
+        if k != prev:
+            r += 1
+            prev = k
+        rank[i] = r
+    return rank, r
+
+
+def build_suffix_array(text: bytes, check: Optional[Callable[[], None]] = None) -> array:
+    """
+    Suffix array of text by prefix doubling: suffixes are sorted by their
+    first 8 bytes, then 16, 32, ... until every rank is distinct. Each round
+    is one built-in sort on an integer key, O(n log n); typical text needs
+    only a few rounds (about log2 of the longest repeated substring).
+    Keys and ranks live in int64 arrays rather than lists of objects.
+    `check` (optional) is called before every round, e.g. a deadline check
+    that raises.
+    """
+    n = len(text)
+    if n == 0:
+        return array("q")
+    k = _PREFIX
+    if check is not None:
+        check()
+    key = _prefix_keys(text)
+    # zero padding makes a suffix tie with longer ones that continue with
+    # zero bytes; sorts are stable, so starting from the shortest suffix
+    # keeps the shorter (smaller) one first in any tie left at the end
+    sa = sorted(range(n - 1, -1, -1), key=key.__getitem__)
+    rank, top = _dense_ranks(sa, key)
+    while top < n - 1 and k < n:
+        if check is not None:
+            check()
+        # key orders by (rank of the first k bytes, rank of the next k bytes)
+        key = array("q", (rank[i] * (n + 1) + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)))
+        sa.sort(key=key.__getitem__)
+        rank, top = _dense_ranks(sa, key)
+        k *= 2
+    return array("q", sa)
+
+
+def build_lcp(text: bytes, sa: Sequence[int], check: Optional[Callable[[], None]] = None) -> array:
+    """
+    Kasai's algorithm: lcp[i] = common prefix length of suffixes sa[i - 1]
+    and sa[i] (lcp[0] = 0). `check` is called every 65536 suffixes.
+    """
+    n = len(text)
+    rank = [0] * n
+    for i, s in enumerate(sa):
+        rank[s] = i
+    lcp = array("q", bytes(8 * n))
+    h = 0
+    for i in range(n):
+        if check is not None and not i & 65535:
+            check()
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = sa[r - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[r] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+class SuffixIndex:
+    """
+    Suffix array + LCP over a byte text, answering substring queries in
+    O(m log n) by binary search over the sorted suffixes.
+    `text` may be bytes or an mmap, and `sa` / `lcp` arrays or memoryviews,
+    so an index loaded with `open_index` is shared through the page cache.
+    """
+
+    def __init__(self, text, sa: Sequence[int], lcp: Sequence[int], version: int = 1):
+        self.text = text
+        self.sa = sa
+        self.lcp = lcp
+        self.version = version
+        self._file = None
+
+    @classmethod
+    def build(cls, text: bytes, version: int = 1, check: Optional[Callable[[], None]] = None) -> "SuffixIndex":
+        sa = build_suffix_array(text, check)
+        return cls(text, sa, build_lcp(text, sa, check), version)
+
+    def __len__(self) -> int:
+        return len(self.sa)
+
+    def _range(self, pattern: bytes) -> Tuple[int, int]:
+        """[lo, hi) range of suffix array rows whose suffix starts with pattern."""
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            s = sa[mid]
+            if text[s:s + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            s = sa[mid]
+            if text[s:s + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def count(self, pattern: bytes) -> int:
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def locate(self, pattern: bytes, limit: Optional[int] = None) -> List[int]:
+        """Sorted start offsets of pattern (the first `limit` of them, if given)."""
+        lo, hi = self._range(pattern)
+        positions = sorted(self.sa[lo:hi])
+        return positions if limit is None else positions[:limit]
+
+    def first(self, pattern: bytes) -> int:
+        """Smallest start offset of pattern, or -1."""
+        lo, hi = self._range(pattern)
+        return min(self.sa[lo:hi]) if hi > lo else -1
+
+    def longest_repeat(self) -> Tuple[int, int]:
+        """(offset, length) of the longest substring that occurs at least twice."""
+        lcp = self.lcp
+        if len(lcp) == 0:
+            return -1, 0
+        row = max(range(len(lcp)), key=lcp.__getitem__)
+        return (self.sa[row], lcp[row]) if lcp[row] else (-1, 0)
+
+    def save(self, path: str) -> None:
+        """Write the index to path atomically (readers never see a partial file)."""
+        n = len(self.sa)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.version, n))
+            f.write(bytes(self.text[:n]))
+            f.write(bytes(-n % 8))
+            f.write(memoryview(array("q", self.sa)).cast("B"))
+            f.write(memoryview(array("q", self.lcp)).cast("B"))
+        os.replace(tmp, path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sa.release()
+            self.lcp.release()
+            self.text.close()
+            self._file.close()
+            self._file = None
+
+
+def open_index(path: str) -> SuffixIndex:
+    """Memory-map an index written by SuffixIndex.save. Nothing is copied into the heap."""
+    f = open(path, "rb")
+    try:
+        size = os.fstat(f.fileno()).st_size
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        f.close()
+        raise
+    magic, version, n = _HEADER.unpack_from(mm, 0)
+    text_end = _HEADER.size + n
+    sa_start = text_end + (-n % 8)
+    if magic != _MAGIC or size != sa_start + 16 * n:
+        mm.close()
+        f.close()
+        raise ValueError(f"{path} is not a suffix array index")
+    view = memoryview(mm)
+    sa = view[sa_start:sa_start + 8 * n].cast("q")
+    lcp = view[sa_start + 8 * n:sa_start + 16 * n].cast("q")
+    view.release()
+    index = SuffixIndex(_TextView(mm, _HEADER.size, n), sa, lcp, version)
+    index._file = f
+    return index
+
+
+class _TextView:
+    """Slices of the text region of an mmap'd index, returned as bytes."""
+
+    __slots__ = ("mm", "start", "n")
+
+    def __init__(self, mm: mmap.mmap, start: int, n: int):
+        self.mm, self.start, self.n = mm, start, n
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, key: slice) -> bytes:
+        lo, hi, _ = key.indices(self.n)
+        return self.mm[self.start + lo:self.start + max(lo, hi)]
+
+    def close(self) -> None:
+        self.mm.close()
@@ -1,13 +1,20 @@
 # app.py
-from flask import Flask, request, jsonify
+import json
+import os
+import time
+from functools import partial
+from itertools import chain, islice
+from math import inf
+from flask import Flask, Response, g as request_state, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from typing import Any, Dict
 
 # --- IMPORT SEARCH ALGORITHMS ---
-from algorithms.searches.linear_search import linear_search
-from algorithms.searches.binary_search import binary_search
+from algorithms.searches.linear_search import linear_search, linear_search_many
+from algorithms.searches.binary_search import binary_search, binary_search_many
 from algorithms.searches.jump_search import jump_search
-from algorithms.searches.interpolation_search import interpolation_search
-from algorithms.searches.exponential_search import exponential_search
+from algorithms.searches.interpolation_search import interpolation_search, interpolation_search_many
+from algorithms.searches.exponential_search import exponential_search, exponential_search_many
 from algorithms.searches.fibonacci_search import fibonacci_search
 
 # --- IMPORT SORT ALGORITHMS ---
@@ -17,65 +24,409 @@ from algorithms.sorts.insertion_sort import insertion_sort
 from algorithms.sorts.merge_sort import merge_sort
 from algorithms.sorts.quick_sort import quick_sort
 from algorithms.sorts.heap_sort import heap_sort
+from algorithms.sorts.hybrid_sort import intro_sort, hybrid_merge_sort
+from algorithms.sorts.numeric_sort import numeric_sort
+from algorithms.sorts.external_sort import external_sort, MIN_MEMORY as EXTERNAL_SORT_MIN_MEMORY
+from algorithms.sorts.partial_sort import top_k, nth_element, median, StreamingTopK
+from algorithms.sorts.parallel_sort import parallel_sort, DEFAULT_THRESHOLD
 
 # --- IMPORT GRAPH ALGORITHMS ---
-from algorithms.graphs.bfs import bfs
-from algorithms.graphs.dfs import dfs
-from algorithms.graphs.dijkstra import dijkstra
+from algorithms.graphs.bfs import bfs, bfs_csr, bfs_iter, bfs_levels
+from algorithms.graphs.dfs import dfs, dfs_csr, dfs_iter
+from algorithms.graphs.dijkstra import (
+    dijkstra, dijkstra_csr, dijkstra_to, dijkstra_csr_to, reconstruct_path,
+    bidirectional_dijkstra, bidirectional_dijkstra_csr
+)
+from algorithms.graphs.all_pairs import many_to_many
 from algorithms.graphs.astar import a_star
+from algorithms.graphs.csr import compile_graph
+from algorithms.graphs.grid_astar import Grid, grid_a_star
 
 # --- IMPORT STRING ALGORITHMS ---
 from algorithms.strings.naive_search import naive_search
-from algorithms.strings.kmp_search import kmp_search
-from algorithms.strings.rabin_karp import rabin_karp
+from algorithms.strings.kmp_search import kmp_search, kmp_search_all
+from algorithms.strings.rabin_karp import rabin_karp, rabin_karp_all
+from algorithms.strings.bmh_search import bmh_search, two_way_search, native_search
+
+# --- IMPORT SERVICES ---
+from service.datasets import DatasetRegistry, DatasetTooLarge
+from service.graphs import GraphRegistry, GraphTooLarge
+from service.dynamic_graphs import DynamicGraphStore, DynamicGraphTooLarge
+from service.pattern_sets import PatternSetRegistry, PatternSetTooLarge
+from service.patterns import PatternCache
+from service.text_files import mmap_chunks, resolve as resolve_text_file
+from service.corpora import CorpusStore, CorpusTooLarge
+from service.walks import PausedWalk, WalkCursors
+from service.metrics import Registry, size_label
+from service.admission import (
+    COST_MODELS, AdmissionController, DeadlineExceeded, QueueFull, WorkTooLarge, n_log_n
+)
+from service.executor import PoolBusy, PoolTimeout, ProcessExecutor, call_with_stats
+from service import codecs
+from service.result_cache import ResultCache, cache_key
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that parses and serializes with orjson when it is installed
+    (falling back to the default one), and adds the time spent serializing
+    to the request's metrics.
+    """
+
+    def loads(self, s, **kwargs):
+        return codecs.loads(s) if not kwargs else super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            body = None
+            if len(args) == 1 and not kwargs and self.compact is not False and not self._app.debug:
+                body = codecs.dumps(args[0], self.default)
+            if body is None:
+                return super().response(*args, **kwargs)
+            return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+        finally:
+            if "serialize_seconds" in request_state:
+                request_state.serialize_seconds += time.perf_counter() - start
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
+metrics = Registry()
+admission = AdmissionController()
+executor = ProcessExecutor()
+result_cache = ResultCache()
+datasets = DatasetRegistry()
+graphs = GraphRegistry()
+dynamic_graphs = DynamicGraphStore()
+pattern_sets = PatternSetRegistry()
+compiled_patterns = PatternCache()
+corpora = CorpusStore()
+walk_cursors = WalkCursors()
+
+# Parallel sort: worker count defaults to the number of cores; smaller inputs stay in-process
+PARALLEL_SORT_WORKERS = int(os.environ.get("PARALLEL_SORT_WORKERS", os.cpu_count() or 1))
+PARALLEL_SORT_THRESHOLD = int(os.environ.get("PARALLEL_SORT_THRESHOLD", DEFAULT_THRESHOLD))
+
+# Many-to-many distance matrices: Dijkstra rows are spread over this many worker processes
+GRAPH_MATRIX_WORKERS = int(os.environ.get("GRAPH_MATRIX_WORKERS", os.cpu_count() or 1))
+
+# Algorithm calls whose estimated work is at least this run in the process pool
+# (EXECUTOR_WORKERS, default one per core); cheaper ones stay on the request thread
+OFFLOAD_MIN_WORK = int(os.environ.get("OFFLOAD_MIN_WORK", 1_000_000))
+
+# All-occurrences string search reads streamed request bodies in chunks of this many bytes
+STRING_STREAM_CHUNK = int(os.environ.get("STRING_STREAM_CHUNK", 1 << 20))
 
 # Helper: validate json
+# Besides JSON, bodies may be MessagePack (`application/msgpack`, needs the msgpack package) or
+# a bare numeric array: packed little-endian numbers (`application/octet-stream`, dtype from
+# `?dtype=` or `; dtype=`, default i8) or a .npy file (`application/x-npy`). A bare array
+# becomes the "array" field and the other fields come from the query string, e.g. ?target=5.
 def json_req():
-    data = request.get_json(force=True)
+    start = time.perf_counter()
+    try:
+        data = _read_body()
+    except codecs.UnsupportedFormat as e:
+        return None, ({"error": str(e)}, 415)
+    except ValueError as e:
+        return None, ({"error": f"Invalid body: {e}"}, 400)
+    request_state.parse_seconds = time.perf_counter() - start
+    request_state.request_json = data
+    if isinstance(data, dict) and (data.get("dataset_id") is not None or data.get("graph_id") is not None):
+        # stored datasets and graphs can change under the same request body
+        request_state.cacheable = False
     if data is None:
         return None, ({"error": "Invalid JSON body"}, 400)
     return data, None
 
+def _read_body():
+    media, params = codecs.media_type(request.content_type)
+    if media in (codecs.PACKED, codecs.NPY):
+        body = request.get_data(cache=False)
+        if media == codecs.NPY:
+            arr = codecs.read_npy(body)
+        else:
+            arr = codecs.unpack_array(body, params.get("dtype") or request.args.get("dtype", "i8"))
+        data = {key: _query_value(value) for key, value in request.args.items()}
+        data["array"] = arr.tolist()
+        data["dtype"] = codecs.dtype_of(arr)
+        # binary clients already have their array; don't echo it back unless asked
+        data.setdefault("echo", False)
+        return data
+    if media in codecs.MSGPACK:
+        return codecs.unpack_msgpack(request.get_data(cache=False))
+    return request.get_json(force=True)
+
+def _query_value(value: str) -> Any:
+    """Query-string values are read as JSON when they parse (?target=5, ?targets=[1,2]), else as text."""
+    try:
+        return codecs.loads(value)
+    except ValueError:
+        return value
+
+def _array_response(values, fmt: str, dtype=None, headers=None) -> Response:
+    """values as a packed little-endian array or a .npy file."""
+    start = time.perf_counter()
+    packed = codecs.to_array(values, dtype)
+    body = codecs.write_npy(packed) if fmt == codecs.NPY else codecs.pack_array(packed)
+    response = Response(body, mimetype=fmt, headers=headers)
+    if "serialize_seconds" in request_state:
+        request_state.serialize_seconds += time.perf_counter() - start
+    return response
+
+# --- METRICS ---
+# Latency of these endpoints is recorded per algorithm and input size, split into
+# parse / compute / serialize. Streamed responses are timed until the stream starts.
+INSTRUMENTED = {"search_route": "search", "sort_route": "sort", "graph_route": "graph", "string_route": "string"}
+
+def _operation_stats() -> Dict[str, int]:
+    """Dict the current request's algorithm adds its operation counts to (heap pushes, ...)."""
+    return request_state.setdefault("operations", {})
+
+@app.before_request
+def _start_timer():
+    if request.endpoint in INSTRUMENTED:
+        request_state.started = time.perf_counter()
+        request_state.parse_seconds = request_state.serialize_seconds = 0.0
+
+@app.after_request
+def _record_metrics(response):
+    endpoint = INSTRUMENTED.get(request.endpoint)
+    if endpoint is None or "started" not in request_state:
+        return response
+    total = time.perf_counter() - request_state.started
+    parse, serialize = request_state.parse_seconds, request_state.serialize_seconds
+    # only known algorithm names are used as labels (whatever the status), so clients
+    # cannot grow the series; a downgraded request is labelled with the algorithm that ran
+    ticket = request_state.get("ticket")
+    if ticket is not None:
+        algo = ticket.algorithm
+    else:
+        algo = (request.view_args or {}).get("algo", "")
+        if (endpoint, algo) not in COST_MODELS:
+            algo = "unknown"
+    labels = {"endpoint": endpoint, "algorithm": algo, "size": size_label(request_state.get("request_json"))}
+    metrics.requests.inc(dict(labels, status=str(response.status_code)))
+    metrics.latency.observe(labels, total)
+    for phase, seconds in (("parse", parse), ("compute", max(0.0, total - parse - serialize)),
+                           ("serialize", serialize)):
+        metrics.phases.observe(dict(labels, phase=phase), seconds)
+    for op, count in request_state.get("operations", {}).items():
+        metrics.operations.inc({"algorithm": algo, "op": op}, count)
+    return response
+
+# --- ADMISSION CONTROL ---
+# Every algorithm request is admitted by estimated work (see service/admission.py):
+# too expensive -> 413, expensive -> one of the low-priority slots (503 if none frees up in time),
+# and `"allow_downgrade": true` swaps a quadratic algorithm for an O(n log n) / O(n + m) one.
+def _admit(endpoint: str, algo: str, data: Dict[str, Any], n: int, m: int = 1, extra_work: float = 0):
+    """(ticket, None) if the request may run now, else (None, error response)."""
+    try:
+        ticket = admission.admit(endpoint, algo, n, m, extra_work,
+                                 bool(data.get("allow_downgrade")), data.get("deadline_ms"))
+        ticket.__enter__()
+    except WorkTooLarge as e:
+        return None, (jsonify({"error": str(e)}), 413)
+    except QueueFull as e:
+        return None, (jsonify({"error": str(e)}), 503, {"Retry-After": str(int(admission.low_priority_wait))})
+    # held until the response (including a streamed one) is finished
+    request_state.ticket = ticket
+    return ticket, None
+
+# streamed bodies are one number per line; a typical line is about this long
+BYTES_PER_LINE = 8
+
+def _stream_options() -> Dict[str, Any]:
+    """Admission options of a request whose body is a stream: taken from the query string."""
+    return {"deadline_ms": request.args.get("deadline_ms", type=float)}
+
+@app.teardown_request
+def _release_ticket(exc):
+    ticket = request_state.pop("ticket", None)
+    if ticket is not None:
+        ticket.__exit__(None, None, None)
+
+@app.errorhandler(DeadlineExceeded)
+def _deadline_exceeded(e):
+    return jsonify({"error": str(e)}), 503
+
+def _execute(ticket, func, *args, **kwargs):
+    """
+    Run an algorithm call for an admitted request: inline if its work is
+    small, otherwise in the process pool so it does not hold the GIL that
+    the request threads share.
+    """
+    if ticket.work < OFFLOAD_MIN_WORK:
+        return func(*args, **kwargs)
+    return executor.run(func, *args, timeout=ticket.deadline.remaining() + 1, **kwargs)
+
+@app.errorhandler(PoolBusy)
+def _pool_busy(e):
+    return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
+@app.errorhandler(PoolTimeout)
+def _pool_timeout(e):
+    return jsonify({"error": str(e)}), 504
+
+@app.route("/executor", methods=["GET"])
+def executor_route():
+    return jsonify(executor.describe()), 200
+
+@app.route("/admission", methods=["GET"])
+def admission_route():
+    return jsonify(admission.describe()), 200
+
+# --- RESULT CACHE ---
+# The instrumented endpoints are pure functions of (path, query, content type, Accept, body), so
+# finished 200 responses are kept in a cache shared by all worker processes (service/result_cache.py).
+# A hit is answered before the body is parsed; `X-Cache: hit` / `miss` tells which one it was.
+@app.before_request
+def _cached_response():
+    endpoint = INSTRUMENTED.get(request.endpoint)
+    if endpoint is None or request.method != "POST" or not result_cache.enabled:
+        return None
+    key = cache_key((request.path.encode(), request.query_string, (request.content_type or "").encode(),
+                     request.headers.get("Accept", "").encode(), request.get_data()))
+    hit = result_cache.get(key)
+    metrics.cache.inc({"endpoint": endpoint, "result": "hit" if hit else "miss"})
+    if hit is None:
+        request_state.cache_key = key
+        return None
+    status, headers, body = hit
+    response = Response(body, status=status, headers=headers)
+    response.headers["X-Cache"] = "hit"
+    return response
+
+@app.after_request
+def _store_result(response):
+    key = request_state.get("cache_key")
+    if key is None:
+        return response
+    response.headers["X-Cache"] = "miss"
+    if response.status_code == 200 and not response.is_streamed and request_state.get("cacheable", True):
+        headers = [(name, value) for name, value in response.headers.items()
+                   if name == "Content-Type" or name.startswith("X-")]
+        result_cache.put(key, response.status_code, headers, response.get_data())
+    return response
+
+@app.route("/result-cache", methods=["GET", "DELETE"])
+def result_cache_route():
+    if request.method == "DELETE":
+        return jsonify({"removed": result_cache.clear()}), 200
+    return jsonify(result_cache.describe()), 200
+
+@app.route("/metrics", methods=["GET"])
+def metrics_route():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+# --- DATASET ENDPOINTS ---
+# Upload an array once and search it by `dataset_id` instead of re-posting it.
+@app.route("/datasets", methods=["POST"])
+def dataset_create():
+    data, err = json_req()
+    if err:
+        return err
+    arr = data.get("array")
+    if not isinstance(arr, list):
+        return jsonify({"error": "Please provide 'array' field"}), 400
+    # sorted in C in one call, so only admission bounds it
+    _, err = _admit("datasets", "create", data, len(arr))
+    if err:
+        return err
+    try:
+        ds = datasets.put(arr, data.get("dataset_id"))
+    except DatasetTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except TypeError:
+        return jsonify({"error": "Array elements must be mutually comparable"}), 400
+    return jsonify(ds.describe()), 201
+
+@app.route("/datasets/<dataset_id>", methods=["GET", "DELETE"])
+def dataset_item(dataset_id: str):
+    if request.method == "DELETE":
+        if not datasets.delete(dataset_id):
+            return jsonify({"error": f"Unknown dataset '{dataset_id}'"}), 404
+        return jsonify({"deleted": dataset_id}), 200
+    ds = datasets.get(dataset_id)
+    if ds is None:
+        return jsonify({"error": f"Unknown dataset '{dataset_id}'"}), 404
+    return jsonify(ds.describe()), 200
+
 # --- SEARCH ENDPOINTS ---
 # We support `/search/<algo>` where algo is one of: linear,binary,jump,interpolation,exponential,fibonacci
+# Post `targets: [...]` instead of `target` to look up many values in one call.
 @app.route("/search/<algo>", methods=["POST"])
 def search_route(algo: str):
     data, err = json_req()
     if err:
         return err
     arr = data.get("array")
+    dataset_id = data.get("dataset_id")
     target = data.get("target")
-    if arr is None or target is None:
-        return jsonify({"error": "Please provide 'array' and 'target' fields"}), 400
+    targets = data.get("targets")
+    if (arr is None and dataset_id is None) or (target is None and targets is None):
+        return jsonify({"error": "Please provide 'array' (or 'dataset_id') and 'target' (or 'targets') fields"}), 400
+    if targets is not None and not isinstance(targets, list):
+        return jsonify({"error": "'targets' must be a list"}), 400
 
-    # mapping
+    # mapping: algo -> (single search, batched search or None, requires sorted)
     algo_map = {
-        "linear": (linear_search, False),
-        "binary": (binary_search, True),
-        "jump": (jump_search, True),
-        "interpolation": (interpolation_search, True),
-        "exponential": (exponential_search, True),
-        "fibonacci": (fibonacci_search, True)
+        "linear": (linear_search, linear_search_many, False),
+        "binary": (binary_search, binary_search_many, True),
+        "jump": (jump_search, None, True),
+        "interpolation": (interpolation_search, interpolation_search_many, True),
+        "exponential": (exponential_search, exponential_search_many, True),
+        "fibonacci": (fibonacci_search, None, True)
     }
 
     if algo not in algo_map:
         return jsonify({"error": f"Unknown search algorithm '{algo}'"}), 404
 
-    func, requires_sorted = algo_map[algo]
+    func, batch_func, requires_sorted = algo_map[algo]
 
-    arr_input = list(arr)
-    arr_used = sorted(arr_input) if requires_sorted else arr_input
+    if dataset_id is not None:
+        # stored datasets are already sorted, so every algorithm runs on them directly
+        ds = datasets.get(dataset_id)
+        if ds is None:
+            return jsonify({"error": f"Unknown dataset '{dataset_id}'"}), 404
+        version = data.get("version")
+        if version is not None and version != ds.version:
+            return jsonify({"error": f"Dataset '{dataset_id}' is at version {ds.version}"}), 409
+        _, err = _admit("search", algo, data, len(ds.data), len(targets) if targets is not None else 1)
+        if err:
+            return err
+        arr_used = ds.data
+        response = {
+            "algorithm": algo,
+            "dataset_id": ds.dataset_id,
+            "version": ds.version,
+            "sorted_used": True
+        }
+    else:
+        arr_input = list(arr)
+        _, err = _admit("search", algo, data, len(arr_input), len(targets) if targets is not None else 1,
+                        n_log_n(len(arr_input)) if requires_sorted else 0)
+        if err:
+            return err
+        arr_used = sorted(arr_input) if requires_sorted else arr_input
+        response = {
+            "algorithm": algo,
+            "sorted_used": requires_sorted,
+            # "echo": false leaves the sorted copy of the input out of the response
+            "array_used": arr_used if requires_sorted and data.get("echo", True) else None
+        }
+
+    if targets is not None:
+        if batch_func is not None:
+            indices = batch_func(arr_used, targets)
+        else:
+            indices = [func(arr_used, t) for t in targets]
+        response["indices"] = indices
+        response["found_count"] = sum(1 for i in indices if i != -1)
+        return jsonify(response), 200
 
     index = func(arr_used, target)
-    response = {
-        "algorithm": algo,
-        "sorted_used": requires_sorted,
-        "array_used": arr_used if requires_sorted else None,
-        "index": index,
-        "found": index != -1
-    }
+    response["index"] = index
+    response["found"] = index != -1
     return jsonify(response), 200
 
 # --- SORT ENDPOINTS ---
@@ -94,23 +445,510 @@ def sort_route(algo: str):
         "insertion": insertion_sort,
         "merge": merge_sort,
         "quick": quick_sort,
-        "heap": heap_sort
+        "heap": heap_sort,
+        "intro": intro_sort,
+        "hybrid_merge": hybrid_merge_sort,
+        "numeric": numeric_sort,
+        "parallel": partial(parallel_sort, workers=PARALLEL_SORT_WORKERS,
+                            threshold=PARALLEL_SORT_THRESHOLD)
     }
 
     if algo not in algo_map:
         return jsonify({"error": f"Unknown sort algorithm '{algo}'"}), 404
 
+    ticket, err = _admit("sort", algo, data, len(arr))
+    if err:
+        return err
+    algo = ticket.algorithm
     func = algo_map[algo]
-    sorted_arr = func(list(arr))
-    return jsonify({"algorithm": algo, "sorted": sorted_arr}), 200
+    if algo == "parallel":
+        # already spreads the work over its own processes
+        sorted_arr = func(list(arr))
+    elif algo in ("bubble", "selection", "insertion"):
+        sorted_arr = _execute(ticket, func, list(arr), check=ticket.deadline.check)
+    else:
+        sorted_arr = _execute(ticket, func, list(arr))
+    # `Accept: application/octet-stream` or `application/x-npy` returns the sorted array as binary
+    fmt = codecs.negotiate(request.headers.get("Accept", ""))
+    if fmt is not None:
+        headers = {"X-Algorithm": algo}
+        if ticket.downgraded_from is not None:
+            headers["X-Downgraded-From"] = ticket.downgraded_from
+        try:
+            return _array_response(sorted_arr, fmt, data.get("dtype"), headers), 200
+        except (TypeError, ValueError, OverflowError) as e:
+            return jsonify({"error": f"Result cannot be sent as {fmt}: {e}"}), 406
+    response = {"algorithm": algo, "sorted": sorted_arr}
+    if ticket.downgraded_from is not None:
+        response["downgraded_from"] = ticket.downgraded_from
+    return jsonify(response), 200
+
+# External sort: the body is streamed as one number per line and never held in memory at once.
+# Peak memory is EXTERNAL_SORT_MEMORY_BYTES, or `?max_memory=<bytes>` per request.
+EXTERNAL_SORT_MEMORY = int(os.environ.get("EXTERNAL_SORT_MEMORY_BYTES", 64 * 1024 * 1024))
+
+def _parse_number(line: bytes):
+    try:
+        return int(line)
+    except ValueError:
+        return float(line)
+
+@app.route("/sort/external", methods=["POST"])
+def external_sort_route():
+    max_memory = request.args.get("max_memory", EXTERNAL_SORT_MEMORY, type=int)
+    if max_memory < EXTERNAL_SORT_MIN_MEMORY:
+        return jsonify({"error": f"'max_memory' must be at least {EXTERNAL_SORT_MIN_MEMORY} bytes"}), 400
+    ticket, err = _admit("sort", "external", _stream_options(), (request.content_length or 0) // BYTES_PER_LINE)
+    if err:
+        return err
+
+    def values():
+        for i, line in enumerate(request.stream):
+            if not i & 4095:
+                ticket.deadline.check()
+            line = line.strip()
+            if line:
+                yield _parse_number(line)
+
+    result = external_sort(values(), max_memory)
+    try:
+        # run the read/spill phase now so bad input still gets a 400
+        first = next(result, None)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def lines():
+        if first is None:
+            return
+        yield f"{first}\n"
+        for v in result:
+            yield f"{v}\n"
+
+    return Response(stream_with_context(lines()), mimetype="text/plain"), 200
+
+# --- SELECTION ENDPOINTS ---
+# `/select/<op>` where op is one of: topk,nth,median
+@app.route("/select/<op>", methods=["POST"])
+def select_route(op: str):
+    data, err = json_req()
+    if err:
+        return err
+    arr = data.get("array")
+    if arr is None:
+        return jsonify({"error": "Please provide 'array' field"}), 400
+
+    if op not in ("topk", "nth", "median"):
+        return jsonify({"error": f"Unknown selection operation '{op}'"}), 404
+    try:
+        return _select(op, arr, data)
+    except TypeError:
+        return jsonify({"error": "Array elements must be mutually comparable"}), 400
+
+def _select(op: str, arr: list, data: Dict[str, Any]):
+    if op == "topk":
+        k = data.get("k")
+        if not isinstance(k, int) or isinstance(k, bool):
+            return jsonify({"error": "Please provide an integer 'k' field"}), 400
+        largest = bool(data.get("largest", False))
+        _, err = _admit("select", op, data, len(arr), max(1, k))
+        if err:
+            return err
+        return jsonify({"operation": op, "k": k, "largest": largest,
+                        "result": top_k(arr, k, largest)}), 200
+
+    if op == "nth":
+        n = data.get("n")
+        if not isinstance(n, int) or isinstance(n, bool) or not 0 <= n < len(arr):
+            return jsonify({"error": "Please provide an integer 'n' within the array bounds"}), 400
+        _, err = _admit("select", op, data, len(arr))
+        if err:
+            return err
+        return jsonify({"operation": op, "n": n, "result": nth_element(arr, n)}), 200
+
+    if not arr:
+        return jsonify({"error": "Cannot take the median of an empty array"}), 400
+    _, err = _admit("select", op, data, len(arr))
+    if err:
+        return err
+    return jsonify({"operation": op, "result": median(arr)}), 200
+
+# Streaming top-k: one number per line in the body, consumed in chunks; only k values are kept.
+SELECT_STREAM_CHUNK = 10_000
+
+@app.route("/select/topk/stream", methods=["POST"])
+def topk_stream_route():
+    k = request.args.get("k", type=int)
+    if k is None:
+        return jsonify({"error": "Please provide an integer 'k' query parameter"}), 400
+    largest = request.args.get("largest", "false").lower() in ("1", "true", "yes")
+    ticket, err = _admit("select", "topk", _stream_options(),
+                         (request.content_length or 0) // BYTES_PER_LINE, max(1, k))
+    if err:
+        return err
+    top = StreamingTopK(k, largest)
+    chunk = []
+    try:
+        for line in request.stream:
+            line = line.strip()
+            if line:
+                chunk.append(_parse_number(line))
+                if len(chunk) >= SELECT_STREAM_CHUNK:
+                    top.push(chunk)
+                    chunk = []
+                    ticket.deadline.check()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    top.push(chunk)
+    return jsonify({"operation": "topk", "k": k, "largest": largest, "result": top.result()}), 200
 
 # --- GRAPH ENDPOINTS ---
+# Register a graph once (compiled to CSR arrays) and run bfs/dfs/dijkstra on it by `graph_id`.
+@app.route("/graphs", methods=["POST"])
+def graph_create():
+    data, err = json_req()
+    if err:
+        return err
+    graph = data.get("graph")
+    if not isinstance(graph, dict):
+        return jsonify({"error": "Please provide 'graph' field"}), 400
+    ticket, err = _admit("graphs", "create", data, *_graph_size(data))
+    if err:
+        return err
+    try:
+        stored = graphs.put(graph, data.get("graph_id"), ticket.deadline.check)
+    except GraphTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (TypeError, ValueError):
+        return jsonify({"error": "Graph must map nodes to neighbor lists or {neighbor: weight} dicts"}), 400
+    return jsonify(stored.describe()), 201
+
+@app.route("/graphs/<graph_id>", methods=["GET", "DELETE"])
+def graph_item(graph_id: str):
+    if request.method == "DELETE":
+        if not graphs.delete(graph_id):
+            return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+        return jsonify({"deleted": graph_id}), 200
+    stored = graphs.get(graph_id)
+    if stored is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    return jsonify(stored.describe()), 200
+
+# Bounded / paged / streamed bfs & dfs: setting any of these keys (to something other than
+# null or false) switches to the lazy traversal
+WALK_OPTIONS = ("max_depth", "max_nodes", "cursor", "levels", "stream")
+
+def _walk_requested(data: Dict[str, Any]) -> bool:
+    return any(data.get(key) is not None and data.get(key) is not False for key in WALK_OPTIONS)
+
+def _walk_route(algo: str, neighbors, start: Any, data: Dict[str, Any], labels=None, check=None, graph=None):
+    """
+    Lazy bfs/dfs with `max_depth`, `max_nodes` (page size) and `cursor`
+    (the previous page's `next_cursor`). `levels` groups bfs output by
+    depth; `stream` sends NDJSON as nodes are discovered, ending with a
+    {"next_cursor": ...} line.
+    For a stored graph, `graph` is (graph_id, version) and next_cursor is
+    "<version>.<position>.<token>": the paused walk is kept server-side under
+    the token, so the next page resumes from its frontier. A cursor from
+    another version is refused with 409. Inline graphs (parsed in full on
+    every request anyway) use the number of nodes to skip as the cursor.
+    """
+    for key in ("max_depth", "max_nodes"):
+        value = data.get(key)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 0):
+            return jsonify({"error": f"'{key}' must be a non-negative integer"}), 400
+    levels = bool(data.get("levels"))
+    if levels and algo != "bfs":
+        return jsonify({"error": "'levels' is only supported for bfs"}), 400
+    max_nodes, max_depth, cursor = data.get("max_nodes"), data.get("max_depth"), data.get("cursor")
+
+    token = None
+    if isinstance(cursor, str) and graph is not None:
+        try:
+            version, position, token = cursor.split(".")
+            version, position = int(version), int(position)
+        except ValueError:
+            return jsonify({"error": "'cursor' must be a 'next_cursor' value from a previous page"}), 400
+        if version != graph[1]:
+            return jsonify({"error": f"Graph '{graph[0]}' is at version {graph[1]}; "
+                                     f"the cursor is from version {version}"}), 409
+    elif cursor is None or (isinstance(cursor, int) and not isinstance(cursor, bool) and cursor >= 0):
+        position = cursor or 0
+    else:
+        return jsonify({"error": "'cursor' must be a non-negative integer or a 'next_cursor' value"}), 400
+
+    key = (graph, algo, start, max_depth)
+    paused = walk_cursors.resume(token, key, position) if token is not None else None
+    if paused is None:
+        paused = PausedWalk(key)
+        walk = (bfs_iter if algo == "bfs" else dfs_iter)(neighbors, start, max_depth, paused.check)
+        if labels is not None:
+            walk = ((labels[v], depth) for v, depth in walk)
+        # traversal order is deterministic, so without a paused walk the cursor's nodes are skipped
+        skip = position
+    else:
+        walk, skip = paused.walk, 0
+    paused.deadline_check = check
+    page = islice(walk, skip, None if max_nodes is None else skip + max_nodes)
+
+    def next_cursor():
+        if max_nodes is None:
+            return None
+        peeked = next(walk, None)
+        if peeked is None:
+            return None
+        if graph is None:
+            return position + max_nodes
+        paused.position, paused.walk = position + max_nodes, chain([peeked], walk)
+        paused.deadline_check = None
+        return f"{graph[1]}.{paused.position}.{walk_cursors.pause(paused)}"
+
+    if data.get("stream"):
+        def lines():
+            if levels:
+                for depth, nodes in bfs_levels(page):
+                    yield json.dumps({"depth": depth, "nodes": nodes}) + "\n"
+            else:
+                for node, depth in page:
+                    yield json.dumps({"node": node, "depth": depth}) + "\n"
+            yield json.dumps({"next_cursor": next_cursor()}) + "\n"
+        return Response(stream_with_context(lines()), mimetype="application/x-ndjson"), 200
+
+    response: Dict[str, Any] = {"algorithm": algo}
+    if levels:
+        response["levels"] = [nodes for _, nodes in bfs_levels(page)]
+    else:
+        response["result"] = [node for node, _ in page]
+    response["next_cursor"] = next_cursor()
+    return jsonify(response), 200
+
+def _route_targets(data: Dict[str, Any]):
+    """Targets of a point-to-point query: [target], targets, or None for a full search."""
+    if data.get("target") is not None:
+        return [data["target"]]
+    targets = data.get("targets")
+    return targets if isinstance(targets, list) else None
+
+def _valid_node(node: Any) -> bool:
+    return isinstance(node, (str, int)) and not isinstance(node, bool)
+
+def _route_entry(target: Any, distance: float, path: list) -> Dict[str, Any]:
+    return {"target": target, "distance": distance if path else None, "path": path}
+
+def _point_to_point(start: Any, targets: list, bidirectional: bool, search_to, search_bidir):
+    """Answer a dijkstra query with targets: early exit, optional bidirectional search, paths."""
+    if bidirectional and len(targets) == 1:
+        distance, path = search_bidir(start, targets[0])
+        return [_route_entry(targets[0], distance, path)]
+    dist, pred = search_to(start, targets)
+    return [_route_entry(t, dist.get(t), reconstruct_path(pred, t)) for t in targets]
+
+def _stored_graph_route(algo: str, data: Dict[str, Any]):
+    graph_id = data["graph_id"]
+    stored = graphs.get(graph_id)
+    if stored is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    g = stored.csr
+    start = g.id_of(data.get("start"))
+    if start == -1:
+        return jsonify({"error": "Please provide a 'start' node that exists in the graph"}), 400
+    ticket, err = _admit("graph", algo, data, g.num_nodes, len(g.targets))
+    if err:
+        return err
+    response = {"algorithm": algo, "graph_id": graph_id, "version": stored.version}
+    targets = _route_targets(data)
+    check = ticket.deadline.check
+    if algo == "dijkstra" and targets is not None:
+        ids = [g.id_of(t) for t in targets]
+        if -1 in ids:
+            return jsonify({"error": "Every target must be a node of the graph"}), 400
+        results = _point_to_point(start, ids, bool(data.get("bidirectional")),
+                                  lambda s, t: dijkstra_csr_to(g, s, t, check),
+                                  lambda s, t: bidirectional_dijkstra_csr(g, s, t, check))
+        labels = g.labels
+        for entry in results:
+            entry["target"] = labels[entry["target"]]
+            entry["path"] = [labels[v] for v in entry["path"]]
+        response["results"] = results
+        return jsonify(response), 200
+    if algo == "dijkstra":
+        dist, stats = _execute(ticket, call_with_stats, dijkstra_csr, g, start, check=check)
+        _operation_stats().update(stats)
+        response["distances"] = dict(zip(g.labels, dist))
+    elif _walk_requested(data):
+        offsets, targets = g.offsets, g.targets
+        return _walk_route(algo, lambda v: targets[offsets[v]:offsets[v + 1]], start, data, g.labels, check,
+                           (graph_id, stored.version))
+    else:
+        func = bfs_csr if algo == "bfs" else dfs_csr
+        labels = g.labels
+        response["result"] = [labels[v] for v in _execute(ticket, func, g, start, check=check)]
+    return jsonify(response), 200
+
+@app.route("/graph/matrix", methods=["POST"])
+def graph_matrix_route():
+    """
+    Distance matrix from every node in `sources` to every node in `targets`
+    (default: all nodes), for an inline `graph` or a stored `graph_id`.
+    Streams NDJSON: a header line {"targets": [...]}, then one
+    {"source": s, "distances": [...]} line per source; unreachable is null.
+    """
+    data, err = json_req()
+    if err:
+        return err
+    if data.get("graph_id") is not None:
+        stored = graphs.get(data["graph_id"])
+        if stored is None:
+            return jsonify({"error": f"Unknown graph '{data['graph_id']}'"}), 404
+        g = stored.csr
+    else:
+        graph = data.get("graph")
+        if not isinstance(graph, dict):
+            return jsonify({"error": "Please provide 'graph' or 'graph_id' field"}), 400
+        try:
+            g = compile_graph(graph)
+        except (TypeError, ValueError):
+            return jsonify({"error": "Graph must map nodes to neighbor lists or {neighbor: weight} dicts"}), 400
+    sources = data.get("sources")
+    targets = data.get("targets", g.labels)
+    if not isinstance(sources, list) or not sources or not isinstance(targets, list):
+        return jsonify({"error": "Please provide 'sources' (and optionally 'targets') as lists of nodes"}), 400
+    source_ids = [g.id_of(s) for s in sources]
+    target_ids = [g.id_of(t) for t in targets]
+    if -1 in source_ids or -1 in target_ids:
+        return jsonify({"error": "Every source and target must be a node of the graph"}), 400
+    ticket, err = _admit("matrix", "dijkstra", data, len(source_ids), g.num_nodes + g.num_edges)
+    if err:
+        return err
+
+    def lines():
+        yield json.dumps({"targets": targets}) + "\n"
+        rows = many_to_many(g, source_ids, GRAPH_MATRIX_WORKERS)
+        try:
+            for source, (_, row) in zip(sources, rows):
+                ticket.deadline.check()
+                distances = [row[t] for t in target_ids]
+                yield json.dumps({"source": source,
+                                  "distances": [d if d != inf else None for d in distances]}) + "\n"
+        except DeadlineExceeded as e:
+            # the status line is already sent: end the stream with an error line
+            yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            rows.close()
+
+    return Response(stream_with_context(lines()), mimetype="application/x-ndjson"), 200
+
+# --- DYNAMIC GRAPH ENDPOINTS ---
+# Mutable graphs: edit edges in place; single-source Dijkstra results are cached and repaired.
+def _valid_weight(w: Any) -> bool:
+    return isinstance(w, (int, float)) and not isinstance(w, bool) and 0 <= w < inf
+
+@app.route("/dynamic-graphs", methods=["GET", "POST"])
+def dynamic_graph_create():
+    if request.method == "GET":
+        return jsonify({"graphs": sorted(dynamic_graphs.graphs.keys()), "cache": dynamic_graphs.stats()}), 200
+    data, err = json_req()
+    if err:
+        return err
+    graph = data.get("graph")
+    if not isinstance(graph, dict) or not all(isinstance(e, dict) for e in graph.values()):
+        return jsonify({"error": "Please provide 'graph' as node -> {neighbor: weight}"}), 400
+    if not all(_valid_weight(w) for edges in graph.values() for w in edges.values()):
+        return jsonify({"error": "Edge weights must be non-negative numbers"}), 400
+    _, err = _admit("dynamic", "create", data, len(graph), sum(len(e) for e in graph.values()))
+    if err:
+        return err
+    try:
+        g = dynamic_graphs.create(graph, data.get("graph_id"))
+    except DynamicGraphTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    return jsonify(g.describe()), 201
+
+@app.route("/dynamic-graphs/<graph_id>", methods=["GET", "DELETE"])
+def dynamic_graph_item(graph_id: str):
+    if request.method == "DELETE":
+        if not dynamic_graphs.delete(graph_id):
+            return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+        return jsonify({"deleted": graph_id}), 200
+    g = dynamic_graphs.get(graph_id)
+    if g is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    return jsonify(g.describe()), 200
+
+@app.route("/dynamic-graphs/<graph_id>/edges", methods=["POST"])
+def dynamic_graph_edges(graph_id: str):
+    """Body: {"edits": [{"op": "insert"|"reweight"|"delete", "u": .., "v": .., "w": ..}, ...]}"""
+    data, err = json_req()
+    if err:
+        return err
+    if dynamic_graphs.get(graph_id) is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    items = data.get("edits") or []
+    if not isinstance(items, list) or not all(isinstance(edit, dict) for edit in items):
+        return jsonify({"error": "'edits' must be a list of {op, u, v, w} objects"}), 400
+    _, err = _admit("dynamic", "edges", data, len(items))
+    if err:
+        return err
+    edits = []
+    for edit in items:
+        op = edit.get("op")
+        u, v, w = edit.get("u"), edit.get("v"), edit.get("w")
+        if op not in ("insert", "reweight", "delete") or not isinstance(u, (str, int)) or not isinstance(v, (str, int)):
+            return jsonify({"error": "Each edit needs 'op' (insert/reweight/delete), 'u' and 'v'"}), 400
+        if op != "delete" and not _valid_weight(w):
+            return jsonify({"error": "insert/reweight edits need a non-negative 'w'"}), 400
+        edits.append((u, v, None if op == "delete" else w))
+    try:
+        g = dynamic_graphs.update(graph_id, edits)
+    except DynamicGraphTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    if g is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    return jsonify(g.describe()), 200
+
+@app.route("/dynamic-graphs/<graph_id>/dijkstra", methods=["POST"])
+def dynamic_graph_dijkstra(graph_id: str):
+    data, err = json_req()
+    if err:
+        return err
+    g = dynamic_graphs.get(graph_id)
+    if g is None:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    start = data.get("start")
+    if not isinstance(start, (str, int)):
+        return jsonify({"error": "Please provide 'start' field"}), 400
+    ticket, err = _admit("dynamic", "dijkstra", data, len(g.out), g.num_edges)
+    if err:
+        return err
+    try:
+        distances, how = dynamic_graphs.shortest_paths(graph_id, start, ticket.deadline.check)
+    except KeyError:
+        return jsonify({"error": f"Unknown graph '{graph_id}'"}), 404
+    return jsonify({"algorithm": "dijkstra", "graph_id": graph_id, "version": g.version,
+                    "cache": how, "distances": distances}), 200
+
+def _graph_size(data: Dict[str, Any]):
+    """(nodes, edges) of the posted graph, neighbor lists or grid."""
+    spec = data.get("grid")
+    if isinstance(spec, dict):
+        try:
+            cells = int(spec["width"]) * int(spec["height"])
+        except (KeyError, TypeError, ValueError):
+            return 0, 0
+        return cells, 8 * cells
+    graph = data.get("graph", data.get("neighbors"))
+    if not isinstance(graph, dict):
+        return 0, 0
+    return len(graph), sum(len(edges) for edges in graph.values() if isinstance(edges, (list, dict)))
+
 @app.route("/graph/<algo>", methods=["POST"])
 def graph_route(algo: str):
     data, err = json_req()
     if err:
         return err
 
+    if data.get("graph_id") is not None and algo in ("bfs", "dfs", "dijkstra"):
+        return _stored_graph_route(algo, data)
+
     algo_map = {
         "bfs": bfs,
         "dfs": dfs,
@@ -122,13 +960,18 @@ def graph_route(algo: str):
         return jsonify({"error": f"Unknown graph algorithm '{algo}'"}), 404
 
     func = algo_map[algo]
+    ticket, err = _admit("graph", algo, data, *_graph_size(data))
+    if err:
+        return err
 
     if algo in ("bfs", "dfs"):
         graph = data.get("graph")
         start = data.get("start")
         if graph is None or start is None:
             return jsonify({"error": "Please provide 'graph' and 'start' fields"}), 400
-        result = func(graph, start)
+        if _walk_requested(data):
+            return _walk_route(algo, lambda v: graph.get(v, []), start, data, check=ticket.deadline.check)
+        result = _execute(ticket, func, graph, start, check=ticket.deadline.check)
         return jsonify({"algorithm": algo, "result": result}), 200
 
     if algo == "dijkstra":
@@ -136,9 +979,37 @@ def graph_route(algo: str):
         start = data.get("start")
         if graph is None or start is None:
             return jsonify({"error": "Please provide 'graph' and 'start' fields"}), 400
-        distances = func(graph, start)
+        # with `target`/`targets`: stop once they are settled and return paths
+        targets = _route_targets(data)
+        if targets is not None:
+            if not _valid_node(start) or not all(_valid_node(t) for t in targets):
+                return jsonify({"error": "'start' and 'target' / 'targets' must be node ids (strings or integers)"}), 400
+            check = ticket.deadline.check
+            results = _point_to_point(start, targets, bool(data.get("bidirectional")),
+                                      lambda s, t: dijkstra_to(graph, s, t, check),
+                                      lambda s, t: bidirectional_dijkstra(graph, s, t, check=check))
+            return jsonify({"algorithm": algo, "results": results}), 200
+        distances, stats = _execute(ticket, call_with_stats, func, graph, start, check=ticket.deadline.check)
+        _operation_stats().update(stats)
         return jsonify({"algorithm": algo, "distances": distances}), 200
 
+    if algo == "astar" and data.get("grid") is not None:
+        # grid mode: {"width", "height", "obstacles": flat 0/1 list or "0010..." string,
+        #             "costs"?: flat list, "diagonal"?: bool, "jump_points"?: bool}
+        spec = data["grid"]
+        start = data.get("start")
+        goal = data.get("goal")
+        if not (isinstance(start, list) and len(start) == 2 and isinstance(goal, list) and len(goal) == 2):
+            return jsonify({"error": "Please provide 'start' and 'goal' as [x, y]"}), 400
+        try:
+            grid = Grid(int(spec["width"]), int(spec["height"]), spec["obstacles"], spec.get("costs"))
+            cost, path = _execute(ticket, grid_a_star, grid, tuple(start), tuple(goal),
+                                  bool(spec.get("diagonal")), bool(spec.get("jump_points")))
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({"error": f"Invalid grid: {e}"}), 400
+        return jsonify({"algorithm": algo, "path": [list(c) for c in path],
+                        "cost": cost if path else None}), 200
+
     if algo == "astar":
         # expect a grid-like graph or adjacency + heuristic indicator
         start = data.get("start")
@@ -167,33 +1038,246 @@ def graph_route(algo: str):
             except Exception:
                 return 0
 
-        path = func(start, goal, neighbors_fn, heuristic_fn)
+        path = func(start, goal, neighbors_fn, heuristic_fn, _operation_stats())
         return jsonify({"algorithm": algo, "path": path}), 200
 
 # --- STRING ENDPOINTS ---
+# Register a keyword list once (compiled to an Aho-Corasick automaton) and scan texts by `pattern_set_id`.
+def _total_length(patterns: list) -> int:
+    return sum(len(p) for p in patterns if isinstance(p, str))
+
+@app.route("/pattern-sets", methods=["POST"])
+def pattern_set_create():
+    data, err = json_req()
+    if err:
+        return err
+    patterns = data.get("patterns")
+    if not isinstance(patterns, list) or not patterns:
+        return jsonify({"error": "Please provide 'patterns' field"}), 400
+    ticket, err = _admit("pattern-sets", "create", data, _total_length(patterns))
+    if err:
+        return err
+    try:
+        stored = pattern_sets.put(patterns, data.get("pattern_set_id"), ticket.deadline.check)
+    except PatternSetTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(stored.describe()), 201
+
+@app.route("/pattern-sets/<pattern_set_id>", methods=["GET", "DELETE"])
+def pattern_set_item(pattern_set_id: str):
+    if request.method == "DELETE":
+        if not pattern_sets.delete(pattern_set_id):
+            return jsonify({"error": f"Unknown pattern set '{pattern_set_id}'"}), 404
+        return jsonify({"deleted": pattern_set_id}), 200
+    stored = pattern_sets.get(pattern_set_id)
+    if stored is None:
+        return jsonify({"error": f"Unknown pattern set '{pattern_set_id}'"}), 404
+    return jsonify(stored.describe()), 200
+
+@app.route("/string/aho-corasick", methods=["POST"])
+def aho_corasick_route():
+    """Every occurrence of every pattern in one pass: {"text", "patterns" | "pattern_set_id"}."""
+    data, err = json_req()
+    if err:
+        return err
+    text = data.get("text")
+    if not isinstance(text, str):
+        return jsonify({"error": "Please provide 'text' field"}), 400
+    response: Dict[str, Any] = {"algorithm": "aho-corasick"}
+    if data.get("pattern_set_id") is not None:
+        stored = pattern_sets.get(data["pattern_set_id"])
+        if stored is None:
+            return jsonify({"error": f"Unknown pattern set '{data['pattern_set_id']}'"}), 404
+        ticket, err = _admit("string", "aho-corasick", data, len(text), sum(stored.automaton.lengths))
+        if err:
+            return err
+        automaton = stored.automaton
+        response.update(pattern_set_id=stored.pattern_set_id, version=stored.version)
+    else:
+        patterns = data.get("patterns")
+        if not isinstance(patterns, list) or not patterns:
+            return jsonify({"error": "Please provide 'patterns' or 'pattern_set_id' field"}), 400
+        if not all(isinstance(p, str) and p for p in patterns):
+            return jsonify({"error": "Patterns must be non-empty strings"}), 400
+        ticket, err = _admit("string", "aho-corasick", data, len(text), _total_length(patterns))
+        if err:
+            return err
+        automaton = compiled_patterns.aho_corasick(patterns, ticket.deadline.check)
+    matches = automaton.search(text, ticket.deadline.check)
+    response["matches"] = matches
+    response["total"] = sum(len(positions) for positions in matches.values())
+    return jsonify(response), 200
+
 @app.route("/string/<algo>", methods=["POST"])
 def string_route(algo: str):
     data, err = json_req()
     if err:
         return err
 
+    # compiled pattern state (KMP table, rolling hash) comes from the shared cache
     algo_map = {
         "naive": naive_search,
-        "kmp": kmp_search,
-        "rabin": rabin_karp
+        "kmp": lambda text, pattern: kmp_search(text, pattern, compiled_patterns.kmp(pattern)),
+        "rabin": lambda text, pattern: rabin_karp(text, pattern, compiled=compiled_patterns.rabin_karp(pattern)),
+        "bmh": lambda text, pattern: bmh_search(text, pattern, compiled_patterns.bmh(pattern)),
+        "two-way": two_way_search,
+        "native": native_search
     }
 
     if algo not in algo_map:
         return jsonify({"error": f"Unknown string algorithm '{algo}'"}), 404
 
-    func = algo_map[algo]
     text = data.get("text")
     pattern = data.get("pattern")
-    if text is None or pattern is None:
+    if not isinstance(text, str) or not isinstance(pattern, str):
         return jsonify({"error": "Please provide 'text' and 'pattern' fields"}), 400
+    ticket, err = _admit("string", algo, data, len(text), len(pattern))
+    if err:
+        return err
+    algo = ticket.algorithm
+    func = algo_map[algo]
+    if algo == "naive":
+        index = _execute(ticket, func, text, pattern, check=ticket.deadline.check)
+    else:
+        index = func(text, pattern)
+    response = {"algorithm": algo, "index": index, "found": index != -1}
+    if ticket.downgraded_from is not None:
+        response["downgraded_from"] = ticket.downgraded_from
+    return jsonify(response), 200
+
+@app.route("/string/<algo>/all", methods=["POST"])
+def string_all_route(algo: str):
+    """
+    Every occurrence of ?pattern= in the raw request body, or in the
+    server-side file ?file=<name>, read chunk by chunk. Streams one byte
+    offset per line (the pattern is matched as UTF-8).
+    """
+    algo_map = {
+        "kmp": lambda chunks, pattern: kmp_search_all(chunks, pattern, compiled_patterns.kmp(pattern)),
+        "rabin": lambda chunks, pattern: rabin_karp_all(chunks, pattern,
+                                                        compiled=compiled_patterns.rabin_karp(pattern))
+    }
+    if algo not in algo_map:
+        return jsonify({"error": f"Unknown streaming string algorithm '{algo}'"}), 404
+    pattern = request.args.get("pattern", "")
+    if not pattern:
+        return jsonify({"error": "Please provide a non-empty 'pattern' query parameter"}), 400
+    name = request.args.get("file")
+    if name is not None:
+        path = resolve_text_file(name)
+        if path is None:
+            return jsonify({"error": f"Unknown file '{name}'"}), 404
+        size = os.path.getsize(path)
+    else:
+        size = request.content_length or 0
+    pattern_bytes = pattern.encode("utf-8")
+    ticket, err = _admit("string", algo, _stream_options(), size, len(pattern_bytes))
+    if err:
+        return err
+    if name is not None:
+        chunks = mmap_chunks(path)
+    else:
+        chunks = iter(partial(request.stream.read, STRING_STREAM_CHUNK), b"")
+
+    def checked(chunks):
+        for chunk in chunks:
+            ticket.deadline.check()
+            yield chunk
+
+    matches = algo_map[algo](checked(chunks), pattern_bytes)
+
+    def lines():
+        try:
+            for index in matches:
+                yield f"{index}\n"
+        except DeadlineExceeded as e:
+            yield f"error: {e}\n"
+
+    return Response(stream_with_context(lines()), mimetype="text/plain"), 200
+
+# --- CORPUS ENDPOINTS ---
+# Upload a text once; it is indexed (suffix array + LCP) and saved as a memory-mapped file.
+@app.route("/corpora", methods=["POST"])
+def corpus_create():
+    data, err = json_req()
+    if err:
+        return err
+    text = data.get("text")
+    if not isinstance(text, str):
+        return jsonify({"error": "Please provide 'text' field"}), 400
+    encoded = text.encode("utf-8")
+    ticket, err = _admit("corpora", "create", data, len(encoded))
+    if err:
+        return err
+    try:
+        corpus_id, index = corpora.put(encoded, data.get("corpus_id"), ticket.deadline.check)
+    except CorpusTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(corpora.describe(corpus_id, index)), 201
 
-    index = func(text, pattern)
-    return jsonify({"algorithm": algo, "index": index, "found": index != -1}), 200
+@app.route("/corpora/<corpus_id>", methods=["GET", "DELETE"])
+def corpus_item(corpus_id: str):
+    try:
+        if request.method == "DELETE":
+            if not corpora.delete(corpus_id):
+                return jsonify({"error": f"Unknown corpus '{corpus_id}'"}), 404
+            return jsonify({"deleted": corpus_id}), 200
+        index = corpora.get(corpus_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if index is None:
+        return jsonify({"error": f"Unknown corpus '{corpus_id}'"}), 404
+    return jsonify(corpora.describe(corpus_id, index)), 200
+
+@app.route("/corpora/<corpus_id>/search", methods=["POST"])
+def corpus_search(corpus_id: str):
+    """
+    {"op": "count" | "locate" | "first", "pattern": ..., "limit"?: n} in
+    O(m log n), or {"op": "longest_repeat"}. Offsets are UTF-8 byte offsets.
+    """
+    data, err = json_req()
+    if err:
+        return err
+    try:
+        index = corpora.get(corpus_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if index is None:
+        return jsonify({"error": f"Unknown corpus '{corpus_id}'"}), 404
+    op = data.get("op", "count")
+    response: Dict[str, Any] = {"corpus_id": corpus_id, "version": index.version, "op": op}
+    if op == "longest_repeat":
+        _, err = _admit("corpus", op, data, len(index))
+        if err:
+            return err
+        response["index"], response["length"] = index.longest_repeat()
+        return jsonify(response), 200
+    if op not in ("count", "locate", "first"):
+        return jsonify({"error": f"Unknown corpus operation '{op}'"}), 404
+    pattern = data.get("pattern")
+    limit = data.get("limit")
+    if not isinstance(pattern, str) or not pattern:
+        return jsonify({"error": "Please provide a non-empty 'pattern' field"}), 400
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        return jsonify({"error": "'limit' must be a non-negative integer"}), 400
+    pattern_bytes = pattern.encode("utf-8")
+    # locate sorts the occurrences and first scans them: count them first (O(m log n))
+    occurrences = index.count(pattern_bytes) if op != "count" else 0
+    _, err = _admit("corpus", op, data, len(index), len(pattern_bytes),
+                    n_log_n(occurrences) if op == "locate" else occurrences)
+    if err:
+        return err
+    if op == "count":
+        response["count"] = index.count(pattern_bytes)
+    elif op == "locate":
+        response["indices"] = index.locate(pattern_bytes, limit)
+    else:
+        response["index"] = index.first(pattern_bytes)
+    return jsonify(response), 200
 
 # Root index
 @app.route("/", methods=["GET"])
@@ -201,10 +1285,20 @@ def index():
     return jsonify({
         "service": "search-algorithms-api",
         "endpoints": {
+            "datasets": ["/datasets", "/datasets/<dataset_id>"],
             "search": ["/search/linear", "/search/binary", "/search/jump", "/search/interpolation", "/search/exponential", "/search/fibonacci"],
-            "sort": ["/sort/bubble", "/sort/quick", "/sort/merge", "/sort/heap"],
-            "graph": ["/graph/bfs", "/graph/dijkstra", "/graph/astar"],
-            "string": ["/string/naive", "/string/kmp", "/string/rabin"]
+            "sort": ["/sort/bubble", "/sort/quick", "/sort/merge", "/sort/heap", "/sort/intro", "/sort/hybrid_merge", "/sort/numeric", "/sort/external", "/sort/parallel"],
+            "select": ["/select/topk", "/select/nth", "/select/median", "/select/topk/stream"],
+            "metrics": ["/metrics", "/admission", "/executor", "/result-cache"],
+            "graphs": ["/graphs", "/graphs/<graph_id>"],
+            "dynamic-graphs": ["/dynamic-graphs", "/dynamic-graphs/<graph_id>",
+                               "/dynamic-graphs/<graph_id>/edges", "/dynamic-graphs/<graph_id>/dijkstra"],
+            "graph": ["/graph/bfs", "/graph/dijkstra", "/graph/astar", "/graph/matrix"],
+            "corpora": ["/corpora", "/corpora/<corpus_id>", "/corpora/<corpus_id>/search"],
+            "pattern-sets": ["/pattern-sets", "/pattern-sets/<pattern_set_id>"],
+            "string": ["/string/naive", "/string/kmp", "/string/rabin", "/string/bmh",
+                       "/string/two-way", "/string/native", "/string/aho-corasick",
+                       "/string/kmp/all", "/string/rabin/all"]
         }
     }), 200
 
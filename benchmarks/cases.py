@@ -0,0 +1,254 @@
+import random
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from algorithms.searches.linear_search import linear_search
+from algorithms.searches.binary_search import binary_search, binary_search_many
+from algorithms.searches.jump_search import jump_search
+from algorithms.searches.interpolation_search import interpolation_search, interpolation_search_many
+from algorithms.searches.exponential_search import exponential_search, exponential_search_many
+from algorithms.searches.fibonacci_search import fibonacci_search
+from algorithms.sorts.bubble_sort import bubble_sort
+from algorithms.sorts.selection_sort import selection_sort
+from algorithms.sorts.insertion_sort import insertion_sort
+from algorithms.sorts.merge_sort import merge_sort
+from algorithms.sorts.quick_sort import quick_sort
+from algorithms.sorts.heap_sort import heap_sort
+from algorithms.sorts.hybrid_sort import intro_sort, hybrid_merge_sort
+from algorithms.sorts.numeric_sort import numeric_sort
+from algorithms.sorts.external_sort import external_sort
+from algorithms.sorts.parallel_sort import parallel_sort
+from algorithms.sorts.partial_sort import top_k, nth_element, median
+from algorithms.graphs.bfs import bfs, bfs_csr, bfs_iter
+from algorithms.graphs.dfs import dfs, dfs_csr, dfs_iter
+from algorithms.graphs.dijkstra import (
+    dijkstra, dijkstra_csr, dijkstra_to, bidirectional_dijkstra, bidirectional_dijkstra_csr
+)
+from algorithms.graphs.astar import a_star
+from algorithms.graphs.csr import compile_graph
+from algorithms.graphs.all_pairs import floyd_warshall_csr, many_to_many
+from algorithms.graphs.dynamic_sssp import DynamicSSSP
+from algorithms.graphs.grid_astar import Grid, grid_a_star
+from algorithms.strings.naive_search import naive_search
+from algorithms.strings.kmp_search import kmp_search, kmp_search_all
+from algorithms.strings.rabin_karp import rabin_karp, rabin_karp_all
+from algorithms.strings.bmh_search import bmh_search, two_way_search, native_search
+from algorithms.strings.aho_corasick import AhoCorasick
+from algorithms.strings.suffix_array import SuffixIndex, build_suffix_array
+
+from benchmarks.inputs import (
+    ARRAY_DISTRIBUTIONS, GRAPH_DISTRIBUTIONS, TEXT_DISTRIBUTIONS,
+    Counted, grid_obstacles, make_array, make_graph, make_text
+)
+
+# queries per search case: one timing covers this many lookups
+SEARCH_QUERIES = 200
+SEARCH_DISTRIBUTIONS = ("uniform", "skewed", "duplicates")
+STRING_CHUNK = 1 << 16
+
+
+class Case:
+    """
+    One benchmarked function.
+    make(size, distribution, rng) builds the input (not timed); run(input)
+    is the timed call and must leave its input unchanged. counted(input),
+    when given, wraps the input in Counted values so comparisons can be
+    counted; functions that need real numbers leave it out.
+    """
+
+    __slots__ = ("group", "name", "run", "make", "sizes", "distributions", "counted")
+
+    def __init__(self, group: str, name: str, run: Callable[[Any], Any],
+                 make: Callable[[int, str, random.Random], Any], sizes: Sequence[int],
+                 distributions: Sequence[str], counted: Optional[Callable[[Any], Any]] = None):
+        self.group = group
+        self.name = name
+        self.run = run
+        self.make = make
+        self.sizes = tuple(sizes)
+        self.distributions = tuple(distributions)
+        self.counted = counted
+
+
+# --- searches: (sorted array, targets) ---
+
+def _search_input(n: int, distribution: str, rng: random.Random) -> Tuple[List[int], List[int]]:
+    arr = sorted(make_array(n, distribution, rng))
+    # half the targets are present, half are random values that may be absent
+    targets = [rng.choice(arr) if i % 2 else rng.randrange(10 * n) for i in range(SEARCH_QUERIES)]
+    return arr, targets
+
+def _count_search(data: Tuple[List[int], List[int]]) -> Tuple[List[Counted], List[Counted]]:
+    arr, targets = data
+    return [Counted(v) for v in arr], [Counted(t) for t in targets]
+
+def _each(func: Callable) -> Callable[[Any], None]:
+    def run(data):
+        arr, targets = data
+        for t in targets:
+            func(arr, t)
+    return run
+
+def _batch(func: Callable) -> Callable[[Any], Any]:
+    return lambda data: func(*data)
+
+
+def search_cases() -> List[Case]:
+    big = (1_000, 100_000, 1_000_000)
+    cases = [Case("searches", "linear_search", _each(linear_search), _search_input,
+                  (1_000, 10_000, 100_000), SEARCH_DISTRIBUTIONS, _count_search)]
+    for func in (binary_search, jump_search, exponential_search, fibonacci_search):
+        cases.append(Case("searches", func.__name__, _each(func), _search_input,
+                          big, SEARCH_DISTRIBUTIONS, _count_search))
+    for func in (binary_search_many, exponential_search_many):
+        cases.append(Case("searches", func.__name__, _batch(func), _search_input,
+                          big, SEARCH_DISTRIBUTIONS, _count_search))
+    # interpolation search does arithmetic on the values, so no Counted wrapper
+    cases.append(Case("searches", "interpolation_search", _each(interpolation_search),
+                      _search_input, big, SEARCH_DISTRIBUTIONS))
+    cases.append(Case("searches", "interpolation_search_many", _batch(interpolation_search_many),
+                      _search_input, big, SEARCH_DISTRIBUTIONS))
+    return cases
+
+
+# --- sorts: one unsorted list ---
+
+def _count_list(arr: List[int]) -> List[Counted]:
+    return [Counted(v) for v in arr]
+
+
+def sort_cases() -> List[Case]:
+    cases = []
+    for func in (bubble_sort, selection_sort, insertion_sort):
+        cases.append(Case("sorts", func.__name__, func, make_array, (500, 2_000),
+                          ARRAY_DISTRIBUTIONS, _count_list))
+    for func in (merge_sort, quick_sort, heap_sort, intro_sort, hybrid_merge_sort):
+        cases.append(Case("sorts", func.__name__, func, make_array, (1_000, 10_000, 100_000),
+                          ARRAY_DISTRIBUTIONS, _count_list))
+    cases += [
+        Case("sorts", "numeric_sort", numeric_sort, make_array,
+             (10_000, 100_000, 1_000_000), ARRAY_DISTRIBUTIONS),
+        Case("sorts", "parallel_sort", lambda a: parallel_sort(a, threshold=0), make_array,
+             (100_000, 1_000_000), ARRAY_DISTRIBUTIONS),
+        # a budget of a quarter of the input forces about four spilled runs
+        Case("sorts", "external_sort", lambda a: list(external_sort(a, max_memory=16 * len(a))),
+             make_array, (10_000, 100_000), ARRAY_DISTRIBUTIONS),
+        Case("sorts", "top_k", lambda a: top_k(a, 10), make_array,
+             (10_000, 100_000, 1_000_000), ARRAY_DISTRIBUTIONS, _count_list),
+        Case("sorts", "nth_element", lambda a: nth_element(a, len(a) // 2), make_array,
+             (10_000, 100_000, 1_000_000), ARRAY_DISTRIBUTIONS, _count_list),
+        Case("sorts", "median", median, make_array, (10_000, 100_000, 1_000_000), ARRAY_DISTRIBUTIONS),
+    ]
+    return cases
+
+
+# --- graphs: (adjacency dict, CSR form, start, far target) ---
+
+def _graph_input(n: int, distribution: str, rng: random.Random):
+    graph = make_graph(n, distribution, rng)
+    return graph, compile_graph(graph), 0, max(graph)
+
+def _grid_input(n: int, distribution: str, rng: random.Random):
+    side, cells = grid_obstacles(n, rng)
+    return Grid(side, side, cells), (side - 1, side - 1)
+
+def _a_star(data) -> List[Any]:
+    graph, _, start, goal = data
+    return a_star(start, goal, lambda u: graph.get(u, {}).items(), lambda a, b: 0)
+
+def _csr(func: Callable) -> Callable[[Any], Any]:
+    return lambda data: func(data[1], data[1].id_of(data[2]))
+
+def _dynamic_input(n: int, distribution: str, rng: random.Random):
+    graph, _, start, _ = _graph_input(n, distribution, rng)
+    out = {u: dict(edges) for u, edges in graph.items()}
+    inn: dict = {}
+    for u, edges in graph.items():
+        for v, w in edges.items():
+            inn.setdefault(v, {})[u] = w
+            out.setdefault(v, {})
+    return DynamicSSSP(out, inn, start)
+
+def _repair(sssp: DynamicSSSP) -> None:
+    """Delete the start's first out-edge, repair, put it back, repair again."""
+    u = sssp.source
+    for v, w in list(sssp.out[u].items())[:1]:
+        del sssp.out[u][v]
+        del sssp.inn[v][u]
+        sssp.apply([(u, v, w, None)])
+        sssp.out[u][v] = sssp.inn[v][u] = w
+        sssp.apply([(u, v, None, w)])
+
+
+def graph_cases() -> List[Case]:
+    sizes = (1_000, 10_000, 100_000)
+    g = "graphs"
+    return [
+        Case(g, "bfs", lambda d: bfs(d[0], d[2]), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dfs", lambda d: dfs(d[0], d[2]), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "bfs_csr", _csr(bfs_csr), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dfs_csr", _csr(dfs_csr), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "bfs_iter", lambda d: sum(1 for _ in bfs_iter(lambda u: d[0].get(u, ()), d[2])),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dfs_iter", lambda d: sum(1 for _ in dfs_iter(lambda u: d[0].get(u, ()), d[2])),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dijkstra", lambda d: dijkstra(d[0], d[2]), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dijkstra_csr", _csr(dijkstra_csr), _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "dijkstra_to", lambda d: dijkstra_to(d[0], d[2], [d[3]]),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "bidirectional_dijkstra", lambda d: bidirectional_dijkstra(d[0], d[2], d[3]),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "bidirectional_dijkstra_csr",
+             lambda d: bidirectional_dijkstra_csr(d[1], d[1].id_of(d[2]), d[1].id_of(d[3])),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "a_star", _a_star, _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "grid_a_star", lambda d: grid_a_star(d[0], (0, 0), d[1], diagonal=True),
+             _grid_input, sizes, ("grid",)),
+        Case(g, "grid_a_star_jps", lambda d: grid_a_star(d[0], (0, 0), d[1], True, True),
+             _grid_input, sizes, ("grid",)),
+        Case(g, "many_to_many", lambda d: list(many_to_many(d[1], range(8), workers=1)),
+             _graph_input, sizes, GRAPH_DISTRIBUTIONS),
+        Case(g, "floyd_warshall_csr", lambda d: floyd_warshall_csr(d[1]),
+             _graph_input, (100, 250), GRAPH_DISTRIBUTIONS),
+        Case(g, "dynamic_sssp_repair", _repair, _dynamic_input, sizes, GRAPH_DISTRIBUTIONS),
+    ]
+
+
+# --- strings: (text, absent pattern) ---
+
+def _chunks(text: str) -> List[str]:
+    return [text[i:i + STRING_CHUNK] for i in range(0, len(text), STRING_CHUNK)]
+
+def _aho_input(n: int, distribution: str, rng: random.Random):
+    text, pattern = make_text(n, distribution, rng)
+    # 100 keywords: the absent pattern plus 99 random 8-grams of the text
+    words = [pattern] + [text[i:i + 8] for i in (rng.randrange(max(1, n - 8)) for _ in range(99))]
+    return AhoCorasick([w for w in words if w]), text
+
+def _index_input(n: int, distribution: str, rng: random.Random):
+    text, _ = make_text(n, distribution, rng)
+    data = text.encode()
+    queries = [data[i:i + 6] for i in (rng.randrange(max(1, n - 6)) for _ in range(1000))]
+    return SuffixIndex.build(data), queries
+
+
+def string_cases() -> List[Case]:
+    sizes = (10_000, 100_000, 1_000_000)
+    s = "strings"
+    cases = [Case(s, func.__name__, lambda d, f=func: f(*d), make_text, sizes, TEXT_DISTRIBUTIONS)
+             for func in (naive_search, kmp_search, rabin_karp, bmh_search, two_way_search, native_search)]
+    cases += [
+        Case(s, "kmp_search_all", lambda d: sum(1 for _ in kmp_search_all(_chunks(d[0]), d[1])),
+             make_text, sizes, TEXT_DISTRIBUTIONS),
+        Case(s, "rabin_karp_all", lambda d: sum(1 for _ in rabin_karp_all(_chunks(d[0]), d[1])),
+             make_text, sizes, TEXT_DISTRIBUTIONS),
+        Case(s, "aho_corasick", lambda d: d[0].search(d[1]), _aho_input, sizes, TEXT_DISTRIBUTIONS),
+        Case(s, "build_suffix_array", lambda d: build_suffix_array(d[0].encode()),
+             make_text, (10_000, 100_000), TEXT_DISTRIBUTIONS),
+        Case(s, "suffix_index_count", lambda d: [d[0].count(q) for q in d[1]],
+             _index_input, (10_000, 100_000), TEXT_DISTRIBUTIONS),
+    ]
+    return cases
+
+
+def all_cases() -> List[Case]:
+    return search_cases() + sort_cases() + graph_cases() + string_cases()
@@ -0,0 +1,118 @@
+import random
+from typing import Any, Dict, List, Tuple
+
+# Array distributions shared by the search and sort cases
+ARRAY_DISTRIBUTIONS = ("uniform", "skewed", "nearly_sorted", "reversed", "duplicates")
+GRAPH_DISTRIBUTIONS = ("random", "grid")
+TEXT_DISTRIBUTIONS = ("random", "dna", "periodic")
+
+
+def make_array(n: int, distribution: str, rng: random.Random) -> List[int]:
+    """n integers drawn from the named distribution."""
+    if distribution == "uniform":
+        return [rng.randrange(10 * n) for _ in range(n)]
+    if distribution == "skewed":
+        # most values crowd near zero, a long tail reaches 10n
+        return [int(10 * n * rng.random() ** 4) for _ in range(n)]
+    if distribution == "nearly_sorted":
+        a = sorted(rng.randrange(10 * n) for _ in range(n))
+        for _ in range(max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            a[i], a[j] = a[j], a[i]
+        return a
+    if distribution == "reversed":
+        return sorted((rng.randrange(10 * n) for _ in range(n)), reverse=True)
+    if distribution == "duplicates":
+        return [rng.randrange(16) for _ in range(n)]
+    raise ValueError(f"Unknown array distribution '{distribution}'")
+
+
+def make_graph(n: int, distribution: str, rng: random.Random) -> Dict[int, Dict[int, float]]:
+    """
+    Weighted directed graph with about n nodes, as node -> {neighbor: weight}.
+    "random": average out-degree 4. "grid": a sqrt(n) x sqrt(n) lattice with
+    edges in both directions between 4-neighbors and 20% of cells removed.
+    """
+    if distribution == "random":
+        return {u: {rng.randrange(n): rng.uniform(1, 10) for _ in range(4)} for u in range(n)}
+    if distribution == "grid":
+        side = max(2, int(n ** 0.5))
+        blocked = {rng.randrange(side * side) for _ in range(side * side // 5)} - {0}
+        graph: Dict[int, Dict[int, float]] = {}
+        for y in range(side):
+            for x in range(side):
+                u = y * side + x
+                if u in blocked:
+                    continue
+                edges = graph[u] = {}
+                for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                    v = ny * side + nx
+                    if 0 <= nx < side and 0 <= ny < side and v not in blocked:
+                        edges[v] = rng.uniform(1, 2)
+        return graph
+    raise ValueError(f"Unknown graph distribution '{distribution}'")
+
+
+def make_text(n: int, distribution: str, rng: random.Random) -> Tuple[str, str]:
+    """
+    (text, pattern) of length n where the pattern does not occur, so every
+    engine has to scan the whole text. "periodic" is the classic worst case
+    for naive search: "aaa...a" against "aa...ab".
+    """
+    if distribution == "random":
+        text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz     ") for _ in range(n))
+        return text, "qzxjvkwqzxjv"
+    if distribution == "dna":
+        text = "".join(rng.choice("ACGT") for _ in range(n))
+        pattern = "".join(rng.choice("ACGT") for _ in range(19)) + "N"
+        return text, pattern
+    if distribution == "periodic":
+        return "a" * n, "a" * 31 + "b"
+    raise ValueError(f"Unknown text distribution '{distribution}'")
+
+
+def grid_obstacles(n: int, rng: random.Random) -> Tuple[int, List[int]]:
+    """(side, flat 0/1 obstacle list) for a square grid of about n cells, 20% blocked."""
+    side = max(2, int(n ** 0.5))
+    cells = [1 if rng.random() < 0.2 else 0 for _ in range(side * side)]
+    cells[0] = cells[-1] = 0
+    return side, cells
+
+
+class Counted:
+    """
+    Number wrapper that counts every comparison made on it, so comparison
+    counts can be reported for any comparison-based function.
+    """
+
+    __slots__ = ("v",)
+    comparisons = 0
+
+    def __init__(self, v: Any):
+        self.v = v
+
+    def __lt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.v < other.v
+
+    def __le__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.v <= other.v
+
+    def __gt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.v > other.v
+
+    def __ge__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.v >= other.v
+
+    def __eq__(self, other: object) -> bool:
+        Counted.comparisons += 1
+        return isinstance(other, Counted) and self.v == other.v
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self.v)
@@ -0,0 +1,182 @@
+"""
+Benchmark harness: times every algorithm over several sizes and input
+distributions and writes the results as JSON.
+
+    python -m benchmarks.run --quick --output results.json
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+
+With --baseline, the exit status is 1 if any result regressed by more than
+the threshold (wall time, comparisons or peak memory).
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from benchmarks.cases import Case, all_cases
+from benchmarks.inputs import Counted
+
+# differences smaller than these are noise, whatever the ratio
+MIN_SECONDS_DELTA = 0.002
+MIN_BYTES_DELTA = 64 * 1024
+
+
+def measure(case: Case, size: int, distribution: str, repeat: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """
+    Best-of-`repeat` wall time, peak traced memory of one more run, and (for
+    comparison-based cases) the number of comparisons. Memory allocated in
+    worker processes is not traced.
+    """
+    rng = random.Random(f"{seed}:{case.group}:{case.name}:{size}:{distribution}")
+    data = case.make(size, distribution, rng)
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            case.run(data)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        case.run(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    comparisons: Optional[int] = None
+    if case.counted is not None:
+        counted = case.counted(data)
+        Counted.comparisons = 0
+        case.run(counted)
+        comparisons = Counted.comparisons
+
+    return {
+        "group": case.group,
+        "case": case.name,
+        "size": size,
+        "distribution": distribution,
+        "seconds": best,
+        "peak_bytes": peak,
+        "comparisons": comparisons,
+    }
+
+
+def run_all(cases: List[Case], quick: bool = False, repeat: int = 3, seed: int = 0,
+            log=None) -> List[Dict[str, Any]]:
+    """Measure every (case, size, distribution); quick mode keeps only each case's smallest size."""
+    results = []
+    for case in cases:
+        sizes = case.sizes[:1] if quick else case.sizes
+        for size in sizes:
+            for distribution in case.distributions:
+                result = measure(case, size, distribution, repeat, seed)
+                if log is not None:
+                    log.write(f"{case.group:9} {case.name:28} {size:>9} {distribution:14} "
+                              f"{result['seconds'] * 1000:10.2f} ms\n")
+                    log.flush()
+                results.append(result)
+    return results
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return result["group"], result["case"], result["size"], result["distribution"]
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            threshold: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    Results worse than their baseline entry by more than `threshold` (a
+    fraction): slower wall time, more comparisons or a higher memory peak.
+    Tiny absolute differences are ignored as noise; comparisons are exact.
+    """
+    base = {_key(r): r for r in baseline}
+    regressions = []
+    for r in results:
+        old = base.get(_key(r))
+        if old is None:
+            continue
+        checks = (
+            ("seconds", MIN_SECONDS_DELTA),
+            ("peak_bytes", MIN_BYTES_DELTA),
+            ("comparisons", 0),
+        )
+        for metric, min_delta in checks:
+            new_value, old_value = r.get(metric), old.get(metric)
+            if new_value is None or old_value is None:
+                continue
+            if new_value > old_value * (1 + threshold) and new_value - old_value > min_delta:
+                regressions.append({
+                    "group": r["group"], "case": r["case"], "size": r["size"],
+                    "distribution": r["distribution"], "metric": metric,
+                    "baseline": old_value, "current": new_value,
+                })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="only the smallest size of each case")
+    parser.add_argument("--group", action="append", help="searches, sorts, graphs or strings (repeatable)")
+    parser.add_argument("--case", action="append", help="only cases whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--save-baseline", help="also write the results as a baseline file")
+    parser.add_argument("--baseline", help="compare against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown as a fraction (default 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in all_cases()
+             if (not args.group or c.group in args.group)
+             and (not args.case or any(name in c.name for name in args.case))]
+    results = run_all(cases, args.quick, args.repeat, args.seed, log=sys.stderr)
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "quick": args.quick,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        report["regressions"] = regressions
+        for r in regressions:
+            sys.stderr.write(f"REGRESSION {r['case']} size={r['size']} {r['distribution']}: "
+                             f"{r['metric']} {r['baseline']} -> {r['current']}\n")
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(text + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+# gunicorn.conf.py
+import os
+
+# One server process whose threads parse requests and write responses; heavy
+# algorithm calls run in the app's own process pool (see service/executor.py),
+# so small requests are not stuck behind large ones.
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+# large jobs are bounded by REQUEST_DEADLINE_SECONDS, not by the worker timeout
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
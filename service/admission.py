@@ -0,0 +1,235 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+# Work is measured in estimated Python-level steps (~20 million per second on one core).
+# Estimates above MAX_REQUEST_WORK are rejected, above LOW_PRIORITY_WORK they wait for
+# one of LOW_PRIORITY_SLOTS low-priority slots, and everything else runs immediately.
+MAX_REQUEST_WORK = int(os.environ.get("MAX_REQUEST_WORK", 200_000_000))
+LOW_PRIORITY_WORK = int(os.environ.get("LOW_PRIORITY_WORK", 10_000_000))
+LOW_PRIORITY_SLOTS = int(os.environ.get("LOW_PRIORITY_SLOTS", 1))
+LOW_PRIORITY_WAIT_SECONDS = float(os.environ.get("LOW_PRIORITY_WAIT_SECONDS", 5))
+# Upper bound on any request's deadline; clients may ask for less with `deadline_ms`
+REQUEST_DEADLINE_SECONDS = float(os.environ.get("REQUEST_DEADLINE_SECONDS", 30))
+
+
+def n_log_n(n: int) -> float:
+    return n * max(1, n.bit_length())
+
+
+class CostModel(NamedTuple):
+    """Asymptotic cost of an algorithm and an estimate of its work for input sizes (n, m)."""
+    complexity: str
+    work: Callable[[int, int], float]
+
+
+# (endpoint, algorithm) -> cost model. n and m per endpoint:
+#   search: array length, number of targets     sort: array length, unused
+#   graph: nodes, edges                         string: text length, pattern length
+#   matrix: sources, nodes + edges              select: array length, k (or n)
+#   corpus: text length, pattern length         dynamic: nodes, edges (edits: edit count)
+#   datasets/create: array length               graphs/create: nodes, edges
+#   pattern-sets/create: total pattern length   corpora/create: text length (UTF-8 bytes)
+COST_MODELS: Dict[Tuple[str, str], CostModel] = {
+    ("search", "linear"): CostModel("O(n + m)", lambda n, m: n + m),
+    ("search", "binary"): CostModel("O(m log n)", lambda n, m: m * max(1, n.bit_length())),
+    ("search", "jump"): CostModel("O(m √n)", lambda n, m: m * (n ** 0.5 + 1)),
+    ("search", "interpolation"): CostModel("O(m log log n)", lambda n, m: m * max(1, n.bit_length())),
+    ("search", "exponential"): CostModel("O(m log n)", lambda n, m: 2 * m * max(1, n.bit_length())),
+    ("search", "fibonacci"): CostModel("O(m log n)", lambda n, m: 2 * m * max(1, n.bit_length())),
+    ("sort", "bubble"): CostModel("O(n²)", lambda n, m: n * n / 2),
+    ("sort", "selection"): CostModel("O(n²)", lambda n, m: n * n / 2),
+    ("sort", "insertion"): CostModel("O(n²)", lambda n, m: n * n / 4),
+    ("sort", "merge"): CostModel("O(n log n)", lambda n, m: n_log_n(n)),
+    ("sort", "quick"): CostModel("O(n log n)", lambda n, m: n_log_n(n)),
+    ("sort", "heap"): CostModel("O(n log n)", lambda n, m: 2 * n_log_n(n)),
+    ("sort", "intro"): CostModel("O(n log n)", lambda n, m: n_log_n(n)),
+    ("sort", "hybrid_merge"): CostModel("O(n log n)", lambda n, m: n_log_n(n)),
+    # numeric and parallel sorts do their comparisons in C
+    ("sort", "numeric"): CostModel("O(n log n)", lambda n, m: n_log_n(n) / 10),
+    ("sort", "parallel"): CostModel("O(n log n)", lambda n, m: n_log_n(n) / 10),
+    ("graph", "bfs"): CostModel("O(V + E)", lambda n, m: n + m),
+    ("graph", "dfs"): CostModel("O(V + E)", lambda n, m: n + m),
+    ("graph", "dijkstra"): CostModel("O((V + E) log V)", lambda n, m: (n + m) * max(1, n.bit_length())),
+    ("graph", "astar"): CostModel("O((V + E) log V)", lambda n, m: (n + m) * max(1, n.bit_length())),
+    ("string", "naive"): CostModel("O(n·m)", lambda n, m: n * max(1, m) / 10),
+    ("string", "kmp"): CostModel("O(n + m)", lambda n, m: n + m),
+    ("string", "rabin"): CostModel("O(n + m)", lambda n, m: 2 * n + m),
+    ("string", "bmh"): CostModel("O(n·m) worst, O(n / m) typical", lambda n, m: n + m),
+    ("string", "two-way"): CostModel("O(n + m)", lambda n, m: 2 * n + m),
+    ("string", "native"): CostModel("O(n + m)", lambda n, m: (n + m) / 10),
+    ("matrix", "dijkstra"): CostModel("O(S (V + E) log V)", lambda n, m: n * m * max(1, m.bit_length())),
+    # heapq.nsmallest / nlargest run in C
+    ("select", "topk"): CostModel("O(n log k)", lambda n, m: n * max(1, m.bit_length()) / 10),
+    ("select", "nth"): CostModel("O(n)", lambda n, m: 4 * n),
+    ("select", "median"): CostModel("O(n)", lambda n, m: 4 * n),
+    ("sort", "external"): CostModel("O(n log n)", lambda n, m: n_log_n(n) / 10),
+    ("corpus", "count"): CostModel("O(m log n)", lambda n, m: max(1, m) * max(1, n.bit_length()) / 10),
+    ("corpus", "first"): CostModel("O(m log n + k)", lambda n, m: max(1, m) * max(1, n.bit_length()) / 10),
+    ("corpus", "locate"): CostModel("O(m log n + k log k)", lambda n, m: max(1, m) * max(1, n.bit_length()) / 10),
+    ("corpus", "longest_repeat"): CostModel("O(n)", lambda n, m: n),
+    ("dynamic", "create"): CostModel("O(V + E)", lambda n, m: 2 * (n + m)),
+    ("dynamic", "edges"): CostModel("O(k)", lambda n, m: 2 * n),
+    ("dynamic", "dijkstra"): CostModel("O((V + E) log V)", lambda n, m: (n + m) * max(1, n.bit_length())),
+    ("string", "aho-corasick"): CostModel("O(n + m + matches)", lambda n, m: 2 * n + 3 * m),
+    # uploads that build a stored structure
+    ("datasets", "create"): CostModel("O(n log n)", lambda n, m: n + n_log_n(n) / 10),
+    ("graphs", "create"): CostModel("O(V + E)", lambda n, m: 2 * (n + m)),
+    ("pattern-sets", "create"): CostModel("O(m)", lambda n, m: 3 * n),
+    # prefix doubling: a few O(n log n) sorting rounds, measured at ~5 s per MB
+    ("corpora", "create"): CostModel("O(n log² n)", lambda n, m: 5 * n_log_n(n)),
+}
+
+# Same results, better complexity: used instead when the client sends "allow_downgrade": true
+DOWNGRADES: Dict[Tuple[str, str], str] = {
+    ("sort", "bubble"): "hybrid_merge",
+    ("sort", "selection"): "hybrid_merge",
+    ("sort", "insertion"): "hybrid_merge",
+    ("string", "naive"): "two-way",
+}
+
+
+class WorkTooLarge(ValueError):
+    pass
+
+
+class QueueFull(RuntimeError):
+    pass
+
+
+class DeadlineExceeded(RuntimeError):
+    pass
+
+
+class Deadline:
+    """
+    Cooperative deadline: long-running algorithms call check() between
+    units of work, which raises DeadlineExceeded once time is up.
+    """
+
+    __slots__ = ("seconds", "expires_at")
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        if time.monotonic() > self.expires_at:
+            raise DeadlineExceeded(f"Request exceeded its deadline of {self.seconds:g}s")
+
+
+class Ticket:
+    """
+    Admission decision for one request. Use as a context manager around the
+    computation: low-priority tickets hold a low-priority slot while inside.
+    """
+
+    def __init__(self, controller: "AdmissionController", algorithm: str, work: float,
+                 low_priority: bool, deadline: Deadline, downgraded_from: Optional[str] = None):
+        self._controller = controller
+        self.algorithm = algorithm
+        self.work = work
+        self.low_priority = low_priority
+        self.deadline = deadline
+        self.downgraded_from = downgraded_from
+        self._holding = False
+
+    def __enter__(self) -> "Ticket":
+        if self.low_priority:
+            self._controller._acquire_slot()
+            self._holding = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._holding:
+            self._controller._release_slot()
+            self._holding = False
+
+
+class AdmissionController:
+    """
+    Estimates each request's work from COST_MODELS before it runs, and
+    rejects, downgrades or queues the expensive ones so that one quadratic
+    request cannot starve everything else.
+    """
+
+    def __init__(self, max_work: float = MAX_REQUEST_WORK, low_priority_work: float = LOW_PRIORITY_WORK,
+                 low_priority_slots: int = LOW_PRIORITY_SLOTS,
+                 low_priority_wait: float = LOW_PRIORITY_WAIT_SECONDS,
+                 deadline_seconds: float = REQUEST_DEADLINE_SECONDS):
+        self.max_work = max_work
+        self.low_priority_work = low_priority_work
+        self.low_priority_slots = low_priority_slots
+        self.low_priority_wait = low_priority_wait
+        self.deadline_seconds = deadline_seconds
+        self._slots = threading.BoundedSemaphore(low_priority_slots)
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.low_priority = 0
+        self.downgraded = 0
+        self.rejected = 0
+        self.queue_full = 0
+
+    def estimate(self, endpoint: str, algorithm: str, n: int, m: int = 1, extra_work: float = 0) -> float:
+        model = COST_MODELS.get((endpoint, algorithm))
+        return extra_work + (model.work(n, m) if model is not None else n)
+
+    def admit(self, endpoint: str, algorithm: str, n: int, m: int = 1, extra_work: float = 0,
+              allow_downgrade: bool = False, deadline_ms: Any = None) -> Ticket:
+        """
+        Decide how to run `algorithm` on inputs of size (n, m); `extra_work`
+        covers preprocessing done by the route (e.g. sorting a posted array).
+        Raises WorkTooLarge if the estimate is over the limit even after an
+        allowed downgrade.
+        """
+        work = self.estimate(endpoint, algorithm, n, m, extra_work)
+        downgraded_from = None
+        downgrade = DOWNGRADES.get((endpoint, algorithm))
+        if downgrade is not None and allow_downgrade and work > self.low_priority_work:
+            downgraded_from, algorithm = algorithm, downgrade
+            work = self.estimate(endpoint, algorithm, n, m, extra_work)
+        if work > self.max_work:
+            with self._lock:
+                self.rejected += 1
+            model = COST_MODELS.get((endpoint, algorithm))
+            complexity = f" ({model.complexity})" if model is not None else ""
+            hint = f"; send \"allow_downgrade\": true to use '{downgrade}' instead" if downgrade else ""
+            raise WorkTooLarge(f"Estimated work {work:.3g} for '{algorithm}'{complexity} "
+                               f"exceeds the limit of {self.max_work:.3g}{hint}")
+
+        seconds = self.deadline_seconds
+        if isinstance(deadline_ms, (int, float)) and deadline_ms > 0:
+            seconds = min(seconds, deadline_ms / 1000)
+        low_priority = work > self.low_priority_work
+        with self._lock:
+            self.admitted += 1
+            self.low_priority += low_priority
+            self.downgraded += downgraded_from is not None
+        return Ticket(self, algorithm, work, low_priority, Deadline(seconds), downgraded_from)
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(timeout=self.low_priority_wait):
+            with self._lock:
+                self.queue_full += 1
+            raise QueueFull(f"All {self.low_priority_slots} low-priority slots are busy; retry later")
+
+    def _release_slot(self) -> None:
+        self._slots.release()
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "max_work": self.max_work,
+            "low_priority_work": self.low_priority_work,
+            "low_priority_slots": self.low_priority_slots,
+            "deadline_seconds": self.deadline_seconds,
+            "admitted": self.admitted,
+            "low_priority": self.low_priority,
+            "downgraded": self.downgraded,
+            "rejected": self.rejected,
+            "queue_full": self.queue_full,
+            "complexity": {f"{endpoint}/{algo}": model.complexity for (endpoint, algo), model in COST_MODELS.items()},
+        }
@@ -0,0 +1,190 @@
+import ast
+import json
+import math
+import re
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: MessagePack bodies are refused with 415
+    msgpack = None
+
+JSON = "application/json"
+MSGPACK = ("application/msgpack", "application/x-msgpack")
+PACKED = "application/octet-stream"
+NPY = "application/x-npy"
+
+# little-endian dtype name -> array typecode
+DTYPES = {"i1": "b", "u1": "B", "i2": "h", "u2": "H", "i4": "i", "u4": "I",
+          "i8": "q", "u8": "Q", "f4": "f", "f8": "d"}
+_TYPECODES = {code: name for name, code in DTYPES.items()}
+_NPY_MAGIC = b"\x93NUMPY"
+# a run of 19+ digits may be an integer orjson would silently turn into a float
+_LONG_DIGITS = re.compile(rb"[0-9]{19,}")
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19,}")
+
+
+class UnsupportedFormat(ValueError):
+    pass
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON with orjson when it is installed. Input orjson rejects but the
+    stdlib accepts (NaN/Infinity) falls back to json, and so does input with
+    integers that may not fit in 64 bits, which orjson parses as floats.
+    """
+    long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS
+    if orjson is not None and not long_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+_NESTED = frozenset((float, dict, list, tuple))
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if obj holds an inf or NaN float anywhere in its lists and dicts."""
+    if type(obj) is float:
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        values = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        values = obj
+    else:
+        return False
+    try:
+        # one C-level pass for all-number containers: any inf or NaN makes
+        # the sum non-finite (so can a float overflow, which only costs speed)
+        total = sum(values)
+    except (TypeError, OverflowError):
+        if _NESTED.isdisjoint(set(map(type, values))):
+            return False  # e.g. all strings, ints and None
+        return any(_has_non_finite(v) for v in values if type(v) in _NESTED)
+    return type(total) is float and not math.isfinite(total)
+
+
+def dumps(obj: Any, default=None) -> Optional[bytes]:
+    """
+    Serialize with orjson (sorted keys, like Flask's default), or None so the
+    caller can use json: when orjson is missing, cannot encode obj, or obj
+    holds inf/NaN, which orjson would write as null but json writes as
+    Infinity/NaN. Output is then the same whether orjson is installed or not.
+    """
+    if orjson is None or _has_non_finite(obj):
+        return None
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
+
+
+def unpack_msgpack(body: bytes) -> Any:
+    if msgpack is None:
+        raise UnsupportedFormat("MessagePack bodies need the 'msgpack' package on the server")
+    return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def _typecode(dtype: str) -> str:
+    code = DTYPES.get(dtype.lstrip("<|"))
+    if code is None or dtype.startswith(">"):
+        raise ValueError(f"Unsupported dtype '{dtype}'; use one of {', '.join(DTYPES)} (little-endian)")
+    if array(code).itemsize != int(dtype.lstrip("<|")[1:]):
+        raise ValueError(f"dtype '{dtype}' has no matching array type on this platform")
+    return code
+
+
+def _from_le_bytes(code: str, body: bytes) -> array:
+    a = array(code)
+    if len(body) % a.itemsize:
+        raise ValueError(f"Body length {len(body)} is not a multiple of {a.itemsize}-byte items")
+    a.frombytes(body)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+def unpack_array(body: bytes, dtype: str = "i8") -> array:
+    """Packed little-endian numbers (dtype like "i8", "f8", "u4") -> array."""
+    return _from_le_bytes(_typecode(dtype), body)
+
+
+def read_npy(body: bytes) -> array:
+    """A 1-D, C-order .npy file (format 1.0-3.0) of a numeric dtype -> array."""
+    if body[:6] != _NPY_MAGIC or len(body) < 10:
+        raise ValueError("Not a .npy file")
+    major = body[6]
+    if major == 1:
+        (header_len,), start = struct.unpack_from("<H", body, 8), 10
+    else:
+        (header_len,), start = struct.unpack_from("<I", body, 8), 12
+    try:
+        header = ast.literal_eval(body[start:start + header_len].decode("latin-1"))
+        descr, fortran, shape = header["descr"], header["fortran_order"], header["shape"]
+    except (ValueError, SyntaxError, KeyError, TypeError):
+        raise ValueError("Malformed .npy header")
+    if not isinstance(descr, str) or not isinstance(shape, tuple) or len(shape) != 1 or fortran:
+        raise ValueError(".npy input must be a 1-D array of a numeric dtype")
+    a = _from_le_bytes(_typecode(descr), body[start + header_len:])
+    if len(a) != shape[0]:
+        raise ValueError(f".npy shape {shape} does not match its data")
+    return a
+
+
+def to_array(values: Sequence[Any], dtype: Optional[str] = None) -> array:
+    """values -> array of the given dtype, or i8/f8 picked from the values."""
+    if isinstance(values, array) and dtype is None:
+        return values
+    if dtype is not None:
+        return array(_typecode(dtype), values)
+    if all(type(v) is int for v in values):
+        return array("q", values)
+    return array("d", values)
+
+
+def pack_array(a: array) -> bytes:
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def write_npy(a: array) -> bytes:
+    descr = ("|" if a.itemsize == 1 else "<") + _TYPECODES[a.typecode]
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({len(a)},), }}"
+    # the data starts on a 64-byte boundary, as numpy writes it
+    header += " " * (-(len(header) + 11) % 64) + "\n"
+    return _NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin-1") + pack_array(a)
+
+
+def negotiate(accept: str) -> Optional[str]:
+    """The binary array format the Accept header asks for, or None for JSON."""
+    for part in accept.split(","):
+        media = part.split(";")[0].strip().lower()
+        if media in (PACKED, NPY):
+            return media
+        if media in (JSON, "*/*", "application/*"):
+            return None
+    return None
+
+
+def media_type(content_type: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """(lowercased media type, parameters) of a Content-Type header."""
+    media, *params = (content_type or "").split(";")
+    pairs = (p.split("=", 1) for p in params if "=" in p)
+    return media.strip().lower(), {k.strip().lower(): v.strip().strip('"') for k, v in pairs}
+
+
+def dtype_of(a: array) -> str:
+    return _TYPECODES[a.typecode]
@@ -0,0 +1,123 @@
+import os
+import re
+import tempfile
+import threading
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from algorithms.strings.suffix_array import SuffixIndex, open_index
+from service.private_dirs import private_directory, user_directory
+
+# Index files live here; every worker process maps the same files, so the
+# page cache holds one copy and a restart only has to re-map them. The
+# directory is per user and readable only by them
+CORPUS_DIR = os.environ.get("CORPUS_DIR", user_directory(tempfile.gettempdir(), "search-algorithms-corpora"))
+# largest text accepted (UTF-8 bytes); building its index takes about 100
+# bytes of memory and 10-15 us per text byte
+MAX_CORPUS_BYTES = int(os.environ.get("MAX_CORPUS_BYTES", 1024 * 1024))
+# total size of the index files (17 bytes per text byte)
+CORPUS_DISK_BYTES = int(os.environ.get("CORPUS_DISK_BYTES", 4 * 1024 * 1024 * 1024))
+
+_ID = re.compile(r"[A-Za-z0-9_.-]{1,128}")
+
+
+def index_size(text_bytes: int) -> int:
+    """Size of the index file for a text of this many bytes: header, padded text, SA and LCP."""
+    return 24 + text_bytes + (-text_bytes % 8) + 16 * text_bytes
+
+
+class CorpusTooLarge(ValueError):
+    pass
+
+
+class CorpusStore:
+    """
+    Suffix-array indexes of uploaded texts, persisted as mmap-able files.
+    Each text is limited to `max_bytes` and all index files together to
+    `disk_bytes`.
+    """
+
+    def __init__(self, directory: str = CORPUS_DIR, max_bytes: int = MAX_CORPUS_BYTES,
+                 disk_bytes: int = CORPUS_DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.disk_bytes = disk_bytes
+        private_directory(directory, "Corpus")
+        # corpus_id -> (index, inode of the file it was mapped from)
+        self._open: Dict[str, Tuple[SuffixIndex, int]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, corpus_id: str) -> str:
+        if not isinstance(corpus_id, str) or not _ID.fullmatch(corpus_id) or corpus_id.startswith("."):
+            raise ValueError("corpus_id may only contain letters, digits, '_', '-' and '.'")
+        return os.path.join(self.directory, f"{corpus_id}.sa")
+
+    def put(self, text: bytes, corpus_id: Optional[str] = None,
+            check: Optional[Callable[[], None]] = None) -> Tuple[str, SuffixIndex]:
+        """
+        Index text and write it to disk. Re-uploading an existing id bumps its
+        version. Returns (corpus_id, index). Raises CorpusTooLarge if the
+        text or the directory would exceed its limit. `check` is passed to
+        the index build.
+        """
+        if len(text) > self.max_bytes:
+            raise CorpusTooLarge(f"Text has {len(text)} bytes, limit is {self.max_bytes}")
+        corpus_id = corpus_id or uuid.uuid4().hex
+        path = self._path(corpus_id)
+        needed = index_size(len(text))
+        used = self.disk_usage() - self._file_size(path)
+        if used + needed > self.disk_bytes:
+            raise CorpusTooLarge(f"Index needs {needed} bytes; {self.disk_bytes - used} of "
+                                 f"{self.disk_bytes} are free")
+        current = self.get(corpus_id)
+        SuffixIndex.build(text, current.version + 1 if current else 1, check).save(path)
+        with self._lock:
+            self._open.pop(corpus_id, None)
+        return corpus_id, self.get(corpus_id)
+
+    def get(self, corpus_id: str) -> Optional[SuffixIndex]:
+        """The mapped index, re-mapped if another worker replaced the file."""
+        path = self._path(corpus_id)
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            with self._lock:
+                self._open.pop(corpus_id, None)
+            return None
+        with self._lock:
+            entry = self._open.get(corpus_id)
+            if entry is None or entry[1] != inode:
+                # an index being replaced may still serve in-flight queries, so it
+                # is not closed here; the mapping goes away with its last reference
+                entry = self._open[corpus_id] = (open_index(path), inode)
+            return entry[0]
+
+    def delete(self, corpus_id: str) -> bool:
+        path = self._path(corpus_id)
+        with self._lock:
+            self._open.pop(corpus_id, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def disk_usage(self) -> int:
+        """Bytes taken by the index files."""
+        with os.scandir(self.directory) as entries:
+            return sum(e.stat().st_size for e in entries if e.name.endswith(".sa") and e.is_file())
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def describe(self, corpus_id: str, index: SuffixIndex) -> Dict[str, Any]:
+        return {
+            "corpus_id": corpus_id,
+            "version": index.version,
+            "bytes": len(index),
+            "index_bytes": os.path.getsize(self._path(corpus_id)),
+        }
@@ -0,0 +1,69 @@
+import os
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+from algorithms.sorts.numeric_sort import as_typed_array, sort_typed_array
+from service.registry import VersionedRegistry
+
+DEFAULT_MEMORY_LIMIT = int(os.environ.get("DATASET_MEMORY_LIMIT_BYTES", 256 * 1024 * 1024))
+
+
+def compact(values: Sequence[Any]):
+    """
+    Store values in the smallest homogeneous container available:
+    array('q') for 64-bit ints, array('d') for floats, otherwise a plain list.
+    """
+    typed = as_typed_array(values)
+    return typed if typed is not None else list(values)
+
+
+def _nbytes(data) -> int:
+    if isinstance(data, array):
+        return sys.getsizeof(data)
+    return sys.getsizeof(data) + sum(sys.getsizeof(v) for v in data)
+
+
+class Dataset:
+    """A stored, pre-sorted array identified by (dataset_id, version)."""
+
+    __slots__ = ("dataset_id", "version", "data", "nbytes")
+
+    def __init__(self, dataset_id: str, version: int, data, nbytes: Optional[int] = None):
+        self.dataset_id = dataset_id
+        self.version = version
+        self.data = data
+        self.nbytes = _nbytes(data) if nbytes is None else nbytes
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "dataset_id": self.dataset_id,
+            "version": self.version,
+            "size": len(self.data),
+            "storage": self.data.typecode if isinstance(self.data, array) else "list",
+            "bytes": self.nbytes,
+        }
+
+
+class DatasetTooLarge(ValueError):
+    pass
+
+
+class DatasetRegistry(VersionedRegistry):
+    """
+    In-memory registry of sorted datasets with a total memory budget.
+    Least recently used datasets are evicted when the budget is exceeded.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        super().__init__(memory_limit)
+
+    def put(self, values: List[Any], dataset_id: Optional[str] = None) -> Dataset:
+        """Sort and store values. Re-uploading an existing id bumps its version."""
+        typed = as_typed_array(values)
+        data = sort_typed_array(typed, values) if typed is not None else sorted(values)
+        nbytes = _nbytes(data)
+        ds = self._store(dataset_id, nbytes, lambda item_id, version: Dataset(item_id, version, data, nbytes))
+        if ds is None:
+            raise DatasetTooLarge(f"Dataset needs {nbytes} bytes, limit is {self.memory_limit}")
+        return ds
@@ -0,0 +1,200 @@
+import os
+import threading
+import uuid
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from algorithms.graphs.dynamic_sssp import DynamicSSSP, EdgeChange
+from service.lru import LRUCache
+
+DEFAULT_CACHE_BYTES = int(os.environ.get("SSSP_CACHE_BYTES", 128 * 1024 * 1024))
+DEFAULT_MEMORY_LIMIT = int(os.environ.get("DYNAMIC_GRAPH_MEMORY_LIMIT_BYTES", 256 * 1024 * 1024))
+# edits kept per graph; cached results older than this are recomputed, not repaired
+CHANGE_LOG_SIZE = 1024
+# bytes charged per node of a cached result (distance + predecessor entries)
+_BYTES_PER_NODE = 200
+# bytes charged per node and per edge of a stored graph (out and in adjacency dicts)
+_GRAPH_BYTES_PER_NODE = 500
+_GRAPH_BYTES_PER_EDGE = 200
+
+
+class MutableGraph:
+    """
+    Weighted directed graph that records a versioned log of its edge changes.
+    `lock` serializes edits and shortest-path computations on this graph.
+    """
+
+    def __init__(self, graph_id: str, graph: Dict[Any, Dict[Any, float]]):
+        self.graph_id = graph_id
+        self.lock = threading.Lock()
+        self.version = 1
+        self.out: Dict[Any, Dict[Any, float]] = {}
+        self.inn: Dict[Any, Dict[Any, float]] = {}
+        self.num_edges = 0
+        # (version after the change, change)
+        self.log: "deque[Tuple[int, EdgeChange]]" = deque(maxlen=CHANGE_LOG_SIZE)
+        for u, edges in graph.items():
+            self.out.setdefault(u, {})
+            for v, w in edges.items():
+                self._set(u, v, w)
+
+    def _set(self, u: Any, v: Any, w: Optional[float]) -> Optional[float]:
+        old = self.out.get(u, {}).get(v)
+        if w is None:
+            if old is not None:
+                del self.out[u][v]
+                del self.inn[v][u]
+                self.num_edges -= 1
+        else:
+            if old is None:
+                self.num_edges += 1
+            self.out.setdefault(u, {})[v] = w
+            self.out.setdefault(v, {})
+            self.inn.setdefault(v, {})[u] = w
+        return old
+
+    def update(self, u: Any, v: Any, w: Optional[float]) -> None:
+        """Insert, reweight (w given) or delete (w is None) the edge u -> v."""
+        old = self._set(u, v, w)
+        if old != w:
+            self.version += 1
+            self.log.append((self.version, (u, v, old, w)))
+
+    def changes_since(self, version: int) -> Optional[List[EdgeChange]]:
+        """Changes made after `version`, or None if the log no longer reaches back that far."""
+        if version == self.version:
+            return []
+        if not self.log or self.log[0][0] > version + 1:
+            return None
+        return [change for v, change in self.log if v > version]
+
+    @property
+    def nbytes(self) -> int:
+        return _graph_bytes(len(self.out), self.num_edges)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "graph_id": self.graph_id,
+            "version": self.version,
+            "nodes": len(self.out),
+            "edges": self.num_edges,
+            "bytes": self.nbytes,
+        }
+
+
+def _graph_bytes(nodes: int, edges: int) -> int:
+    return _GRAPH_BYTES_PER_NODE * nodes + _GRAPH_BYTES_PER_EDGE * edges
+
+
+class DynamicGraphTooLarge(ValueError):
+    pass
+
+
+class DynamicGraphStore:
+    """
+    Mutable graphs within a total memory budget (least recently used graphs
+    are evicted), plus an LRU cache of single-source results keyed by
+    (graph_id, source). A cached result that is a few versions behind is
+    repaired with DynamicSSSP.apply instead of being recomputed.
+    The store lock only guards replacing and removing graphs; edits and
+    shortest-path computations hold the lock of their own graph, so a long
+    computation on one graph does not block the others.
+    """
+
+    def __init__(self, cache_bytes: int = DEFAULT_CACHE_BYTES, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        self.graphs = LRUCache(memory_limit)
+        self.cache = LRUCache(cache_bytes)
+        self.repairs = 0
+        self.recomputes = 0
+        self._lock = threading.Lock()
+
+    def create(self, graph: Dict[Any, Dict[Any, float]], graph_id: Optional[str] = None) -> MutableGraph:
+        nodes = set(graph).union(*graph.values())
+        nbytes = _graph_bytes(len(nodes), sum(len(edges) for edges in graph.values()))
+        if nbytes > self.graphs.max_bytes:
+            raise DynamicGraphTooLarge(f"Graph needs {nbytes} bytes, limit is {self.graphs.max_bytes}")
+        graph_id = graph_id or uuid.uuid4().hex
+        g = MutableGraph(graph_id, graph)
+        with self._lock:
+            self._drop_results(graph_id)
+            self.graphs.put(graph_id, g, g.nbytes)
+        return g
+
+    def get(self, graph_id: str) -> Optional[MutableGraph]:
+        return self.graphs.get(graph_id)
+
+    def delete(self, graph_id: str) -> bool:
+        with self._lock:
+            self._drop_results(graph_id)
+            return self.graphs.pop(graph_id) is not None
+
+    def update(self, graph_id: str, edits: List[Tuple[Any, Any, Optional[float]]]) -> Optional[MutableGraph]:
+        """
+        Apply (u, v, weight-or-None) edits under the graph's lock. Returns
+        None if the graph is gone; raises DynamicGraphTooLarge (applying
+        nothing) if the edits could grow it past the memory limit.
+        """
+        g = self.graphs.get(graph_id)
+        if g is None:
+            return None
+        with g.lock:
+            # upper bound: every insert adds an edge and both its nodes
+            inserts = sum(w is not None for _, _, w in edits)
+            nbytes = _graph_bytes(len(g.out) + 2 * inserts, g.num_edges + inserts)
+            if nbytes > self.graphs.max_bytes:
+                raise DynamicGraphTooLarge(
+                    f"Graph could grow to {nbytes} bytes, limit is {self.graphs.max_bytes}")
+            for u, v, w in edits:
+                g.update(u, v, w)
+            with self._lock:
+                if self.graphs.get(graph_id) is not g:
+                    # replaced or deleted meanwhile: the edits went to a graph nobody can see
+                    return None
+                # re-charge the graph at its new size, evicting others if needed
+                self.graphs.put(graph_id, g, g.nbytes)
+            return g
+
+    def shortest_paths(self, graph_id: str, source: Any,
+                       check: Optional[Callable[[], None]] = None) -> Tuple[Dict[Any, float], str]:
+        """
+        Distances from source on the current version of the graph (reachable
+        nodes only). Returns (distances, how) where how is "hit", "repaired"
+        or "computed". Raises KeyError if the graph is gone. `check` is
+        passed to DynamicSSSP; a repair it interrupts drops the cached result.
+        """
+        g = self.graphs.get(graph_id)
+        if g is None:
+            raise KeyError(graph_id)
+        key = (graph_id, source)
+        with g.lock:
+            entry = self.cache.get(key)
+            # a result computed on a graph since replaced under the same id is not reused
+            if entry is not None and entry[1].out is g.out:
+                version, sssp = entry
+                if version == g.version:
+                    return dict(sssp.dist), "hit"
+                changes = g.changes_since(version)
+                if changes is not None:
+                    self.cache.pop(key)
+                    sssp.apply(changes, check)
+                    self.repairs += 1
+                    self._store(key, g.version, sssp)
+                    return dict(sssp.dist), "repaired"
+            sssp = DynamicSSSP(g.out, g.inn, source, check)
+            self.recomputes += 1
+            self._store(key, g.version, sssp)
+            return dict(sssp.dist), "computed"
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats.update(graphs=len(self.graphs), graph_bytes=self.graphs.used_bytes,
+                     graph_max_bytes=self.graphs.max_bytes, repairs=self.repairs, recomputes=self.recomputes)
+        return stats
+
+    def _store(self, key: Tuple[str, Any], version: int, sssp: DynamicSSSP) -> None:
+        self.cache.put(key, (version, sssp), _BYTES_PER_NODE * len(sssp.dist))
+
+    def _drop_results(self, graph_id: str) -> None:
+        # results for a replaced graph must not be repaired against the new one
+        for key in [k for k in self.cache.keys() if k[0] == graph_id]:
+            self.cache.pop(key)
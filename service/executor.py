@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Worker processes for algorithm calls; defaults to one per core
+EXECUTOR_WORKERS = int(os.environ.get("EXECUTOR_WORKERS", os.cpu_count() or 1))
+# Calls allowed to wait for a busy worker; beyond that new calls are refused (backpressure)
+EXECUTOR_QUEUE_LIMIT = int(os.environ.get("EXECUTOR_QUEUE_LIMIT", 2 * EXECUTOR_WORKERS))
+EXECUTOR_TIMEOUT_SECONDS = float(os.environ.get("EXECUTOR_TIMEOUT_SECONDS", 60))
+
+
+class PoolBusy(RuntimeError):
+    pass
+
+
+class PoolTimeout(RuntimeError):
+    pass
+
+
+def call_with_stats(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Dict[str, int]]:
+    """
+    func(*args, stats, **kwargs) -> (result, stats), so operation counters
+    collected in a worker process make it back to the caller.
+    """
+    stats: Dict[str, int] = {}
+    return func(*args, stats, **kwargs), stats
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _context():
+    # the server process runs request threads, which fork() does not copy safely
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+class ProcessExecutor:
+    """
+    A warm, long-lived process pool for CPU-bound algorithm calls. At most
+    `workers + queue_limit` calls are in flight; further calls fail fast
+    with PoolBusy instead of queueing without bound. Calls that do not
+    finish within their timeout raise PoolTimeout (the worker is left to
+    finish or hit its own cooperative deadline).
+    """
+
+    def __init__(self, workers: int = EXECUTOR_WORKERS, queue_limit: int = EXECUTOR_QUEUE_LIMIT,
+                 timeout: float = EXECUTOR_TIMEOUT_SECONDS):
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_context())
+                try:
+                    # start every worker now rather than on the first large request
+                    for future in [pool.submit(_warm) for _ in range(self.workers)]:
+                        future.result()
+                except BaseException:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                self._pool = pool
+            return self._pool
+
+    def start(self) -> None:
+        self._get_pool()
+
+    def _done(self, future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Call func(*args, **kwargs) in a worker process and return its result."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PoolBusy(f"All {self.workers} workers are busy and {self.queue_limit} calls are "
+                           f"already queued; retry later")
+        try:
+            future = self._get_pool().submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.in_flight += 1
+        # the slot is freed when the worker finishes, even if the caller gave up waiting
+        future.add_done_callback(self._done)
+        limit = self.timeout if timeout is None else min(timeout, self.timeout)
+        try:
+            return future.result(timeout=limit)
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise PoolTimeout(f"Call did not finish within {limit:g}s")
+        except BrokenProcessPool:
+            # a worker died (e.g. killed for memory); start a fresh pool on the next call
+            with self._lock:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = None
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "timeout_seconds": self.timeout,
+            "started": self._pool is not None,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
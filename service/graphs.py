@@ -0,0 +1,50 @@
+import os
+from typing import Any, Callable, Dict, Optional
+
+from algorithms.graphs.csr import CSRGraph, compile_graph
+from service.registry import VersionedRegistry
+
+DEFAULT_MEMORY_LIMIT = int(os.environ.get("GRAPH_MEMORY_LIMIT_BYTES", 512 * 1024 * 1024))
+
+
+class StoredGraph:
+    """A compiled CSR graph identified by (graph_id, version)."""
+
+    __slots__ = ("graph_id", "version", "csr")
+
+    def __init__(self, graph_id: str, version: int, csr: CSRGraph):
+        self.graph_id = graph_id
+        self.version = version
+        self.csr = csr
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "graph_id": self.graph_id,
+            "version": self.version,
+            "nodes": self.csr.num_nodes,
+            "edges": self.csr.num_edges,
+            "bytes": self.csr.nbytes,
+        }
+
+
+class GraphTooLarge(ValueError):
+    pass
+
+
+class GraphRegistry(VersionedRegistry):
+    """
+    Server-side store of compiled graphs with a total memory budget.
+    Least recently used graphs are evicted when the budget is exceeded.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        super().__init__(memory_limit)
+
+    def put(self, graph: Dict[Any, Any], graph_id: Optional[str] = None,
+            check: Optional[Callable[[], None]] = None) -> StoredGraph:
+        """Compile and store graph. Re-uploading an existing id bumps its version."""
+        csr = compile_graph(graph, check)
+        stored = self._store(graph_id, csr.nbytes, lambda item_id, version: StoredGraph(item_id, version, csr))
+        if stored is None:
+            raise GraphTooLarge(f"Graph needs {csr.nbytes} bytes, limit is {self.memory_limit}")
+        return stored
@@ -0,0 +1,139 @@
+import bisect
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# seconds; covers sub-millisecond lookups up to multi-second sorts
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# upper bounds of the input-size label; larger inputs are "inf"
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def size_bucket(n: Optional[int]) -> str:
+    """Input-size label: the smallest bucket bound >= n, "inf", or "unknown"."""
+    if n is None:
+        return "unknown"
+    i = bisect.bisect_left(SIZE_BUCKETS, n)
+    return str(SIZE_BUCKETS[i]) if i < len(SIZE_BUCKETS) else "inf"
+
+
+def size_label(data: Any) -> str:
+    """
+    Input-size label of a request body: requests against stored datasets,
+    graphs or corpora are "stored", otherwise the size bucket of the array,
+    graph, grid or text that was posted.
+    """
+    if not isinstance(data, dict):
+        return "unknown"
+    if data.get("dataset_id") is not None or data.get("graph_id") is not None:
+        return "stored"
+    for key in ("array", "graph", "neighbors", "text"):
+        value = data.get(key)
+        if isinstance(value, (list, dict, str)):
+            return size_bucket(len(value))
+    grid = data.get("grid")
+    if isinstance(grid, dict):
+        try:
+            return size_bucket(int(grid["width"]) * int(grid["height"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+    return "unknown"
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    items = list(labels) + list(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Dict[str, str], value: float = 1) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram per label set, in the Prometheus layout.
+    observe() is one bisect plus a few list updates under a lock.
+    """
+
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        # label set -> [per-bucket counts (+inf last), sum, count]
+        self._series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Dict[str, str], value: float) -> None:
+        key = _labels(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{self.name}_bucket{_format_labels(key, [('le', le)])} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class Registry:
+    """The metrics of one process, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self.requests = Counter(
+            "algorithm_requests_total", "Requests by endpoint, algorithm, input size bucket and status")
+        self.latency = Histogram(
+            "algorithm_request_seconds", "End-to-end request latency by endpoint, algorithm and input size")
+        self.phases = Histogram(
+            "algorithm_phase_seconds", "Time spent parsing the request, computing and serializing the response")
+        self.operations = Counter(
+            "algorithm_operations_total", "Operations reported by the algorithms (heap pushes, expansions, ...)")
+        self.cache = Counter(
+            "result_cache_lookups_total", "Result cache lookups by endpoint and result (hit or miss)")
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (self.requests, self.latency, self.phases, self.operations, self.cache):
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,52 @@
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from algorithms.strings.aho_corasick import AhoCorasick
+from service.registry import VersionedRegistry
+
+DEFAULT_MEMORY_LIMIT = int(os.environ.get("PATTERN_SET_MEMORY_LIMIT_BYTES", 256 * 1024 * 1024))
+
+
+class StoredPatternSet:
+    """A compiled Aho-Corasick automaton identified by (pattern_set_id, version)."""
+
+    __slots__ = ("pattern_set_id", "version", "automaton")
+
+    def __init__(self, pattern_set_id: str, version: int, automaton: AhoCorasick):
+        self.pattern_set_id = pattern_set_id
+        self.version = version
+        self.automaton = automaton
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "pattern_set_id": self.pattern_set_id,
+            "version": self.version,
+            "patterns": len(self.automaton.patterns),
+            "states": self.automaton.num_states,
+            "bytes": self.automaton.nbytes,
+        }
+
+
+class PatternSetTooLarge(ValueError):
+    pass
+
+
+class PatternSetRegistry(VersionedRegistry):
+    """
+    Server-side store of compiled keyword automata with a total memory budget.
+    Least recently used pattern sets are evicted when the budget is exceeded.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        super().__init__(memory_limit)
+
+    def put(self, patterns: List[str], pattern_set_id: Optional[str] = None,
+            check: Optional[Callable[[], None]] = None) -> StoredPatternSet:
+        """Compile and store patterns. Re-uploading an existing id bumps its version."""
+        automaton = AhoCorasick(patterns, check)
+        stored = self._store(pattern_set_id, automaton.nbytes,
+                             lambda item_id, version: StoredPatternSet(item_id, version, automaton))
+        if stored is None:
+            raise PatternSetTooLarge(
+                f"Pattern set needs {automaton.nbytes} bytes, limit is {self.memory_limit}")
+        return stored
@@ -0,0 +1,48 @@
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from algorithms.strings.aho_corasick import AhoCorasick
+from algorithms.strings.bmh_search import compile_bmh
+from algorithms.strings.kmp_search import compile_kmp
+from algorithms.strings.rabin_karp import compile_rabin_karp
+from service.lru import LRUCache
+
+DEFAULT_CACHE_BYTES = int(os.environ.get("PATTERN_CACHE_BYTES", 64 * 1024 * 1024))
+
+
+class PatternCache:
+    """
+    LRU cache of compiled search patterns (KMP failure tables, Horspool
+    shift tables, Rabin-Karp hash state, Aho-Corasick automata), keyed by
+    algorithm and pattern, so repeated searches for the same pattern skip
+    the preprocessing step.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self._cache = LRUCache(max_bytes)
+
+    def _get(self, key: Hashable, build: Callable[[], Any], nbytes: Callable[[Any], int]) -> Any:
+        compiled = self._cache.get(key)
+        if compiled is None:
+            compiled = build()
+            self._cache.put(key, compiled, nbytes(compiled))
+        return compiled
+
+    def kmp(self, pattern: str) -> List[int]:
+        return self._get(("kmp", pattern), lambda: compile_kmp(pattern),
+                         lambda lps: 8 * len(lps) + 2 * len(pattern) + 100)
+
+    def bmh(self, pattern: str) -> Dict[Any, int]:
+        return self._get(("bmh", pattern), lambda: compile_bmh(pattern),
+                         lambda shift: 100 * len(shift) + 2 * len(pattern) + 250)
+
+    def rabin_karp(self, pattern: str) -> Tuple[int, int]:
+        return self._get(("rabin", pattern), lambda: compile_rabin_karp(pattern),
+                         lambda state: len(pattern) + 150)
+
+    def aho_corasick(self, patterns: Sequence[str], check: Optional[Callable[[], None]] = None) -> AhoCorasick:
+        return self._get(("aho-corasick", tuple(patterns)), lambda: AhoCorasick(patterns, check),
+                         lambda automaton: automaton.nbytes)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
@@ -0,0 +1,27 @@
+import os
+import stat
+
+# one directory per user, so two users on a host never share files
+_USER = str(os.getuid()) if hasattr(os, "getuid") else "default"
+
+
+def user_directory(base: str, name: str) -> str:
+    """base/<name>-<uid>."""
+    return os.path.join(base, f"{name}-{_USER}")
+
+
+def private_directory(directory: str, what: str) -> None:
+    """
+    Create `directory` with mode 0700, or check that an existing one is a
+    real directory owned by this user and make it private: otherwise another
+    local user could plant or read files in it. `what` names the directory
+    in errors ("Result cache", "Corpus").
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"{what} path '{directory}' is not a directory")
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise PermissionError(f"{what} directory '{directory}' belongs to another user")
+    if st.st_mode & 0o077:
+        os.chmod(directory, 0o700)
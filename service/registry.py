@@ -0,0 +1,74 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from service.lru import LRUCache
+
+# how many evicted or deleted ids keep their last version
+DEFAULT_TOMBSTONES = int(os.environ.get("REGISTRY_TOMBSTONES", 10_000))
+
+
+class VersionedRegistry:
+    """
+    Thread-safe store of versioned objects with a total memory budget.
+    Least recently used objects are evicted when the budget is exceeded.
+    Re-uploading an id bumps its version. Only live ids and a bounded set
+    of tombstones (the last version of recently evicted or deleted ids)
+    are remembered, so an id that comes back soon continues its version
+    sequence instead of restarting at 1.
+    """
+
+    def __init__(self, memory_limit: int, max_tombstones: int = DEFAULT_TOMBSTONES):
+        self._cache = LRUCache(memory_limit, on_evict=self._bury)
+        self._versions: Dict[Hashable, int] = {}
+        self._tombstones: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._max_tombstones = max_tombstones
+        self._lock = threading.Lock()
+
+    @property
+    def memory_limit(self) -> int:
+        return self._cache.max_bytes
+
+    @property
+    def used_bytes(self) -> int:
+        return self._cache.used_bytes
+
+    def _store(self, item_id: Optional[str], nbytes: int, make: Callable[[str, int], Any]) -> Optional[Any]:
+        """
+        Store make(item_id, version) under item_id (a new random id if None).
+        Returns the stored object, or None if nbytes can never fit.
+        """
+        if nbytes > self._cache.max_bytes:
+            return None
+        item_id = item_id or uuid.uuid4().hex
+        with self._lock:
+            version = self._versions.get(item_id) or self._tombstones.pop(item_id, 0)
+            stored = make(item_id, version + 1)
+            self._versions[item_id] = version + 1
+            self._cache.put(item_id, stored, nbytes)
+            return stored
+
+    def get(self, item_id: str) -> Optional[Any]:
+        return self._cache.get(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        with self._lock:
+            if self._cache.pop(item_id) is None:
+                return False
+            self._bury(item_id, None)
+            return True
+
+    def _bury(self, item_id: Hashable, _stored: Any) -> None:
+        # called with self._lock held: from delete, or from the cache evicting during _store
+        version = self._versions.pop(item_id, None)
+        if version is None:
+            return
+        self._tombstones[item_id] = version
+        self._tombstones.move_to_end(item_id)
+        while len(self._tombstones) > self._max_tombstones:
+            self._tombstones.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._cache)
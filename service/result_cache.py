@@ -0,0 +1,205 @@
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from service.private_dirs import private_directory, user_directory
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def code_version() -> str:
+    """Digest of the application's Python sources, so a redeploy starts with a fresh key space."""
+    h = hashlib.blake2b(digest_size=8)
+    paths = [os.path.join(_ROOT, "app.py")]
+    for package in ("algorithms", "service"):
+        for dirpath, dirnames, filenames in os.walk(os.path.join(_ROOT, package)):
+            dirnames.sort()
+            paths += [os.path.join(dirpath, name) for name in sorted(filenames) if name.endswith(".py")]
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        h.update(os.path.relpath(path, _ROOT).encode() + b"\0" + data)
+    return h.hexdigest()
+
+
+# RAM-backed /dev/shm when the platform has it, so every worker process shares
+# one copy without touching the disk; one directory per user, readable only by
+# them. RESULT_CACHE_BYTES=0 turns the cache off
+_DEFAULT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+RESULT_CACHE_DIR = os.environ.get("RESULT_CACHE_DIR", user_directory(_DEFAULT_DIR, "search-algorithms-results"))
+RESULT_CACHE_BYTES = int(os.environ.get("RESULT_CACHE_BYTES", 256 * 1024 * 1024))
+RESULT_CACHE_TTL_SECONDS = float(os.environ.get("RESULT_CACHE_TTL_SECONDS", 3600))
+# part of every key: entries written by other code versions are never served
+RESULT_CACHE_VERSION = os.environ.get("RESULT_CACHE_VERSION") or code_version()
+
+# entry file: magic, created (unix time), status, length of the headers; then
+# the headers as "Name: value" lines and the body
+_HEADER = struct.Struct("<4sdHH")
+_MAGIC = b"RES1"
+
+
+def cache_key(parts: Iterable[bytes], version: str = RESULT_CACHE_VERSION) -> str:
+    """
+    128-bit BLAKE2b digest of the version and the parts, separated so that
+    ("ab", "c") != ("a", "bc").
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (version.encode(), *parts):
+        h.update(struct.pack("<Q", len(part)))
+        h.update(part)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed cache of finished responses, one file per entry in a
+    directory that all worker processes share. Entries expire after `ttl`
+    seconds; once the directory grows past `max_bytes`, the least recently
+    used entries (by file mtime, refreshed on every hit) are removed.
+    """
+
+    def __init__(self, directory: str = RESULT_CACHE_DIR, max_bytes: int = RESULT_CACHE_BYTES,
+                 ttl: float = RESULT_CACHE_TTL_SECONDS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        if self.enabled:
+            private_directory(directory, "Result cache")
+        self._lock = threading.Lock()
+        # bytes written since the directory size was last checked
+        self._written = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        """(status, headers, body) of a live entry, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = None
+        if raw is not None and len(raw) >= _HEADER.size:
+            magic, created, status, headers_len = _HEADER.unpack_from(raw)
+            if magic != _MAGIC or time.time() - created > self.ttl:
+                self._remove(path)
+                raw = None
+        else:
+            raw = None
+        if raw is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        start = _HEADER.size + headers_len
+        lines = raw[_HEADER.size:start].decode("latin-1").splitlines()
+        return status, [tuple(line.split(": ", 1)) for line in lines], raw[start:]
+
+    def put(self, key: str, status: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        # one entry may not take more than an eighth of the cache
+        if len(body) > self.max_bytes // 8:
+            return
+        encoded = "".join(f"{name}: {value}\n" for name, value in headers).encode("latin-1")
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, time.time(), status, len(encoded)))
+                f.write(encoded)
+                f.write(body)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # e.g. the shared-memory filesystem is full: the response is simply not cached
+            self._remove(tmp)
+            self.evict()
+            return
+        except BaseException:
+            self._remove(tmp)
+            raise
+        with self._lock:
+            self.stores += 1
+            self._written += len(body)
+            check = self._written > self.max_bytes // 16
+            if check:
+                self._written = 0
+        if check:
+            self.evict()
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _entries(self):
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.startswith("."):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the directory is back under 90% of max_bytes."""
+        entries = list(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        if total > self.max_bytes:
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= self.max_bytes * 0.9:
+                    break
+                if self._remove(path):
+                    removed += 1
+                total -= size
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> int:
+        if not self.enabled:
+            return 0
+        return sum(self._remove(path) for path, _, _ in list(self._entries()))
+
+    def describe(self) -> Dict[str, Any]:
+        entries = list(self._entries()) if self.enabled else []
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            # counters are per worker process; entries are shared
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
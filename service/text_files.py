@@ -0,0 +1,29 @@
+import mmap
+import os
+from typing import Iterator, Optional
+
+# Server-side text files that /string/<algo>/all can search with ?file=<name>
+TEXT_FILES_DIR = os.environ.get("TEXT_FILES_DIR", os.path.join(os.getcwd(), "data"))
+CHUNK_SIZE = 1 << 20
+
+
+def resolve(name: str, root: str = TEXT_FILES_DIR) -> Optional[str]:
+    """Path of file `name` under root, or None if it is missing or escapes root."""
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, name))
+    if not path.startswith(root + os.sep) or not os.path.isfile(path):
+        return None
+    return path
+
+
+def mmap_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file as consecutive byte chunks through mmap. Only the current
+    chunk is copied out, and the OS pages the rest in and out as needed.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(0, len(mm), chunk_size):
+                yield mm[i:i + chunk_size]
@@ -0,0 +1,55 @@
+import os
+import uuid
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+from service.lru import LRUCache
+
+DEFAULT_CACHE_BYTES = int(os.environ.get("WALK_CURSOR_BYTES", 64 * 1024 * 1024))
+# bytes charged per node a paused walk has visited (its seen set and queue entries)
+_BYTES_PER_NODE = 100
+
+
+class PausedWalk:
+    """
+    A bfs/dfs walk over a stored graph, stopped after one page. `walk` is the
+    live generator, so the next page continues from its queue or stack
+    instead of walking the first `position` nodes again.
+    """
+
+    __slots__ = ("key", "position", "walk", "deadline_check")
+
+    def __init__(self, key: Hashable, position: int = 0, walk: Optional[Iterator[Any]] = None):
+        self.key = key
+        self.position = position
+        self.walk = walk
+        # deadline of the request currently consuming the walk
+        self.deadline_check: Optional[Callable[[], None]] = None
+
+    def check(self) -> None:
+        if self.deadline_check is not None:
+            self.deadline_check()
+
+
+class WalkCursors:
+    """
+    LRU store of paused walks keyed by a random token. A token is used once:
+    resuming removes the walk, and pausing it again issues a new token.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self._cache = LRUCache(max_bytes)
+
+    def pause(self, paused: PausedWalk) -> str:
+        token = uuid.uuid4().hex[:16]
+        self._cache.put(token, paused, _BYTES_PER_NODE * max(1, paused.position))
+        return token
+
+    def resume(self, token: str, key: Hashable, position: int) -> Optional[PausedWalk]:
+        """The walk paused under token at `position` for the same graph and options, or None."""
+        paused = self._cache.pop(token)
+        if paused is None or paused.key != key or paused.position != position:
+            return None
+        return paused
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
@@ -0,0 +1,49 @@
+# tests/test_admission.py
+import pytest
+from algorithms.sorts.bubble_sort import bubble_sort
+from algorithms.graphs.bfs import bfs
+from algorithms.graphs.dfs import dfs
+from algorithms.graphs.dijkstra import dijkstra
+from service.admission import AdmissionController, Deadline, DeadlineExceeded, QueueFull, WorkTooLarge
+
+def test_admission_decisions():
+    ac = AdmissionController(max_work=1e6, low_priority_work=1e4, low_priority_slots=1, low_priority_wait=0.01)
+    assert not ac.admit("sort", "merge", 100).low_priority
+    assert ac.admit("sort", "bubble", 1000).low_priority
+    with pytest.raises(WorkTooLarge):
+        ac.admit("sort", "bubble", 10_000)
+    ticket = ac.admit("sort", "bubble", 10_000, allow_downgrade=True)
+    assert (ticket.algorithm, ticket.downgraded_from) == ("hybrid_merge", "bubble")
+    assert ac.admit("sort", "bubble", 10, deadline_ms=50).deadline.seconds == 0.05
+
+def test_low_priority_slots():
+    ac = AdmissionController(max_work=1e6, low_priority_work=1e4, low_priority_slots=1, low_priority_wait=0.01)
+    with ac.admit("sort", "bubble", 1000):
+        with pytest.raises(QueueFull):
+            with ac.admit("string", "naive", 10_000, 100):
+                pass
+        with ac.admit("sort", "merge", 1000):
+            pass
+    with ac.admit("sort", "bubble", 1000):
+        pass
+
+def test_deadline_cancels_quadratic_sort():
+    with pytest.raises(DeadlineExceeded):
+        bubble_sort(list(range(3000, 0, -1)), check=Deadline(0).check)
+    assert bubble_sort([3, 1, 2], check=Deadline(10).check) == [1, 2, 3]
+
+def test_deadline_cancels_graph_searches():
+    chain = {i: [i + 1] for i in range(5000)}
+    weighted = {i: {i + 1: 1} for i in range(5000)}
+    weighted[5000] = {}
+    for search, graph in ((bfs, chain), (dfs, chain), (dijkstra, weighted)):
+        with pytest.raises(DeadlineExceeded):
+            search(graph, 0, check=Deadline(0).check)
+    assert len(dijkstra(weighted, 0, check=Deadline(10).check)) == 5001
+
+def test_every_admitted_route_has_a_cost_model():
+    ac = AdmissionController(max_work=1e6)
+    assert ac.estimate("matrix", "dijkstra", 100, 10_000) > ac.estimate("graph", "dijkstra", 10_000, 0)
+    with pytest.raises(WorkTooLarge):
+        ac.admit("select", "median", 10 ** 6)
+    assert "corpus/locate" in ac.describe()["complexity"]
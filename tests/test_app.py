@@ -0,0 +1,122 @@
+# tests/test_app.py
+import pytest
+
+import app as app_module
+from service.corpora import CorpusStore
+from service.result_cache import ResultCache
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # keep cached responses and corpus files out of the shared default directories
+    monkeypatch.setattr(app_module, "result_cache", ResultCache(str(tmp_path / "results")))
+    monkeypatch.setattr(app_module, "corpora", CorpusStore(str(tmp_path / "corpora")))
+    return app_module.app.test_client()
+
+def test_select_rejects_bool_k_and_incomparable_values(client):
+    assert client.post("/select/topk", json={"array": [3, 1, 2], "k": True}).status_code == 400
+    assert client.post("/select/nth", json={"array": [3, 1, 2], "n": False}).status_code == 400
+    assert client.post("/select/topk", json={"array": [1, "a"], "k": 1}).status_code == 400
+    assert client.post("/select/median", json={"array": [1, "a", 2]}).status_code == 400
+    assert client.post("/select/topk", json={"array": [3, 1, 2], "k": 2}).get_json()["result"] == [1, 2]
+
+def test_select_median_of_strings(client):
+    response = client.post("/select/median", json={"array": ["b", "a"]})
+    assert response.status_code == 200 and response.get_json()["result"] == "a"
+    assert client.post("/select/median", json={"array": [4, 1, 3, 2]}).get_json()["result"] == 2.5
+
+def test_dijkstra_targets_must_be_node_ids(client):
+    graph = {"A": {"B": 1}, "B": {"C": 2}, "C": {}}
+    response = client.post("/graph/dijkstra", json={"graph": graph, "start": "A", "targets": [["x"]]})
+    assert response.status_code == 400
+    response = client.post("/graph/dijkstra", json={"graph": graph, "start": "A", "target": "C"})
+    assert response.get_json()["results"] == [{"target": "C", "distance": 3, "path": ["A", "B", "C"]}]
+
+def test_corpus_upload_over_the_limit_is_413(client, monkeypatch):
+    monkeypatch.setattr(app_module.corpora, "max_bytes", 10)
+    assert client.post("/corpora", json={"text": "x" * 11}).status_code == 413
+    response = client.post("/corpora", json={"text": "banana", "corpus_id": "fruit"})
+    assert response.status_code == 201
+    response = client.post("/corpora/fruit/search", json={"op": "count", "pattern": "an"})
+    assert response.get_json()["count"] == 2
+
+def test_metrics_never_label_unknown_algorithms(client):
+    assert client.post("/search/zzzzz1", json={}).status_code == 400
+    assert client.post("/sort/qqqq2", json={}).status_code == 400
+    assert client.post("/string/nope", json={"text": "a", "pattern": "a"}).status_code == 404
+    assert client.post("/search/binary", json={}).status_code == 400
+    body = client.get("/metrics").get_data(as_text=True)
+    assert "zzzzz1" not in body and "qqqq2" not in body and "nope" not in body
+    assert 'algorithm="unknown"' in body and 'algorithm="binary"' in body
+
+def test_uploads_and_aho_corasick_are_admitted_with_deadlines(client, monkeypatch):
+    with monkeypatch.context() as limits:
+        limits.setattr(app_module.admission, "max_work", 1000)
+        assert client.post("/datasets", json={"array": list(range(1000))}).status_code == 413
+        assert client.post("/graphs", json={"graph": {str(i): [] for i in range(600)}}).status_code == 413
+        assert client.post("/pattern-sets", json={"patterns": ["x" * 400]}).status_code == 413
+        assert client.post("/corpora", json={"text": "x" * 100}).status_code == 413
+        assert client.post("/string/aho-corasick", json={"text": "x" * 600, "patterns": ["x"]}).status_code == 413
+
+    text = "".join(chr(97 + (i * 7919) % 23) for i in range(300_000))
+    response = client.post("/string/aho-corasick", json={"text": text, "patterns": ["abc", "q"], "deadline_ms": 1})
+    assert response.status_code == 503
+    response = client.post("/corpora", json={"text": text[:100_000], "deadline_ms": 1})
+    assert response.status_code == 503
+    response = client.post("/string/aho-corasick", json={"text": "ushers", "patterns": ["he", "she"]})
+    assert response.get_json()["matches"] == {"he": [2], "she": [1]}
+
+def test_result_cache_answers_repeats_before_parsing(client, monkeypatch):
+    body = {"array": [3, 1, 2]}
+    first = client.post("/sort/merge", json=body)
+    assert first.headers["X-Cache"] == "miss"
+
+    def parse_again():
+        raise AssertionError("a cache hit must not parse the body")
+    monkeypatch.setattr(app_module, "_read_body", parse_again)
+    second = client.post("/sort/merge", json=body)
+    assert second.headers["X-Cache"] == "hit"
+    assert second.get_json() == first.get_json() == {"algorithm": "merge", "sorted": [1, 2, 3]}
+
+def test_result_cache_stores_only_plain_200s(client):
+    # errors are not stored
+    for _ in range(2):
+        assert client.post("/sort/merge", json={}).headers["X-Cache"] == "miss"
+    # stored datasets and graphs can change under the same body
+    client.post("/datasets", json={"array": [5, 1], "dataset_id": "nums"})
+    client.post("/graphs", json={"graph": {"A": ["B"]}, "graph_id": "g"})
+    for _ in range(2):
+        assert client.post("/search/binary", json={"dataset_id": "nums", "target": 5}).headers["X-Cache"] == "miss"
+        assert client.post("/graph/bfs", json={"graph_id": "g", "start": "A"}).headers["X-Cache"] == "miss"
+    client.post("/datasets", json={"array": [7, 5], "dataset_id": "nums"})
+    assert client.post("/search/binary", json={"dataset_id": "nums", "target": 5}).get_json()["index"] == 0
+    # streamed responses are not stored
+    walk = {"graph": {"A": ["B"], "B": []}, "start": "A", "stream": True}
+    for _ in range(2):
+        response = client.post("/graph/bfs", json=walk)
+        assert response.headers["X-Cache"] == "miss" and response.is_streamed
+        assert response.get_data(as_text=True).splitlines()[-1] == '{"next_cursor": null}'
+    assert app_module.result_cache.describe()["entries"] == 0
+
+def test_paged_walks_over_http(client):
+    graph = {str(i): [str(i + 1)] for i in range(9)}
+    client.post("/graphs", json={"graph": graph, "graph_id": "line"})
+    seen, cursor = [], None
+    while True:
+        page = client.post("/graph/bfs", json={"graph_id": "line", "start": "0", "max_nodes": 4,
+                                               "cursor": cursor}).get_json()
+        seen += page["result"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        assert cursor.startswith("1.")
+    assert seen == [str(i) for i in range(10)]
+
+    page = client.post("/graph/bfs", json={"graph_id": "line", "start": "0", "max_nodes": 4}).get_json()
+    client.post("/graphs", json={"graph": graph, "graph_id": "line"})
+    stale = client.post("/graph/bfs", json={"graph_id": "line", "start": "0", "max_nodes": 4,
+                                            "cursor": page["next_cursor"]})
+    assert stale.status_code == 409
+
+    # inline graphs page by the number of nodes to skip
+    page = client.post("/graph/dfs", json={"graph": graph, "start": "0", "max_nodes": 4, "cursor": 4}).get_json()
+    assert page == {"algorithm": "dfs", "result": ["4", "5", "6", "7"], "next_cursor": 8}
@@ -0,0 +1,17 @@
+# tests/test_benchmarks.py
+from benchmarks.cases import all_cases
+from benchmarks.run import compare, measure
+
+def test_measure_counts_comparisons():
+    case = next(c for c in all_cases() if c.name == "merge_sort")
+    result = measure(case, 200, "uniform", repeat=1)
+    assert result["seconds"] > 0 and result["peak_bytes"] > 0
+    assert 0 < result["comparisons"] < 200 * 8  # n log2 n
+
+def test_compare_flags_regressions_only():
+    base = [{"group": "sorts", "case": "x", "size": 10, "distribution": "uniform",
+             "seconds": 0.1, "peak_bytes": 1000, "comparisons": 100}]
+    same = [dict(base[0], seconds=0.11, comparisons=100)]
+    slower = [dict(base[0], seconds=0.2, comparisons=150)]
+    assert compare(same, base) == []
+    assert {r["metric"] for r in compare(slower, base)} == {"seconds", "comparisons"}
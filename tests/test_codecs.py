@@ -0,0 +1,37 @@
+# tests/test_codecs.py
+import struct
+from array import array
+
+import pytest
+from service import codecs
+
+def test_packed_and_npy_round_trip():
+    a = array("q", [5, -3, 2 ** 40])
+    assert codecs.unpack_array(codecs.pack_array(a), "i8") == a
+    assert codecs.read_npy(codecs.write_npy(a)) == a
+    f = codecs.to_array([1.5, 2], "f4")
+    assert codecs.read_npy(codecs.write_npy(f)).tolist() == [1.5, 2.0]
+    assert (len(codecs.write_npy(a)) - 3 * 8) % 64 == 0  # header padded to 64 bytes
+
+def test_npy_written_by_numpy_layout():
+    header = b"{'descr': '<i4', 'fortran_order': False, 'shape': (2,), }"
+    header += b" " * (-(len(header) + 11) % 64) + b"\n"
+    body = b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header + struct.pack("<2i", 7, -1)
+    assert codecs.read_npy(body).tolist() == [7, -1]
+    with pytest.raises(ValueError):
+        codecs.read_npy(body[:-1])
+    with pytest.raises(ValueError):
+        codecs.unpack_array(b"\x00" * 8, ">i8")
+
+def test_json_codec_fallbacks():
+    assert codecs.loads(b'{"a": [1, 2.5]}') == {"a": [1, 2.5]}
+    assert codecs.loads("[%d]" % (2 ** 70 + 1)) == [2 ** 70 + 1]
+    assert codecs.loads(b"[%d, 1.5]" % (2 ** 64)) == [2 ** 64, 1.5]
+    inf = float("inf")
+    for payload in ({"distances": {"a": 0.0, "b": inf}}, [1, [2.5, float("nan")]], [{"x": "s", "d": -inf}]):
+        assert codecs.dumps(payload) is None  # left to json, which writes Infinity / NaN
+    if codecs.orjson is not None:
+        assert codecs.dumps({"b": [1, 2.5], "a": ["s", None]}) == b'{"a":["s",null],"b":[1,2.5]}'
+    assert codecs.negotiate("application/x-npy;q=0.9, application/json") == codecs.NPY
+    assert codecs.negotiate("*/*") is None
+    assert codecs.media_type('application/octet-stream; dtype="f8"') == (codecs.PACKED, {"dtype": "f8"})
@@ -0,0 +1,42 @@
+# tests/test_datasets.py
+from array import array
+from algorithms.searches.binary_search import binary_search
+from service.datasets import DatasetRegistry, compact
+
+def test_compact_storage():
+    assert compact([3, 1, 2]).typecode == "q"
+    assert compact([1, 2.5]).typecode == "d"
+    assert isinstance(compact(["a", "b"]), list)
+    assert isinstance(compact([2 ** 70]), list)
+
+def test_put_sorts_and_versions():
+    reg = DatasetRegistry()
+    ds = reg.put([91, 2, 38, 16], "nums")
+    assert ds.version == 1 and list(ds.data) == [2, 16, 38, 91]
+    assert binary_search(reg.get("nums").data, 38) == 2
+    assert reg.put([1], "nums").version == 2
+
+def test_lru_eviction():
+    one = DatasetRegistry().put(list(range(100)), "x").nbytes
+    reg = DatasetRegistry(memory_limit=2 * one)
+    reg.put(list(range(100)), "a")
+    reg.put(list(range(100)), "b")
+    reg.get("a")
+    reg.put(list(range(100)), "c")
+    assert reg.get("b") is None
+    assert reg.get("a") is not None and reg.get("c") is not None
+
+def test_versions_kept_for_live_ids_and_bounded_tombstones():
+    one = DatasetRegistry().put(list(range(100)), "x").nbytes
+    reg = DatasetRegistry(memory_limit=2 * one)
+    reg._max_tombstones = 2
+    assert reg.put(list(range(100)), "a").version == 1
+    assert reg.put(list(range(100)), "a").version == 2
+    for name in "bcde":
+        reg.put(list(range(100)), name)
+    assert set(reg._versions) == {"d", "e"}
+    assert list(reg._tombstones) == ["b", "c"]
+    assert reg.delete("e") and list(reg._tombstones) == ["c", "e"]
+    # "c" comes back within the tombstone window; "a" fell out of it
+    assert reg.put(list(range(100)), "c").version == 2
+    assert reg.put(list(range(100)), "a").version == 1
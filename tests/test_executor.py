@@ -0,0 +1,33 @@
+# tests/test_executor.py
+import threading
+import time
+
+import pytest
+from algorithms.graphs.dijkstra import dijkstra
+from algorithms.sorts.merge_sort import merge_sort
+from service.executor import PoolBusy, PoolTimeout, ProcessExecutor, call_with_stats
+
+@pytest.fixture(scope="module")
+def executor():
+    ex = ProcessExecutor(workers=1, queue_limit=0, timeout=10)
+    ex.start()
+    yield ex
+    ex.shutdown()
+
+def test_runs_calls_in_worker_process(executor):
+    assert executor.run(merge_sort, [5, 2, 9, 1]) == [1, 2, 5, 9]
+    distances, stats = executor.run(call_with_stats, dijkstra, {"A": {"B": 2}, "B": {}}, "A")
+    assert distances == {"A": 0, "B": 2}
+    assert stats["heap_pushes"] == 2
+
+def test_backpressure_and_timeout(executor):
+    slow = threading.Thread(target=executor.run, args=(time.sleep, 0.5))
+    slow.start()
+    time.sleep(0.1)
+    with pytest.raises(PoolBusy):
+        executor.run(merge_sort, [1])
+    slow.join()
+    with pytest.raises(PoolTimeout):
+        executor.run(time.sleep, 0.5, timeout=0.05)
+    time.sleep(0.5)
+    assert executor.run(merge_sort, [2, 1]) == [1, 2]
@@ -1,7 +1,16 @@
 # tests/test_graphs.py
-from algorithms.graphs.bfs import bfs
-from algorithms.graphs.dfs import dfs
-from algorithms.graphs.dijkstra import dijkstra
+import pytest
+from algorithms.graphs.bfs import bfs, bfs_csr, bfs_iter, bfs_levels
+from algorithms.graphs.dfs import dfs, dfs_csr, dfs_iter
+from algorithms.graphs.dijkstra import (
+    dijkstra, dijkstra_csr, dijkstra_to, reconstruct_path,
+    bidirectional_dijkstra, bidirectional_dijkstra_csr
+)
+from algorithms.graphs.csr import compile_graph
+from algorithms.graphs.all_pairs import floyd_warshall_csr, many_to_many
+from algorithms.graphs.grid_astar import Grid, grid_a_star
+from service.dynamic_graphs import DynamicGraphStore, DynamicGraphTooLarge
+from service.walks import PausedWalk, WalkCursors
 
 GRAPH = {
     "A": ["B","C"],
@@ -28,3 +37,144 @@ def test_dijkstra_simple():
     }
     dist = dijkstra(g, "A")
     assert dist["D"] == 4  # A->B->C->D cost 1+2+1 = 4
+
+def test_lazy_traversals():
+    neighbors = lambda v: GRAPH.get(v, [])
+    assert [v for v, _ in bfs_iter(neighbors, "A")] == bfs(GRAPH, "A")
+    assert [v for v, _ in dfs_iter(neighbors, "A")] == dfs(GRAPH, "A")
+    assert list(bfs_levels(bfs_iter(neighbors, "A"))) == [(0, ["A"]), (1, ["B", "C"]), (2, ["D", "E"])]
+    assert list(dfs_iter(neighbors, "A", max_depth=1)) == [("A", 0), ("B", 1), ("C", 1)]
+
+def test_csr_traversals_match():
+    g = compile_graph(GRAPH)
+    labels = g.labels
+    assert [labels[v] for v in bfs_csr(g, g.id_of("A"))] == bfs(GRAPH, "A")
+    assert [labels[v] for v in dfs_csr(g, g.id_of("A"))] == dfs(GRAPH, "A")
+
+def test_csr_dijkstra():
+    g = compile_graph({"A": {"B": 1, "C": 4}, "B": {"C": 2, "D": 5}, "C": {"D": 1}, "E": {}})
+    dist = dijkstra_csr(g, g.id_of("A"))
+    assert dist[g.id_of("D")] == 4
+    assert dist[g.id_of("E")] == float("inf")
+    assert g.num_nodes == 5 and g.num_edges == 5
+
+ROADS = {
+    "A": {"B": 1, "C": 4},
+    "B": {"C": 2, "D": 5},
+    "C": {"D": 1},
+    "D": {"E": 3},
+    "E": {},
+    "F": {"A": 1}
+}
+
+def test_dijkstra_to_stops_early_and_returns_path():
+    dist, pred = dijkstra_to(ROADS, "A", ["C"])
+    assert dist["C"] == 3
+    assert reconstruct_path(pred, "C") == ["A", "B", "C"]
+    assert "E" not in dist  # never reached before C was settled
+    assert reconstruct_path(dijkstra_to(ROADS, "A", ["F"])[1], "F") == []
+
+def test_bidirectional_dijkstra():
+    assert bidirectional_dijkstra(ROADS, "A", "E") == (7, ["A", "B", "C", "D", "E"])
+    assert bidirectional_dijkstra(ROADS, "E", "A") == (float("inf"), [])
+    g = compile_graph(ROADS)
+    distance, path = bidirectional_dijkstra_csr(g, g.id_of("F"), g.id_of("E"))
+    assert distance == 8 and [g.labels[v] for v in path] == ["F", "A", "B", "C", "D", "E"]
+
+MAZE = Grid(4, 3, "0100"
+                  "0101"
+                  "0000")
+
+def test_grid_a_star_four_connected():
+    cost, path = grid_a_star(MAZE, (0, 0), (2, 0))
+    assert cost == 6
+    assert path == [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)]
+    assert grid_a_star(MAZE, (0, 0), (1, 0)) == (float("inf"), [])
+
+def test_grid_a_star_costs_and_diagonals():
+    weighted = Grid(3, 2, [0] * 6, costs=[1, 9, 1, 1, 1, 1])
+    assert grid_a_star(weighted, (0, 0), (2, 0)) == (4, [(0, 0), (0, 1), (1, 1), (2, 1), (2, 0)])
+    open_grid = Grid(5, 5, [0] * 25)
+    cost, path = grid_a_star(open_grid, (0, 0), (4, 2), diagonal=True)
+    jps_cost, jps_path = grid_a_star(open_grid, (0, 0), (4, 2), diagonal=True, jump_points=True)
+    assert abs(cost - (2 + 2 * 2 ** 0.5)) < 1e-9 and abs(jps_cost - cost) < 1e-9
+    assert len(path) == len(jps_path) == 5
+
+def test_dynamic_graph_repairs_cached_dijkstra():
+    store = DynamicGraphStore()
+    store.create(ROADS, "roads")
+    assert store.shortest_paths("roads", "A") == ({"A": 0, "B": 1, "C": 3, "D": 4, "E": 7}, "computed")
+    assert store.shortest_paths("roads", "A")[1] == "hit"
+    # delete a tree edge, add a shortcut, reweight another edge
+    store.update("roads", [("B", "C", None), ("A", "D", 2), ("D", "E", 1)])
+    dist, how = store.shortest_paths("roads", "A")
+    assert how == "repaired"
+    assert dist == {"A": 0, "B": 1, "C": 4, "D": 2, "E": 3}
+    assert store.stats()["repairs"] == 1
+
+def test_dynamic_graph_locks_per_graph_and_checks_deadline():
+    store = DynamicGraphStore()
+    store.create(ROADS, "roads")
+    chain_graph = {i: {i + 1: 1} for i in range(3000)}
+    store.create(chain_graph, "chain")
+    with store.get("chain").lock:
+        # a computation holding one graph does not block another
+        assert store.shortest_paths("roads", "A")[1] == "computed"
+
+    def expired():
+        raise TimeoutError
+    with pytest.raises(TimeoutError):
+        store.shortest_paths("chain", 0, expired)
+    store.shortest_paths("chain", 0)
+    store.update("chain", [(0, 1, 2)])
+    with pytest.raises(TimeoutError):
+        store.shortest_paths("chain", 0, expired)
+    # the interrupted repair dropped its half-updated result
+    assert store.shortest_paths("chain", 0) == ({i: i + 1 if i else 0 for i in range(3001)}, "computed")
+    # a graph replaced under the same id never reuses the old graph's results
+    store.create({"A": {"Z": 5}}, "roads")
+    assert store.shortest_paths("roads", "A") == ({"A": 0, "Z": 5}, "computed")
+
+def test_dynamic_graph_store_is_bounded():
+    store = DynamicGraphStore(memory_limit=3000)
+    store.create({"a": {"b": 1}}, "one")
+    store.create({"c": {"d": 1}}, "two")
+    with pytest.raises(DynamicGraphTooLarge):
+        store.update("two", [(str(i), str(i + 1), 1) for i in range(20)])
+    assert store.get("two").num_edges == 1  # nothing applied
+    store.update("two", [("d", "e", 1)])
+    assert store.get("one") is None  # evicted to make room
+    with pytest.raises(DynamicGraphTooLarge):
+        store.create({str(i): {str(i + 1): 1} for i in range(10)})
+
+def test_many_to_many_matches_dijkstra():
+    g = compile_graph(ROADS)
+    expected = [list(dijkstra_csr(g, s)) for s in range(g.num_nodes)]
+    assert [list(row) for row in floyd_warshall_csr(g)] == expected
+    sources = [g.id_of("F"), g.id_of("A"), g.id_of("E")]
+    for workers in (1, 2):
+        rows = list(many_to_many(g, sources, workers=workers, min_parallel_work=0))
+        assert [s for s, _ in rows] == sources
+        assert [list(row) for _, row in rows] == [expected[s] for s in sources]
+
+def test_dijkstra_operation_stats():
+    g = {"A": {"B": 1, "C": 4}, "B": {"C": 1}, "C": {}}
+    stats = {}
+    dijkstra(g, "A", stats)
+    assert stats == {"heap_pushes": 4, "heap_pops": 4, "expansions": 3}
+    csr_stats = {}
+    dijkstra_csr(compile_graph(g), 0, csr_stats)
+    assert csr_stats == stats
+
+def test_paused_walk_resumes_once():
+    cursors = WalkCursors()
+    paused = PausedWalk(("g", 1))
+    walk = bfs_iter(lambda v: GRAPH.get(v, []), "A", check=paused.check)
+    first = [next(walk)[0], next(walk)[0]]
+    paused.position, paused.walk = 2, walk
+    token = cursors.pause(paused)
+    assert cursors.resume(token, ("g", 2), 2) is None  # other graph version
+    token = cursors.pause(paused)
+    resumed = cursors.resume(token, ("g", 1), 2)
+    assert first + [v for v, _ in resumed.walk] == bfs(GRAPH, "A")
+    assert cursors.resume(token, ("g", 1), 2) is None  # tokens are single-use
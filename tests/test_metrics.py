@@ -0,0 +1,28 @@
+# tests/test_metrics.py
+from service.metrics import Histogram, Registry, size_bucket, size_label
+
+def test_size_labels():
+    assert size_bucket(5) == "100"
+    assert size_bucket(1000) == "1000"
+    assert size_bucket(10 ** 9) == "inf"
+    assert size_label({"array": list(range(500))}) == "1000"
+    assert size_label({"dataset_id": "nums", "target": 3}) == "stored"
+    assert size_label({"grid": {"width": 100, "height": 100}}) == "10000"
+    assert size_label(None) == "unknown"
+
+def test_histogram_render():
+    h = Histogram("latency_seconds", "test", buckets=(0.1, 1.0))
+    for v in (0.05, 0.5, 5.0):
+        h.observe({"algorithm": "quick"}, v)
+    lines = h.render()
+    assert 'latency_seconds_bucket{algorithm="quick",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{algorithm="quick",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{algorithm="quick",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{algorithm="quick"} 3' in lines
+
+def test_registry_render_escapes_labels():
+    m = Registry()
+    m.operations.inc({"algorithm": 'a"b', "op": "heap_pushes"}, 4)
+    text = m.render()
+    assert '# TYPE algorithm_request_seconds histogram' in text
+    assert 'algorithm_operations_total{algorithm="a\\"b",op="heap_pushes"} 4' in text
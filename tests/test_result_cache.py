@@ -0,0 +1,46 @@
+# tests/test_result_cache.py
+import os
+import time
+
+import pytest
+from service.result_cache import ResultCache, cache_key
+
+HEADERS = [("Content-Type", "application/json"), ("X-Algorithm", "merge")]
+
+def test_round_trip_and_key_separation(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=1 << 20, ttl=60)
+    key = cache_key([b"/sort/merge", b'{"array":[2,1]}'])
+    assert key != cache_key([b"/sort/merge{", b'"array":[2,1]}'])
+    assert key != cache_key([b"/sort/merge", b'{"array":[2,1]}'], version="other")
+    assert cache.get(key) is None
+    cache.put(key, 200, HEADERS, b'{"sorted":[1,2]}')
+    assert cache.get(key) == (200, HEADERS, b'{"sorted":[1,2]}')
+    # a second cache on the same directory (another worker) sees the entry
+    assert ResultCache(str(tmp_path)).get(key) is not None
+    assert cache.describe()["hits"] == 1 and cache.describe()["entries"] == 1
+
+def test_ttl_and_lru_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=8000, ttl=60)
+    body = b"x" * 900
+    for i in range(8):
+        cache.put(str(i), 200, HEADERS, body)
+        os.utime(tmp_path / str(i), (i, i))
+    cache.get("0")  # recently used, so it survives
+    cache.put("8", 200, HEADERS, body)
+    cache.evict()
+    left = set(os.listdir(tmp_path))
+    assert "0" in left and "8" in left and "1" not in left
+    expired = ResultCache(str(tmp_path), max_bytes=8000, ttl=0)
+    time.sleep(0.01)
+    assert expired.get("0") is None and "0" not in os.listdir(tmp_path)
+
+def test_directory_is_private(tmp_path):
+    ResultCache(str(tmp_path / "new"))
+    assert (tmp_path / "new").stat().st_mode & 0o777 == 0o700
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    ResultCache(str(shared))
+    assert shared.stat().st_mode & 0o777 == 0o700
+    (tmp_path / "link").symlink_to(shared)
+    with pytest.raises(PermissionError):
+        ResultCache(str(tmp_path / "link"))
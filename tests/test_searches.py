@@ -1,10 +1,11 @@
 # tests/test_searches.py
 import pytest
-from algorithms.searches.linear_search import linear_search
-from algorithms.searches.binary_search import binary_search
+from array import array
+from algorithms.searches.linear_search import linear_search, linear_search_many
+from algorithms.searches.binary_search import binary_search, binary_search_many
 from algorithms.searches.jump_search import jump_search
-from algorithms.searches.interpolation_search import interpolation_search
-from algorithms.searches.exponential_search import exponential_search
+from algorithms.searches.interpolation_search import interpolation_search, interpolation_search_many
+from algorithms.searches.exponential_search import exponential_search, exponential_search_many
 from algorithms.searches.fibonacci_search import fibonacci_search
 
 S = [2,5,8,12,16,23,38,56,72,91]
@@ -29,3 +30,42 @@ def test_exponential_search_found():
 
 def test_fibonacci_search_found():
     assert fibonacci_search(S, 91) == 9
+
+def test_batched_searches():
+    targets = [91, 2, 7, 38, 100]
+    expected = [9, 0, -1, 6, -1]
+    assert binary_search_many(S, targets) == expected
+    assert interpolation_search_many(S, targets) == expected
+    assert exponential_search_many(S, targets) == expected
+
+def test_batched_searches_sorted_targets():
+    targets = sorted(S + [0, 7, 50, 99])
+    expected = [S.index(t) if t in S else -1 for t in targets]
+    assert binary_search_many(S, targets) == expected
+    assert exponential_search_many(S, targets) == expected
+    assert exponential_search_many(S, [8, 91]) == [2, 9]
+
+@pytest.mark.parametrize("func", [linear_search, binary_search, jump_search,
+                                  interpolation_search, exponential_search, fibonacci_search])
+def test_bounded_search_on_buffers(func):
+    buf = memoryview(array("q", S))
+    assert func(buf, 23) == 5
+    assert func(buf, 23, 2, 8) == 5
+    assert func(buf, 23, 6) == -1
+    assert func(buf, 23, 0, 5) == -1
+    assert func(array("q"), 23) == -1
+
+def test_interpolation_search_equal_values():
+    assert interpolation_search([4, 4, 4], 4) == 0
+
+def test_linear_search_many_matches_linear_search():
+    arr = [5, 3, 5, [1], 2.0]
+    targets = [5, 3, 9, [1], 2]
+    assert linear_search_many(arr, targets) == [linear_search(arr, t) for t in targets] == [0, 1, -1, 3, 4]
+
+@pytest.mark.parametrize("func", [linear_search_many, binary_search_many,
+                                  interpolation_search_many, exponential_search_many])
+def test_bounded_batched_searches(func):
+    buf = memoryview(array("q", S))
+    assert func(buf, [23, 2, 91], 2, 8) == [5, -1, -1]
+    assert func(S, [91, 23], 6) == [9, -1]
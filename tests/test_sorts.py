@@ -1,10 +1,16 @@
 # tests/test_sorts.py
+import pytest
 from algorithms.sorts.bubble_sort import bubble_sort
 from algorithms.sorts.selection_sort import selection_sort
 from algorithms.sorts.insertion_sort import insertion_sort
 from algorithms.sorts.merge_sort import merge_sort
 from algorithms.sorts.quick_sort import quick_sort
 from algorithms.sorts.heap_sort import heap_sort
+from algorithms.sorts.hybrid_sort import intro_sort, hybrid_merge_sort
+from algorithms.sorts.external_sort import external_sort
+from algorithms.sorts.parallel_sort import parallel_sort
+from algorithms.sorts.partial_sort import top_k, nth_element, median, StreamingTopK
+from algorithms.sorts.numeric_sort import as_typed_array, counting_sort, numeric_sort
 
 A = [5,2,9,1,5,6]
 SORTED = [1,2,5,5,6,9]
@@ -26,3 +32,75 @@ def test_quick():
 
 def test_heap():
     assert heap_sort(A) == SORTED
+
+def test_intro():
+    assert intro_sort(A) == SORTED
+    # adversarial inputs for naive quicksort
+    big = list(range(500, 0, -1)) + [7] * 200
+    assert intro_sort(big) == sorted(big)
+
+def test_hybrid_merge_is_stable():
+    pairs = [(k % 7, i) for i, k in enumerate(range(200, 0, -1))]
+
+    class Key:
+        def __init__(self, pair):
+            self.pair = pair
+        def __lt__(self, other):
+            return self.pair[0] < other.pair[0]
+        def __gt__(self, other):
+            return self.pair[0] > other.pair[0]
+
+    result = [k.pair for k in hybrid_merge_sort([Key(p) for p in pairs])]
+    assert result == sorted(pairs, key=lambda p: p[0])
+    assert hybrid_merge_sort(A) == SORTED
+
+def test_numeric():
+    assert numeric_sort(A) == SORTED
+    assert numeric_sort([2.5, -1, 3]) == [-1, 2.5, 3]
+    assert numeric_sort(["b", "a"]) == ["a", "b"]
+    assert numeric_sort([2 ** 70, 1]) == [1, 2 ** 70]
+
+def test_typed_detection():
+    assert as_typed_array([1, 2]).typecode == "q"
+    assert as_typed_array([1, 2.0]).typecode == "d"
+    assert as_typed_array([True, 2]) is None
+    assert list(counting_sort(as_typed_array([3, -1, 3, 0]))) == [-1, 0, 3, 3]
+
+def test_external_sort_spills_runs():
+    data = [(i * 7919) % 10007 - 5000 for i in range(20000)]
+    # 1024-element runs, so 20 spilled files get merged
+    assert list(external_sort(iter(data), max_memory=64 * 1024)) == sorted(data)
+    # at most 3 runs per merge: two levels of intermediate merges
+    assert list(external_sort(iter(data), max_memory=64 * 1024, max_fan_in=3)) == sorted(data)
+    with pytest.raises(ValueError):
+        list(external_sort(iter(data), max_memory=1))
+    assert list(external_sort([1.5, 2, -3])) == [-3.0, 1.5, 2.0]
+    assert list(external_sort([])) == []
+
+def test_parallel_sort():
+    data = [(i * 7919) % 1009 - 500.5 for i in range(1000)]
+    assert parallel_sort(data, workers=3, threshold=10) == sorted(data)
+    ints = [(i * 7919) % 1009 - 500 for i in range(1000)] + [7] * 300
+    result = parallel_sort(ints, workers=3, threshold=10)
+    assert result == sorted(ints) and all(type(v) is int for v in result)
+    mixed = [3, 1.5, -2] * 10
+    assert [type(v) for v in parallel_sort(mixed, workers=3, threshold=10)] == [type(v) for v in sorted(mixed)]
+    assert parallel_sort(A, workers=3) == SORTED  # below threshold: in-process
+
+def test_top_k():
+    assert top_k(A, 3) == [1, 2, 5]
+    assert top_k(A, 2, largest=True) == [9, 6]
+    stream = StreamingTopK(2, largest=True)
+    for chunk in ([5, 2], [9], [1, 5, 6]):
+        stream.push(chunk)
+    assert stream.result() == [9, 6]
+
+def test_nth_element_and_median():
+    data = [(i * 7919) % 1009 for i in range(501)]
+    ordered = sorted(data)
+    for n in (0, 17, 250, 500):
+        assert nth_element(data, n) == ordered[n]
+    assert median(data) == ordered[250]
+    assert median(A) == 5
+    assert median([4, 1, 3, 2]) == 2.5
+    assert median(["b", "d", "a", "c"]) == "b"
@@ -1,7 +1,13 @@
 # tests/test_strings.py
+import pytest
+
 from algorithms.strings.naive_search import naive_search
-from algorithms.strings.kmp_search import kmp_search
-from algorithms.strings.rabin_karp import rabin_karp
+from algorithms.strings.kmp_search import kmp_search, compile_kmp, kmp_search_all
+from algorithms.strings.rabin_karp import rabin_karp, compile_rabin_karp, rabin_karp_all
+from algorithms.strings.bmh_search import bmh_search, two_way_search, native_search
+from algorithms.strings.aho_corasick import AhoCorasick
+from algorithms.strings.suffix_array import SuffixIndex, build_suffix_array, open_index
+from service.corpora import CorpusStore, CorpusTooLarge, index_size
 
 TEXT = "the quick brown fox jumps over the lazy dog"
 PAT = "jumps"
@@ -14,3 +20,69 @@ def test_kmp():
 
 def test_rabin():
     assert rabin_karp(TEXT, PAT) == TEXT.index(PAT)
+
+def test_bmh_two_way_native():
+    for text, pat in ((TEXT, PAT), (TEXT, "cat"), ("aaaaaaab", "aab"), ("abababac", "ababac")):
+        assert bmh_search(text, pat) == two_way_search(text, pat) == text.find(pat)
+        data = text.encode()
+        assert bmh_search(data, pat.encode()) == native_search(memoryview(data), pat.encode()) == text.find(pat)
+
+def test_compiled_patterns():
+    assert kmp_search(TEXT, "lazy", compile_kmp("lazy")) == TEXT.index("lazy")
+    assert rabin_karp(TEXT, "lazy", compiled=compile_rabin_karp("lazy")) == TEXT.index("lazy")
+    # same-length patterns that collide under the old base 256 / mod 101 hash
+    for p, q in (("\x00\u0100", "\x01\x00"), ("a", "\xc6")):
+        assert compile_rabin_karp(p, 256, 101)[0] == compile_rabin_karp(q, 256, 101)[0]
+        assert compile_rabin_karp(p)[0] != compile_rabin_karp(q)[0]
+    assert rabin_karp("x\x01\x00\u0100", "\u0100") == 3
+
+def test_all_occurrences_across_chunks():
+    text = "abababa " * 3
+    expected = [i for i in range(len(text)) if text.startswith("aba", i)]
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    assert list(kmp_search_all(chunks, "aba")) == expected
+    assert list(rabin_karp_all(chunks, "aba")) == expected
+    byte_chunks = [c.encode() for c in chunks]
+    assert list(rabin_karp_all(byte_chunks, b"aba")) == list(kmp_search_all(byte_chunks, b"aba")) == expected
+
+def test_aho_corasick_finds_all_overlapping():
+    ac = AhoCorasick(["he", "she", "his", "hers", "the", "he"])
+    assert ac.search("ushers and the hens") == {
+        "he": [2, 12, 15], "she": [1], "his": [], "hers": [2], "the": [11]
+    }
+    assert AhoCorasick(["o"]).search(TEXT) == {"o": [i for i, c in enumerate(TEXT) if c == "o"]}
+
+def test_suffix_array_queries_and_mmap_round_trip(tmp_path):
+    text = TEXT.encode()
+    assert list(build_suffix_array(b"banana")) == [5, 3, 1, 0, 4, 2]
+    # zero bytes tie with the zero padding of short suffixes
+    for s in (b"a\0a\0\0", b"\0\0\0", b"ab\0\0\0\0\0\0\0\0\0ab"):
+        assert list(build_suffix_array(s)) == sorted(range(len(s)), key=lambda i: s[i:])
+    index = SuffixIndex.build(text)
+    path = str(tmp_path / "corpus.sa")
+    index.save(path)
+    loaded = open_index(path)
+    try:
+        for idx in (index, loaded):
+            assert idx.count(b"the") == 2
+            assert idx.locate(b"o") == [i for i, c in enumerate(TEXT) if c == "o"]
+            assert idx.first(b"lazy") == TEXT.index("lazy") and idx.first(b"cat") == -1
+            start, length = idx.longest_repeat()
+            assert length == 4 and TEXT.count(TEXT[start:start + length]) == 2
+    finally:
+        loaded.close()
+
+def test_corpus_store_limits_and_private_directory(tmp_path):
+    store = CorpusStore(str(tmp_path / "corpora"), max_bytes=100, disk_bytes=2 * index_size(60))
+    assert (tmp_path / "corpora").stat().st_mode & 0o777 == 0o700
+    with pytest.raises(CorpusTooLarge):
+        store.put(b"x" * 101)
+    store.put(b"x" * 60, "one")
+    store.put(b"y" * 60, "two")
+    with pytest.raises(CorpusTooLarge):
+        store.put(b"z" * 10, "three")
+    # replacing a corpus only needs room for the difference
+    assert store.put(b"z" * 50, "two")[1].version == 2
+    (tmp_path / "link").symlink_to(tmp_path / "corpora")
+    with pytest.raises(PermissionError):
+        CorpusStore(str(tmp_path / "link"))